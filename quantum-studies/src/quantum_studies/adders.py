@@ -0,0 +1,232 @@
+"""Reversible Adders - n-bit ripple-carry and Cuccaro adder circuits with exhaustive classical checks.
+
+Both generators return an ``Adder`` that records where the operands, the sum and
+the ancillas live, so the same circuit can be run on hardware (with the inputs
+prepared by X gates and the sum measured as an integer) or verified classically
+with ``ReversibleSimulator`` over every input pair.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+import numpy as np
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from quantum_studies.reversible import ReversibleSimulator, ints_to_states
+from quantum_studies.shot_data import WORD_BITS, extract_bits
+
+# Bit-sliced lane patterns: bit k of COUNTER_PATTERNS[i] is bit i of k, for k < 64
+COUNTER_PATTERNS = [
+    np.uint64(sum(1 << k for k in range(WORD_BITS) if (k >> i) & 1))
+    for i in range(WORD_BITS.bit_length() - 1)
+]
+
+
+@dataclass
+class Adder:
+    """An adder circuit and the qubit indices of its operands, outputs and ancillas."""
+    circuit: QuantumCircuit
+    num_bits: int
+    a: List[int]
+    b: List[int]
+    sum: List[int]
+    preserved: List[int]
+    clean: List[int]
+
+
+def _prepare_inputs(qc: QuantumCircuit, register: QuantumRegister, value: Optional[int], num_bits: int) -> None:
+    """Flip the qubits of a register that are set in ``value``."""
+    if value is None:
+        return
+    if not 0 <= value < (1 << num_bits):
+        raise ValueError(f"Input {value} does not fit in {num_bits} bits")
+    for bit in range(num_bits):
+        if (value >> bit) & 1:
+            qc.x(register[bit])
+
+
+def _measure_sum(qc: QuantumCircuit, sum_qubits: Sequence) -> None:
+    """Measure the sum qubits (LSB first) so the counts key is the sum as a binary integer."""
+    result = ClassicalRegister(len(sum_qubits), 'sum')
+    qc.add_register(result)
+    qc.measure(list(sum_qubits), result)
+
+
+def _adder(qc: QuantumCircuit, num_bits: int, a: QuantumRegister, b: QuantumRegister,
+           sum_qubits: Sequence, preserved: Sequence, clean: Sequence) -> Adder:
+    index = lambda qubits: [qc.find_bit(qubit).index for qubit in qubits]
+    return Adder(qc, num_bits, index(a), index(b), index(sum_qubits), index(preserved), index(clean))
+
+
+def ripple_carry_adder(num_bits: int, a: Optional[int] = None, b: Optional[int] = None, measure: bool = False) -> Adder:
+    """
+    Create an n-bit ripple-carry adder that writes a + b into fresh sum and carry qubits.
+
+    Every full adder computes s_i = a_i ⊕ b_i ⊕ c_i with three CNOTs and
+    c_{i+1} = maj(a_i, b_i, c_i) with three Toffolis, as in the original 2-bit
+    example. It uses 4n + 1 qubits and leaves the intermediate carries dirty.
+
+    Args:
+        num_bits: Width n of both operands
+        a: Value of the first operand (if None, the register is left in |0...0>)
+        b: Value of the second operand (if None, the register is left in |0...0>)
+        measure: Whether to measure the n + 1 sum bits into a 'sum' register
+
+    Returns:
+        The adder; its sum qubits are s_0 ... s_{n-1}, c_n
+    """
+    qa = QuantumRegister(num_bits, 'a')
+    qb = QuantumRegister(num_bits, 'b')
+    carry = QuantumRegister(num_bits + 1, 'c')
+    total = QuantumRegister(num_bits, 's')
+    qc = QuantumCircuit(qa, qb, carry, total)
+    _prepare_inputs(qc, qa, a, num_bits)
+    _prepare_inputs(qc, qb, b, num_bits)
+
+    for i in range(num_bits):
+        qc.cx(qa[i], total[i])
+        qc.cx(qb[i], total[i])
+        qc.cx(carry[i], total[i])
+        qc.ccx(qa[i], qb[i], carry[i + 1])
+        qc.ccx(qa[i], carry[i], carry[i + 1])
+        qc.ccx(qb[i], carry[i], carry[i + 1])
+
+    sum_qubits = list(total) + [carry[num_bits]]
+    if measure:
+        _measure_sum(qc, sum_qubits)
+    return _adder(qc, num_bits, qa, qb, sum_qubits, list(qa) + list(qb), [carry[0]])
+
+
+def cuccaro_adder(num_bits: int, a: Optional[int] = None, b: Optional[int] = None, measure: bool = False) -> Adder:
+    """
+    Create an n-bit in-place Cuccaro adder (b <- a + b) with a single ancilla.
+
+    A ladder of MAJ blocks ripples the carry up through the a register, the
+    carry-out is copied to a dedicated qubit, and UMA blocks walk back down,
+    restoring a and the ancilla while writing the sum into b. It uses 2n + 2
+    qubits and 2n Toffolis.
+
+    Args:
+        num_bits: Width n of both operands
+        a: Value of the first operand (if None, the register is left in |0...0>)
+        b: Value of the second operand (if None, the register is left in |0...0>)
+        measure: Whether to measure the n + 1 sum bits into a 'sum' register
+
+    Returns:
+        The adder; its sum qubits are b_0 ... b_{n-1}, carry-out
+    """
+    ancilla = QuantumRegister(1, 'cin')
+    qa = QuantumRegister(num_bits, 'a')
+    qb = QuantumRegister(num_bits, 'b')
+    carry_out = QuantumRegister(1, 'cout')
+    qc = QuantumCircuit(ancilla, qa, qb, carry_out)
+    _prepare_inputs(qc, qa, a, num_bits)
+    _prepare_inputs(qc, qb, b, num_bits)
+
+    def maj(c, y, x):
+        qc.cx(x, y)
+        qc.cx(x, c)
+        qc.ccx(c, y, x)
+
+    def uma(c, y, x):
+        qc.ccx(c, y, x)
+        qc.cx(x, c)
+        qc.cx(c, y)
+
+    carries = [ancilla[0]] + list(qa)
+    for i in range(num_bits):
+        maj(carries[i], qb[i], qa[i])
+    qc.cx(qa[num_bits - 1], carry_out[0])
+    for i in reversed(range(num_bits)):
+        uma(carries[i], qb[i], qa[i])
+
+    sum_qubits = list(qb) + [carry_out[0]]
+    if measure:
+        _measure_sum(qc, sum_qubits)
+    return _adder(qc, num_bits, qa, qb, sum_qubits, list(qa), [ancilla[0]])
+
+
+def evaluate_adder(adder: Adder, a_values: Sequence[int], b_values: Sequence[int]) -> np.ndarray:
+    """
+    Run an adder classically on many input pairs.
+
+    Args:
+        adder: Adder built without input values
+        a_values: First operands
+        b_values: Second operands, same length as ``a_values``
+
+    Returns:
+        Array of sums with dtype uint64
+    """
+    values = []
+    for a, b in zip(a_values, b_values):
+        state = 0
+        for bit in range(adder.num_bits):
+            state |= ((a >> bit) & 1) << adder.a[bit]
+            state |= ((b >> bit) & 1) << adder.b[bit]
+        values.append(state)
+    outputs = ReversibleSimulator(adder.circuit).run(ints_to_states(values, adder.circuit.num_qubits))
+    bits = extract_bits(outputs, adder.sum).astype(np.uint64)
+    return bits @ (np.uint64(1) << np.arange(len(adder.sum), dtype=np.uint64))
+
+
+def _counter_planes(first_word: int, num_lane_words: int, num_bits: int) -> np.ndarray:
+    """Bit-sliced planes of the lane numbers 64 * first_word ... 64 * (first_word + num_lane_words) - 1."""
+    words = np.arange(first_word, first_word + num_lane_words, dtype=np.uint64)
+    ones = np.uint64(0xFFFFFFFFFFFFFFFF)
+    planes = np.empty((num_bits, num_lane_words), dtype=np.uint64)
+    for bit in range(num_bits):
+        if bit < len(COUNTER_PATTERNS):
+            planes[bit] = COUNTER_PATTERNS[bit]
+        else:
+            high = (words >> np.uint64(bit - len(COUNTER_PATTERNS))) & np.uint64(1)
+            planes[bit] = np.where(high == 1, ones, np.uint64(0))
+    return planes
+
+
+def verify_adder(adder: Adder, chunk_bits: int = 20) -> int:
+    """
+    Check an adder on every pair of n-bit inputs.
+
+    The 2^(2n) input pairs are simulated in bit-sliced chunks of 2^chunk_bits
+    lanes and compared with a reference addition on the same bit planes. Besides
+    the sum, the preserved operands must come back unchanged and the clean
+    ancillas must return to 0. An n = 16 adder (2^32 pairs) takes about half a
+    minute on one core, with memory bounded by the chunk size.
+
+    Args:
+        adder: Adder built without input values
+        chunk_bits: log2 of the number of input pairs simulated at once
+
+    Returns:
+        Number of input pairs with a wrong result
+    """
+    n = adder.num_bits
+    simulator = ReversibleSimulator(adder.circuit)
+    lane_words = max(1, (1 << min(chunk_bits, 2 * n)) // WORD_BITS)
+    total_words = max(1, (1 << (2 * n)) // WORD_BITS)
+    failures = 0
+
+    for first_word in range(0, total_words, lane_words):
+        lanes = _counter_planes(first_word, lane_words, 2 * n)
+        planes = np.zeros((adder.circuit.num_qubits, lane_words), dtype=np.uint64)
+        planes[adder.a] = lanes[:n]
+        planes[adder.b] = lanes[n:]
+        outputs = simulator.run_planes(planes)
+
+        carry = np.zeros(lane_words, dtype=np.uint64)
+        mismatch = np.zeros(lane_words, dtype=np.uint64)
+        for bit in range(n):
+            a, b = lanes[bit], lanes[n + bit]
+            mismatch |= outputs[adder.sum[bit]] ^ a ^ b ^ carry
+            carry = (a & b) | (carry & (a ^ b))
+        mismatch |= outputs[adder.sum[n]] ^ carry
+        for qubit in adder.preserved:
+            mismatch |= outputs[qubit] ^ planes[qubit]
+        for qubit in adder.clean:
+            mismatch |= outputs[qubit]
+
+        if mismatch.any():
+            failures += int(np.bitwise_count(mismatch).sum())
+    if 2 * n < 6:
+        # Fewer pairs than lanes in one word: the extra lanes repeat the real ones
+        failures = failures * (1 << (2 * n)) // WORD_BITS
+    return failures
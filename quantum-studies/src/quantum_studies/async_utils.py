@@ -0,0 +1,29 @@
+"""Async Utilities - Run coroutines from blocking code, including inside notebooks."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar('T')
+
+
+def run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion and return its result.
+
+    ``asyncio.run`` raises inside an already running event loop, as in every
+    Jupyter notebook. There the coroutine gets its own event loop on a worker
+    thread instead, and the caller blocks until it finishes.
+
+    Args:
+        coroutine: The coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
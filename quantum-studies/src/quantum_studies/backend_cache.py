@@ -0,0 +1,166 @@
+"""Backend Metadata Cache - TTL-based snapshots of backend configuration and status."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+class BackendMetadataCache:
+    """A cache of backend handles, configuration and status with per-field TTLs."""
+
+    def __init__(
+        self,
+        service: Any,
+        config_ttl: float = 3600.0,
+        status_ttl: float = 30.0,
+        backends_ttl: float = 300.0,
+        max_workers: int = 8,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the backend metadata cache.
+
+        Args:
+            service: Service exposing ``backends(...)`` and ``backend(name)``
+            config_ttl: Seconds configuration data (qubits, basis gates, coupling map) stays fresh
+            status_ttl: Seconds status data (operational flag, queue length) stays fresh
+            backends_ttl: Seconds a backend listing stays fresh
+            max_workers: Number of threads used to fetch statuses concurrently
+            clock: Source of the current time in seconds, used to age entries
+        """
+        self.service = service
+        self.ttls = {
+            'backend': config_ttl,
+            'configuration': config_ttl,
+            'status': status_ttl,
+            'backends': backends_ttl
+        }
+        self.max_workers = max_workers
+        self.clock = clock
+        self._entries: Dict[Tuple[str, Hashable], Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def backend(self, name: str) -> Any:
+        """
+        Get a backend handle by name.
+
+        Args:
+            name: Name of the backend
+
+        Returns:
+            The backend object
+        """
+        return self._cached('backend', name, lambda: self.service.backend(name))
+
+    def backends(self, min_qubits: int = 1, operational_only: bool = True) -> List:
+        """
+        List real (non-simulator) backends, reusing a recent listing when possible.
+
+        Args:
+            min_qubits: Minimum number of qubits required
+            operational_only: Only list operational backends
+
+        Returns:
+            List of backends
+        """
+        def fetch() -> List:
+            backends = self.service.backends(
+                simulator=False,
+                operational=operational_only,
+                min_num_qubits=min_qubits
+            )
+            with self._lock:
+                for backend in backends:
+                    self._entries[('backend', backend.name)] = (self.clock(), backend)
+            return backends
+
+        return list(self._cached('backends', (min_qubits, operational_only), fetch))
+
+    def configuration(self, backend: Any) -> Dict[str, Any]:
+        """
+        Get the static configuration of a backend.
+
+        Args:
+            backend: The backend object
+
+        Returns:
+            Dictionary with num_qubits, basis_gates, coupling_map, max_shots and max_experiments
+        """
+        def fetch() -> Dict[str, Any]:
+            config = backend.configuration()
+            return {
+                'num_qubits': backend.num_qubits,
+                'basis_gates': getattr(config, 'basis_gates', None),
+                'coupling_map': getattr(config, 'coupling_map', None),
+                'max_shots': getattr(config, 'max_shots', None),
+                'max_experiments': getattr(config, 'max_experiments', None)
+            }
+
+        return self._cached('configuration', backend.name, fetch)
+
+    def status(self, backend: Any) -> Dict[str, Any]:
+        """
+        Get a recent status snapshot of a backend.
+
+        Args:
+            backend: The backend object
+
+        Returns:
+            Dictionary with operational, status_msg and pending_jobs
+        """
+        def fetch() -> Dict[str, Any]:
+            status = backend.status()
+            return {
+                'operational': getattr(status, 'operational', None),
+                'status_msg': getattr(status, 'status_msg', None),
+                'pending_jobs': getattr(status, 'pending_jobs', None)
+            }
+
+        return self._cached('status', backend.name, fetch)
+
+    def statuses(self, backends: Sequence[Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get status snapshots for many backends, fetching the stale ones concurrently.
+
+        Args:
+            backends: Backend objects
+
+        Returns:
+            Dictionary mapping backend name to its status snapshot
+        """
+        if not backends:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(backends))) as pool:
+            snapshots = list(pool.map(self.status, backends))
+        return {backend.name: snapshot for backend, snapshot in zip(backends, snapshots)}
+
+    def refresh(self, backend_name: Optional[str] = None, field: Optional[str] = None) -> None:
+        """
+        Invalidate cached entries so the next access fetches them again.
+
+        Args:
+            backend_name: Only invalidate entries of this backend (if None, all backends)
+            field: Only invalidate this field ('backend', 'configuration', 'status'
+                or 'backends'; if None, all fields)
+        """
+        with self._lock:
+            for entry_field, key in list(self._entries):
+                if field is not None and entry_field != field:
+                    continue
+                if backend_name is not None and key != backend_name:
+                    continue
+                del self._entries[(entry_field, key)]
+
+    def _cached(self, field: str, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Return a fresh cached value, or fetch and store a new one."""
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get((field, key))
+        if entry is not None and now - entry[0] < self.ttls[field]:
+            return entry[1]
+
+        value = fetch()
+        with self._lock:
+            self._entries[(field, key)] = (self.clock(), value)
+        return value
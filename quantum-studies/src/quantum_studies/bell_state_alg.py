@@ -1,9 +1,12 @@
+import asyncio
 import logging
+import os
 import time
-from typing import Literal, Dict
+from typing import AsyncIterator, Literal, Dict, List, Optional, Sequence, Tuple
 from braket.circuits import Circuit
 from braket.devices import LocalSimulator
 from braket.aws import AwsDevice
+from quantum_studies.async_utils import run_sync
 
 
 logging.basicConfig(
@@ -12,6 +15,9 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
+FINAL_TASK_STATES = {"COMPLETED", "FAILED", "CANCELLED"}
+
+
 class QuantumExperiment:
     """Manages quantum circuit execution on Amazon Braket"""
 
@@ -70,6 +76,107 @@ class QuantumExperiment:
         logging.info(f"Measurement results: {counts}")
         return counts
 
+    def run_batch(self, circuits: Sequence[Circuit], max_parallel: Optional[int] = None) -> List[Dict[str, int]]:
+        """
+        Executes many circuits on the selected backend and returns their counts in input order.
+
+        On the local simulator the batch is spread over worker processes. On a QPU every
+        circuit is submitted as its own task and all tasks are polled from one event loop.
+
+        :param circuits: Circuits to execute.
+        :param max_parallel: Maximum number of circuits simulated or submitted at once
+            (defaults to the number of CPU cores locally and to all circuits on a QPU).
+        :return: Measurement counts of every circuit.
+        """
+        if isinstance(self.device, LocalSimulator):
+            return self._run_local_batch(circuits, max_parallel)
+        return run_sync(self._collect_batch(circuits, max_parallel))
+
+    def _run_local_batch(self, circuits: Sequence[Circuit], max_parallel: Optional[int]) -> List[Dict[str, int]]:
+        """Simulates a batch locally across worker processes."""
+        max_parallel = max_parallel or os.cpu_count() or 1
+        logging.info(f"Simulating {len(circuits)} circuits locally on up to {max_parallel} processes...")
+        batch = self.device.run_batch(list(circuits), shots=self.shots, max_parallel=max_parallel)
+        return [result.measurement_counts for result in batch.results()]
+
+    async def _collect_batch(self, circuits: Sequence[Circuit], max_parallel: Optional[int]) -> List[Dict[str, int]]:
+        """Gathers the counts of an asynchronous batch back into input order."""
+        counts: List[Optional[Dict[str, int]]] = [None] * len(circuits)
+        async for index, result in self.iter_batch(circuits, max_parallel=max_parallel):
+            counts[index] = result
+        return counts
+
+    async def iter_batch(
+        self,
+        circuits: Sequence[Circuit],
+        max_parallel: Optional[int] = None,
+        initial_interval: float = 1.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+    ) -> AsyncIterator[Tuple[int, Dict[str, int]]]:
+        """
+        Submits circuits as concurrent Braket tasks and yields their counts as they finish.
+
+        Task states are polled with an interval that starts at ``initial_interval`` and grows
+        by ``backoff`` up to ``max_interval``, so short tasks return quickly while long queues
+        are not hammered with requests. If a task fails or the iteration stops early, every
+        submitted task that has not finished yet is cancelled so it stops running (and billing).
+
+        :param circuits: Circuits to execute.
+        :param max_parallel: Maximum number of tasks in flight at once (defaults to all).
+        :param initial_interval: Seconds before the first state check of a task.
+        :param max_interval: Upper bound for the seconds between state checks.
+        :param backoff: Factor the polling interval grows by after each check.
+        :return: Async iterator of (circuit index, measurement counts) in completion order.
+        """
+        limit = asyncio.Semaphore(max_parallel or len(circuits) or 1)
+        # Submissions by circuit index, and the indices whose task reached a final state
+        submissions: Dict[int, asyncio.Future] = {}
+        finished: set = set()
+
+        async def run_one(index: int, circuit: Circuit) -> Tuple[int, Dict[str, int]]:
+            async with limit:
+                # Shielded so a cancelled poller still learns which task it submitted
+                submissions[index] = asyncio.ensure_future(asyncio.to_thread(self.device.run, circuit, shots=self.shots))
+                task = await asyncio.shield(submissions[index])
+                logging.info(f"Submitted circuit {index} as task {task.id}")
+                interval = initial_interval
+                while (state := await asyncio.to_thread(task.state)) not in FINAL_TASK_STATES:
+                    logging.info(f"Task {index} state: {state}... next check in {interval:.0f}s")
+                    await asyncio.sleep(interval)
+                    interval = min(interval * backoff, max_interval)
+                finished.add(index)
+                if state != "COMPLETED":
+                    raise RuntimeError(f"Task {task.id} for circuit {index} ended in state {state}")
+                result = await asyncio.to_thread(task.result)
+                return index, result.measurement_counts
+
+        pollers = [asyncio.ensure_future(run_one(i, circuit)) for i, circuit in enumerate(circuits)]
+        try:
+            for done in asyncio.as_completed(pollers):
+                yield await done
+        finally:
+            for poller in pollers:
+                poller.cancel()
+            await asyncio.gather(*pollers, return_exceptions=True)
+            await self._cancel_unfinished(submissions, finished)
+
+    @staticmethod
+    async def _cancel_unfinished(submissions: Dict[int, asyncio.Future], finished: set) -> None:
+        """Cancels every submitted task that has not reached a final state."""
+        for index, submission in submissions.items():
+            if index in finished:
+                continue
+            try:
+                task = await submission
+            except Exception:
+                continue  # The submission itself failed: nothing is running
+            try:
+                await asyncio.to_thread(task.cancel)
+                logging.info(f"Cancelled task {task.id} for circuit {index}")
+            except Exception as e:
+                logging.warning(f"Could not cancel the task for circuit {index}: {e}")
+
 
 if __name__ == "__main__":
     # SETTINGS: Change backend to "qpu" to use real quantum hardware
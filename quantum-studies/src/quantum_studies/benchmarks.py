@@ -0,0 +1,309 @@
+"""Runner Benchmarks - Offline performance measurements for IBMQuantumRunner.
+
+Everything runs against ``LocalRuntimeProvider``, so no IBM Quantum account or
+network access is needed. Run from the command line and fail the build when a
+measurement exceeds its budget:
+
+    python -m quantum_studies.benchmarks --budget transpile_cold_seconds=5 --json bench.json
+
+The ``import_heavy_modules`` measurement counts plotting and runtime packages
+loaded by a bare ``import quantum_studies.ibm_qpus``; budget it at 0 (together
+with ``import_seconds``) to keep worker start-up lean.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.primitives import BitArray
+from quantum_studies.counts_analysis import CountsBatch, population
+from quantum_studies.ibm_qpus import IBMQuantumRunner
+from quantum_studies.providers import LocalRuntimeProvider
+from quantum_studies.shot_data import ShotArray
+from quantum_studies.stabilizer import run_circuit
+from quantum_studies.transpile_cache import TranspileCache
+
+
+def _elapsed(function: Callable[[], object]) -> float:
+    """Wall-clock seconds taken by one call of ``function``."""
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def ghz_circuit(num_qubits: int) -> QuantumCircuit:
+    """Create an n-qubit GHZ circuit with final measurements."""
+    qc = QuantumCircuit(num_qubits)
+    qc.h(0)
+    for qubit in range(1, num_qubits):
+        qc.cx(qubit - 1, qubit)
+    qc.measure_all()
+    return qc
+
+
+def rotation_circuit() -> QuantumCircuit:
+    """Create a one-parameter Ry rotation followed by an entangler, for parameter sweeps."""
+    theta = Parameter('theta')
+    qc = QuantumCircuit(2)
+    qc.ry(theta, 0)
+    qc.cx(0, 1)
+    qc.measure_all()
+    return qc
+
+
+# Modules a headless submission worker must not load just by importing the runner
+HEAVY_MODULES = ('matplotlib', 'qiskit_ibm_runtime', 'qiskit_aer')
+
+_IMPORT_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(elapsed, len(heavy), ','.join(heavy))
+"""
+
+
+def benchmark_import(module: str = 'quantum_studies.ibm_qpus', repeat: int = 3) -> Dict[str, float]:
+    """
+    Time a cold import of a module in fresh interpreters.
+
+    Args:
+        module: Dotted name of the module to import
+        repeat: Number of fresh interpreters to start; the fastest import is reported
+
+    Returns:
+        Dictionary with the import seconds and the number of heavy modules it loaded
+    """
+    # The fresh interpreter sees the same import path as this one (e.g. an uninstalled src/)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    timings = []
+    heavy_loaded = 0
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', _IMPORT_PROBE.format(module=module, heavy=HEAVY_MODULES)],
+            capture_output=True, text=True, check=True, env=env
+        ).stdout.split()
+        timings.append(float(output[0]))
+        heavy_loaded = int(output[1])
+        if heavy_loaded:
+            print(f"Importing {module} loaded heavy modules: {output[2]}")
+    return {
+        'import_seconds': min(timings),
+        'import_heavy_modules': heavy_loaded
+    }
+
+
+def benchmark_transpile(runner: IBMQuantumRunner, circuits: Sequence[QuantumCircuit], optimization_level: int = 3) -> Dict[str, float]:
+    """
+    Time transpilation of a batch with a cold and with a warm transpile cache.
+
+    Args:
+        runner: Runner with a selected backend
+        circuits: Circuits to transpile
+        optimization_level: Transpilation optimization level (0-3)
+
+    Returns:
+        Dictionary with cold and cached transpile seconds
+    """
+    runner.transpile_cache.clear()
+    cold = _elapsed(lambda: runner._transpile(list(circuits), optimization_level))
+    cached = _elapsed(lambda: runner._transpile(list(circuits), optimization_level))
+    return {
+        'transpile_cold_seconds': cold,
+        'transpile_cached_seconds': cached
+    }
+
+
+def benchmark_submission(runner: IBMQuantumRunner, circuits: Sequence[QuantumCircuit], shots: int = 256) -> Dict[str, float]:
+    """
+    Time batched submission and end-to-end execution of a batch of circuits.
+
+    Args:
+        runner: Runner with a selected backend
+        circuits: Circuits to run
+        shots: Shots per circuit
+
+    Returns:
+        Dictionary with submission time, end-to-end time and circuits per second
+    """
+    start = time.perf_counter()
+    handles = runner.submit_circuits(list(circuits), shots=shots)
+    submitted = time.perf_counter() - start
+    for handle in handles:
+        handle.job.result()
+    total = time.perf_counter() - start
+    return {
+        'submit_seconds': submitted,
+        'run_seconds': total,
+        'circuits_per_second': len(circuits) / total if total else float('inf')
+    }
+
+
+def benchmark_result_processing(
+    num_histograms: int = 200,
+    num_shots: int = 4096,
+    num_bits: int = 16,
+    seed: int = 1234
+) -> Dict[str, float]:
+    """
+    Time GHZ-population post-processing of sampler output with string dicts versus bit-packed arrays.
+
+    Both paths start from the ``BitArray`` a sampler returns: one goes through
+    ``get_counts()`` and a Python loop per histogram, the other through ``ShotArray``
+    and a single batched estimator.
+
+    Args:
+        num_histograms: Number of sampler outputs to process
+        num_shots: Shots per sampler output
+        num_bits: Register width
+        seed: Seed of the random number generator
+
+    Returns:
+        Dictionary with seconds for the dict-based and array-based paths
+    """
+    rng = np.random.default_rng(seed)
+    bit_arrays = [
+        BitArray.from_bool_array(rng.random((num_shots, num_bits)) < 0.5)
+        for _ in range(num_histograms)
+    ]
+    targets = ['0' * num_bits, '1' * num_bits]
+
+    def dict_path() -> List[float]:
+        fidelities = []
+        for bit_array in bit_arrays:
+            counts = bit_array.get_counts()
+            total = sum(counts.values())
+            fidelities.append(sum(counts.get(target, 0) for target in targets) / total)
+        return fidelities
+
+    def array_path() -> np.ndarray:
+        batch = CountsBatch.from_counts([ShotArray.from_bit_array(bit_array) for bit_array in bit_arrays])
+        return population(batch, targets)
+
+    return {
+        'processing_dict_seconds': _elapsed(dict_path),
+        'processing_array_seconds': _elapsed(array_path)
+    }
+
+
+def benchmark_stabilizer(num_qubits: int = 1000, shots: int = 1024, seed: int = 1234) -> Dict[str, float]:
+    """
+    Time GHZ preparation and sampling on the stabilizer simulator, far beyond statevector sizes.
+
+    Args:
+        num_qubits: Number of GHZ qubits
+        shots: Number of shots
+        seed: Seed of the random number generator
+
+    Returns:
+        Dictionary with the simulation seconds and the GHZ population (1 for a noiseless run)
+    """
+    circuit = ghz_circuit(num_qubits)
+    start = time.perf_counter()
+    shots_data = run_circuit(circuit, shots=shots, seed=seed)
+    elapsed = time.perf_counter() - start
+    batch = CountsBatch.from_counts([shots_data])
+    return {
+        'stabilizer_ghz_seconds': elapsed,
+        'stabilizer_ghz_population': float(population(batch, ['0' * num_qubits, '1' * num_qubits])[0])
+    }
+
+
+def run_benchmarks(
+    num_circuits: int = 50,
+    shots: int = 256,
+    queue_latency: float = 0.0,
+    optimization_level: int = 3
+) -> Dict[str, float]:
+    """
+    Run every benchmark against the local provider.
+
+    Args:
+        num_circuits: Number of circuits in the submitted batch
+        shots: Shots per circuit
+        queue_latency: Simulated queue seconds per job
+        optimization_level: Transpilation optimization level (0-3)
+
+    Returns:
+        Dictionary mapping measurement name to its value
+    """
+    provider = LocalRuntimeProvider(queue_latency=queue_latency)
+    runner = IBMQuantumRunner(provider=provider, transpile_cache=TranspileCache())
+    runner.select_backend(provider.backends()[0].name)
+
+    sweep = rotation_circuit()
+    circuits = [ghz_circuit(2 + index % 4) for index in range(num_circuits // 2)]
+    circuits += [sweep.assign_parameters([angle]) for angle in np.linspace(0, np.pi, num_circuits - len(circuits))]
+
+    results: Dict[str, float] = {}
+    results.update(benchmark_import())
+    results.update(benchmark_transpile(runner, circuits, optimization_level))
+    results.update(benchmark_submission(runner, circuits, shots))
+    results.update(benchmark_result_processing())
+    results.update(benchmark_stabilizer())
+    return results
+
+
+def check_budgets(results: Dict[str, float], budgets: Dict[str, float]) -> List[str]:
+    """
+    Compare measurements against upper bounds.
+
+    Args:
+        results: Measurements from ``run_benchmarks``
+        budgets: Dictionary mapping measurement name to its maximum allowed value
+
+    Returns:
+        Descriptions of every exceeded budget
+    """
+    failures = []
+    for name, limit in budgets.items():
+        if name not in results:
+            failures.append(f"{name}: no such measurement")
+        elif results[name] > limit:
+            failures.append(f"{name}: {results[name]:.4f} > {limit:.4f}")
+    return failures
+
+
+def _parse_budget(text: str) -> tuple:
+    name, _, value = text.partition('=')
+    return name, float(value)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline performance benchmarks for IBMQuantumRunner")
+    parser.add_argument('--circuits', type=int, default=50, help="Number of circuits in the submitted batch")
+    parser.add_argument('--shots', type=int, default=256, help="Shots per circuit")
+    parser.add_argument('--queue-latency', type=float, default=0.0, help="Simulated queue seconds per job")
+    parser.add_argument('--optimization-level', type=int, default=3, help="Transpilation optimization level")
+    parser.add_argument('--budget', type=_parse_budget, action='append', default=[],
+                        metavar='NAME=MAX', help="Fail when a measurement exceeds MAX")
+    parser.add_argument('--json', help="Write the measurements to this file")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.circuits, args.shots, args.queue_latency, args.optimization_level)
+
+    print(f"\n{'='*50}")
+    print("BENCHMARK RESULTS")
+    print(f"{'='*50}")
+    for name, value in results.items():
+        print(f"{name}: {value:.4f}")
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump(results, file, indent=2)
+
+    failures = check_budgets(results, dict(args.budget))
+    for failure in failures:
+        print(f"Budget exceeded - {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
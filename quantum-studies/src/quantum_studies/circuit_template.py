@@ -0,0 +1,138 @@
+"""Circuit Template - Transpile a parameterized circuit once, then bind many parameter arrays.
+
+A ``CompiledTemplate`` transpiles its circuit for a backend a single time
+(through a ``TranspileCache``, so rebuilding the same circuit is free too) and
+turns NumPy parameter arrays of any shape into Sampler PUBs against the
+transpiled circuit. A 10^4-point sweep is then one PUB with a (10^4, P) value
+array instead of 10^4 rebuild-transpile-submit round trips.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter, ParameterVector
+from quantum_studies.transpile_cache import TranspileCache
+
+ValuesLike = Union[np.ndarray, Mapping[Union[str, Parameter, ParameterVector], Any]]
+
+
+class CompiledTemplate:
+    """A parameterized circuit transpiled once for a backend, bound to parameter arrays on demand."""
+
+    def __init__(
+        self,
+        circuit: QuantumCircuit,
+        backend: Any = None,
+        optimization_level: int = 1,
+        transpile_cache: Optional[TranspileCache] = None
+    ):
+        """
+        Transpile the template.
+
+        Args:
+            circuit: Parameterized circuit (with measurements, for sampling)
+            backend: Backend to compile for (if None, the circuit is used as written)
+            optimization_level: Transpilation optimization level (0-3)
+            transpile_cache: Cache of compiled circuits (if None, a private in-memory cache)
+        """
+        self.circuit = circuit
+        self.backend = backend
+        self.optimization_level = optimization_level
+        self.transpile_cache = transpile_cache or TranspileCache()
+        if backend is None:
+            self.compiled = circuit
+        else:
+            self.compiled = self.transpile_cache.transpile([circuit], backend, optimization_level)[0]
+        self.parameter_names = [parameter.name for parameter in circuit.parameters]
+        compiled_names = [parameter.name for parameter in self.compiled.parameters]
+        # Column of every compiled-circuit parameter in arrays ordered like circuit.parameters
+        self._columns = np.array([self.parameter_names.index(name) for name in compiled_names], dtype=np.int64)
+
+    @property
+    def num_parameters(self) -> int:
+        return len(self.parameter_names)
+
+    def values(self, values: ValuesLike) -> np.ndarray:
+        """
+        Normalize parameter values into the array layout of the compiled circuit.
+
+        Args:
+            values: Array of shape (..., num_parameters) ordered like ``circuit.parameters``,
+                or a mapping from parameters, parameter vectors or names to arrays
+                (a vector's values carry a trailing axis of its length); mapped
+                arrays are broadcast against each other
+
+        Returns:
+            Array of shape (..., num_compiled_parameters)
+        """
+        if isinstance(values, Mapping):
+            columns: Dict[str, np.ndarray] = {}
+            for key, value in values.items():
+                value = np.asarray(value, dtype=float)
+                if isinstance(key, ParameterVector):
+                    for index, parameter in enumerate(key):
+                        columns[parameter.name] = value[..., index]
+                else:
+                    columns[key.name if isinstance(key, Parameter) else str(key)] = value
+            missing = [name for name in self.parameter_names if name not in columns]
+            unknown = [name for name in columns if name not in self.parameter_names]
+            if missing or unknown:
+                raise ValueError(f"Values must give every circuit parameter exactly once (missing: {missing}, unknown: {unknown})")
+            arrays = np.broadcast_arrays(*(columns[name] for name in self.parameter_names))
+            values = np.stack(arrays, axis=-1) if arrays else np.zeros((0,))
+        values = np.asarray(values, dtype=float)
+        if values.ndim == 0 or values.shape[-1] != self.num_parameters:
+            raise ValueError(f"Expected a trailing axis of {self.num_parameters} parameter values, got shape {values.shape}")
+        return values[..., self._columns]
+
+    def pub(self, values: ValuesLike, shots: Optional[int] = None) -> Tuple:
+        """
+        Build a single Sampler PUB over every row of a parameter array.
+
+        Args:
+            values: Parameter values (see ``values``)
+            shots: Shots per parameter set (if None, the sampler default)
+
+        Returns:
+            PUB tuple ``(compiled, values)`` or ``(compiled, values, shots)``
+        """
+        bound = self.values(values)
+        return (self.compiled, bound) if shots is None else (self.compiled, bound, shots)
+
+    def bind(self, values: ValuesLike) -> List[QuantumCircuit]:
+        """
+        Bind parameter sets into copies of the compiled circuit, without transpiling again.
+
+        Args:
+            values: Parameter values (see ``values``)
+
+        Returns:
+            One bound circuit per parameter set, in row-major order
+        """
+        bound = self.values(values).reshape(-1, len(self._columns))
+        parameters = list(self.compiled.parameters)
+        return [self.compiled.assign_parameters(dict(zip(parameters, row))) for row in bound]
+
+    def run(self, values: ValuesLike, sampler: Any = None, shots: Optional[int] = None) -> Any:
+        """
+        Sample every parameter set in one PUB.
+
+        Args:
+            values: Parameter values (see ``values``)
+            sampler: SamplerV2-compatible primitive (if None, ``SamplerV2`` on the backend,
+                or a ``StatevectorSampler`` without one)
+            shots: Shots per parameter set
+
+        Returns:
+            The PUB result; its data has the leading shape of the value array
+        """
+        if sampler is None:
+            if self.backend is None:
+                from qiskit.primitives import StatevectorSampler
+
+                sampler = StatevectorSampler()
+            else:
+                from qiskit_ibm_runtime import SamplerV2
+
+                sampler = SamplerV2(self.backend)
+        return sampler.run([self.pub(values)], shots=shots).result()[0]
@@ -0,0 +1,267 @@
+"""Counts Analysis - Vectorized estimators over batches of measurement histograms.
+
+Every estimator here is linear in the counts: it assigns a weight to each
+outcome and averages the weights over the shots. A whole batch of histograms
+is stored as one stacked sparse table, so an estimator over thousands of
+histograms is a handful of NumPy operations instead of a Python loop per
+bitstring.
+"""
+
+from typing import Dict, List, Optional, Sequence, Union
+import numpy as np
+from quantum_studies.shot_data import (
+    ShotArray,
+    SparseCounts,
+    as_sparse_counts,
+    num_words,
+    pack_bitstrings,
+    unique_rows,
+)
+
+CountsLike = Union[Dict[str, int], SparseCounts, ShotArray]
+
+
+class CountsBatch:
+    """Many histograms over the same register, stacked into one sparse table."""
+
+    def __init__(self, outcomes: np.ndarray, counts: np.ndarray, histogram: np.ndarray, num_histograms: int, num_bits: int):
+        """
+        Initialize a counts batch.
+
+        Args:
+            outcomes: Array of shape (k, num_words) with dtype uint64, grouped by histogram
+            counts: Array of shape (k,) with the shots of every row
+            histogram: Array of shape (k,) with the histogram index of every row (non-decreasing)
+            num_histograms: Number of histograms in the batch
+            num_bits: Register width
+        """
+        self.outcomes = np.asarray(outcomes, dtype=np.uint64)
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.histogram = np.asarray(histogram, dtype=np.int64)
+        self.num_histograms = num_histograms
+        self.num_bits = num_bits
+
+    @classmethod
+    def from_counts(cls, histograms: Sequence[CountsLike], num_bits: Optional[int] = None) -> "CountsBatch":
+        """
+        Stack counts dictionaries, sparse counts or shot arrays into a batch.
+
+        Args:
+            histograms: The histograms to stack
+            num_bits: Register width (if None, the widest histogram's width)
+
+        Returns:
+            Counts batch
+        """
+        sparse = [as_sparse_counts(histogram) for histogram in histograms]
+        if num_bits is None:
+            num_bits = max((counts.num_bits for counts in sparse), default=0)
+        width = num_words(num_bits)
+
+        outcomes = np.zeros((sum(len(counts) for counts in sparse), width), dtype=np.uint64)
+        position = 0
+        for counts in sparse:
+            outcomes[position:position + len(counts), :counts.outcomes.shape[1]] = counts.outcomes[:, :width]
+            position += len(counts)
+
+        counts = np.concatenate([c.counts for c in sparse]) if sparse else np.zeros(0, dtype=np.int64)
+        histogram = np.repeat(np.arange(len(sparse)), [len(c) for c in sparse])
+        return cls(outcomes, counts, histogram, len(sparse), num_bits)
+
+    @property
+    def shots(self) -> np.ndarray:
+        """Total shots of every histogram, shape (num_histograms,)."""
+        return np.bincount(self.histogram, weights=self.counts, minlength=self.num_histograms)
+
+    def __len__(self) -> int:
+        return self.num_histograms
+
+
+def _as_batch(batch: Union[CountsBatch, Sequence[CountsLike]]) -> CountsBatch:
+    return batch if isinstance(batch, CountsBatch) else CountsBatch.from_counts(batch)
+
+
+def _z_mask(indices: Sequence[int], width: int) -> np.ndarray:
+    """uint64 word mask selecting the given classical bits."""
+    mask = np.zeros(width, dtype=np.uint64)
+    for index in indices:
+        word, offset = divmod(index, 64)
+        mask[word] |= np.uint64(1) << np.uint64(offset)
+    return mask
+
+
+def expectation(batch: Union[CountsBatch, Sequence[CountsLike]], weights: np.ndarray) -> np.ndarray:
+    """
+    Shot-average of per-outcome weights for every histogram.
+
+    Args:
+        batch: Counts batch (or histograms to stack)
+        weights: Array of shape (k,) or (m, k) with the weight of every stored row
+
+    Returns:
+        Array of shape (num_histograms,) or (m, num_histograms)
+    """
+    batch = _as_batch(batch)
+    weights = np.asarray(weights, dtype=float)
+    shots = batch.shots
+    shots = np.where(shots > 0, shots, 1)
+    if weights.ndim == 1:
+        return np.bincount(batch.histogram, weights=weights * batch.counts, minlength=batch.num_histograms) / shots
+    totals = [np.bincount(batch.histogram, weights=row * batch.counts, minlength=batch.num_histograms) for row in weights]
+    return np.stack(totals) / shots
+
+
+def population_weights(batch: CountsBatch, targets: Sequence[str]) -> np.ndarray:
+    """Indicator weights of the rows that belong to the target subspace."""
+    target_rows = pack_bitstrings([target.replace(' ', '').zfill(batch.num_bits) for target in targets], batch.num_bits)
+    if batch.outcomes.shape[1] == 1:
+        return np.isin(batch.outcomes[:, 0], target_rows[:, 0]).astype(float)
+    _, ids = unique_rows(np.concatenate([batch.outcomes, target_rows]), return_inverse=True)
+    return np.isin(ids[:len(batch.outcomes)], ids[len(batch.outcomes):]).astype(float)
+
+
+def parity_weights(batch: CountsBatch, indices_list: Sequence[Sequence[int]]) -> np.ndarray:
+    """(-1)^parity weights of the rows, one row of weights per set of classical bits."""
+    weights = np.empty((len(indices_list), len(batch.outcomes)))
+    for row, indices in enumerate(indices_list):
+        masked = batch.outcomes & _z_mask(indices, batch.outcomes.shape[1])
+        parity = np.bitwise_count(masked).sum(axis=1) & 1
+        weights[row] = 1.0 - 2.0 * parity
+    return weights
+
+
+def z_string_indices(label: str) -> List[int]:
+    """
+    Classical bits acted on by a Z-string label.
+
+    Labels follow the Qiskit convention (rightmost character is bit 0) and may only
+    contain 'Z' and 'I'.
+    """
+    label = label.upper()
+    if set(label) - {'Z', 'I'}:
+        raise ValueError(f"Invalid Z-string '{label}'. Only 'Z' and 'I' are allowed.")
+    return [index for index, char in enumerate(reversed(label)) if char == 'Z']
+
+
+def population(batch: Union[CountsBatch, Sequence[CountsLike]], targets: Sequence[str]) -> np.ndarray:
+    """
+    Fraction of shots in a target subspace for every histogram.
+
+    Args:
+        batch: Counts batch (or histograms to stack)
+        targets: Bitstrings spanning the target subspace (e.g. ['00', '11'] for a Bell state)
+
+    Returns:
+        Array of shape (num_histograms,)
+    """
+    batch = _as_batch(batch)
+    return expectation(batch, population_weights(batch, targets))
+
+
+def parity(batch: Union[CountsBatch, Sequence[CountsLike]], indices: Optional[Sequence[int]] = None) -> np.ndarray:
+    """
+    Expectation value of the parity (-1)^(sum of bits) for every histogram.
+
+    Args:
+        batch: Counts batch (or histograms to stack)
+        indices: Classical bits included in the parity (if None, all of them)
+
+    Returns:
+        Array of shape (num_histograms,)
+    """
+    batch = _as_batch(batch)
+    if indices is None:
+        indices = range(batch.num_bits)
+    return expectation(batch, parity_weights(batch, [list(indices)])[0])
+
+
+def z_expectations(batch: Union[CountsBatch, Sequence[CountsLike]], labels: Sequence[str]) -> np.ndarray:
+    """
+    Expectation values of Z-strings (e.g. 'ZZ', 'ZI') for every histogram.
+
+    Args:
+        batch: Counts batch (or histograms to stack)
+        labels: Z-string labels, rightmost character being bit 0
+
+    Returns:
+        Array of shape (len(labels), num_histograms)
+    """
+    batch = _as_batch(batch)
+    return expectation(batch, parity_weights(batch, [z_string_indices(label) for label in labels]))
+
+
+def bootstrap_std(
+    batch: Union[CountsBatch, Sequence[CountsLike]],
+    weights: np.ndarray,
+    num_resamples: int = 200,
+    seed: Optional[int] = None
+) -> np.ndarray:
+    """
+    Bootstrap standard error of a weighted estimator for every histogram.
+
+    Each histogram is resampled from a multinomial with its own observed
+    frequencies; all histograms and resamples are drawn in one vectorized call.
+
+    Args:
+        batch: Counts batch (or histograms to stack)
+        weights: Array of shape (k,) with the weight of every stored row
+        num_resamples: Number of bootstrap resamples
+        seed: Seed of the random number generator
+
+    Returns:
+        Array of shape (num_histograms,)
+    """
+    batch = _as_batch(batch)
+    rng = np.random.default_rng(seed)
+    shots = batch.shots.astype(np.int64)
+
+    # Lay the ragged histograms out as a dense (num_histograms, max_outcomes) table
+    sizes = np.bincount(batch.histogram, minlength=batch.num_histograms)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    column = np.arange(len(batch.counts)) - starts[batch.histogram]
+    width = max(int(sizes.max(initial=0)), 1)
+    probabilities = np.zeros((batch.num_histograms, width))
+    dense_weights = np.zeros((batch.num_histograms, width))
+    probabilities[batch.histogram, column] = batch.counts / np.where(shots > 0, shots, 1)[batch.histogram]
+    dense_weights[batch.histogram, column] = weights
+    probabilities[shots == 0, 0] = 1.0
+
+    resampled = rng.multinomial(shots, probabilities, size=(num_resamples, batch.num_histograms))
+    estimates = (resampled * dense_weights).sum(axis=-1) / np.where(shots > 0, shots, 1)
+    return estimates.std(axis=0, ddof=1) if num_resamples > 1 else np.zeros(batch.num_histograms)
+
+
+def population_with_error(
+    batch: Union[CountsBatch, Sequence[CountsLike]],
+    targets: Sequence[str],
+    num_resamples: int = 200,
+    seed: Optional[int] = None
+) -> np.ndarray:
+    """
+    Target-subspace population with bootstrap error bars.
+
+    Returns:
+        Array of shape (2, num_histograms) holding values and standard errors
+    """
+    batch = _as_batch(batch)
+    weights = population_weights(batch, targets)
+    return np.stack([expectation(batch, weights), bootstrap_std(batch, weights, num_resamples, seed)])
+
+
+def z_expectations_with_error(
+    batch: Union[CountsBatch, Sequence[CountsLike]],
+    labels: Sequence[str],
+    num_resamples: int = 200,
+    seed: Optional[int] = None
+) -> np.ndarray:
+    """
+    Z-string expectation values with bootstrap error bars.
+
+    Returns:
+        Array of shape (2, len(labels), num_histograms) holding values and standard errors
+    """
+    batch = _as_batch(batch)
+    weights = parity_weights(batch, [z_string_indices(label) for label in labels])
+    values = expectation(batch, weights)
+    errors = np.stack([bootstrap_std(batch, row, num_resamples, seed) for row in weights])
+    return np.stack([values, errors])
@@ -0,0 +1,518 @@
+"""Error Correction - Shor's 9-qubit code, stabilizer-code data and exhaustive error-injection sweeps.
+
+A small stabilizer code is described by its check generators and logical
+operators as symplectic bit arrays (``x``/``z`` of shape (..., num_qubits)).
+Injected Pauli errors are propagated analytically: the syndrome of an error is
+its commutation pattern with the checks, and after the lookup-table correction
+the residual operator is a logical error exactly when it anticommutes with a
+logical operator. Sweeping every error of a 9-qubit code this way takes
+milliseconds instead of one simulator call per error.
+"""
+
+from dataclasses import dataclass
+from itertools import combinations, product
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+
+PAULI_LABELS = 'IXYZ'
+
+
+class NineQubitErrorCorrection:
+    """
+    Implementation of Shor's 9-qubit quantum error correction code - ENCODING ONLY.
+
+    This class creates the encoding part of the error correction code that transforms
+    1 logical qubit into 9 physical qubits using a hierarchical CNOT structure.
+    """
+
+    def __init__(self):
+        # Create quantum registers - only data qubits for encoding
+        self.data_qubits = QuantumRegister(9, 'data')  # 9 data qubits
+
+        # Initialize the quantum circuit (encoding only)
+        self.circuit = QuantumCircuit(self.data_qubits)
+
+    def encode_logical_qubit(self, alpha: float = 1.0, beta: float = 0.0):
+        """
+        Encode a logical qubit |ψ⟩ = α|0⟩ + β|1⟩ into the 9-qubit code.
+
+        Implementation follows the standard Shor code:
+        1. Initialize the logical state on qubit 0
+        2. Phase-flip code: copy q₀ to the block leaders q₃ and q₆ and apply Hadamards to them
+        3. Bit-flip code: copy every block leader to the two qubits of its block
+        """
+        # Initialize the first qubit with the logical state
+        if beta != 0:
+            # Create superposition: α|0⟩ + β|1⟩
+            theta = 2 * np.arctan2(abs(beta), abs(alpha))
+            self.circuit.ry(theta, self.data_qubits[0])
+
+            # Handle phase if needed
+            if np.angle(beta) != 0:
+                self.circuit.rz(2 * np.angle(beta), self.data_qubits[0])
+
+        self.circuit.barrier()
+
+        # Step 1: Phase-flip code across the three blocks (q₀, q₃, q₆)
+        self.circuit.cx(self.data_qubits[0], self.data_qubits[3])
+        self.circuit.cx(self.data_qubits[0], self.data_qubits[6])
+        for leader in (0, 3, 6):
+            self.circuit.h(self.data_qubits[leader])
+
+        self.circuit.barrier()
+
+        # Step 2: Bit-flip code inside every block
+        for leader in (0, 3, 6):
+            self.circuit.cx(self.data_qubits[leader], self.data_qubits[leader + 1])
+            self.circuit.cx(self.data_qubits[leader], self.data_qubits[leader + 2])
+
+        self.circuit.barrier()
+
+    def add_error(self, error_type: str, qubit_index: int):
+        """Add a specific error to test the correction capability."""
+        if error_type == 'X':
+            self.circuit.x(self.data_qubits[qubit_index], label=f'Error: X on qubit {qubit_index}')
+        elif error_type == 'Z':
+            self.circuit.z(self.data_qubits[qubit_index], label=f'Error: Z on qubit {qubit_index}')
+        elif error_type == 'Y':
+            self.circuit.y(self.data_qubits[qubit_index], label=f'Error: Y on qubit {qubit_index}')
+
+        self.circuit.barrier()
+
+    def create_circuit(self, alpha: float = 1.0, beta: float = 0.0,
+                       add_test_error: Optional[Tuple[str, int]] = None) -> QuantumCircuit:
+        """Create the encoding circuit only."""
+        # Reset circuit
+        self.circuit = QuantumCircuit(self.data_qubits)
+
+        # Build the encoding circuit
+        self.encode_logical_qubit(alpha, beta)
+
+        if add_test_error:
+            error_type, qubit_index = add_test_error
+            self.add_error(error_type, qubit_index)
+
+        return self.circuit
+
+    def stabilizer_code(self) -> "StabilizerCode":
+        """Checks and logical operators of the code, derived from the encoding circuit."""
+        return StabilizerCode.from_encoder(NineQubitErrorCorrection().create_circuit())
+
+    def visualize_circuit(self, output: str = 'mpl', fold: int = 25, figsize: tuple = (16, 10)):
+        """Visualize the quantum circuit with matplotlib."""
+        import matplotlib.pyplot as plt
+        from qiskit.visualization import circuit_drawer
+
+        try:
+            if output == 'mpl':
+                # Use circuit_drawer directly for proper matplotlib display
+                fig = circuit_drawer(self.circuit, output='mpl', fold=fold, style='default', plot_barriers=True)
+                plt.show()
+                return fig
+            elif output == 'text':
+                print(self.circuit.draw(output='text', fold=fold))
+            else:
+                print(f"Output format '{output}' not supported. Using text format.")
+                print(self.circuit.draw(output='text', fold=fold))
+        except Exception as e:
+            print(f"❌ Error visualizing circuit: {str(e)}")
+            print("Falling back to text representation:")
+            print(self.circuit.draw(output='text', fold=fold))
+
+    def get_circuit_stats(self) -> dict:
+        """Get statistics about the encoding circuit."""
+        return {
+            'total_qubits': self.circuit.num_qubits,
+            'data_qubits': len(self.data_qubits),
+            'classical_bits': self.circuit.num_clbits,
+            'depth': self.circuit.depth(),
+            'gate_count': len(self.circuit.data),
+            'operations': dict(self.circuit.count_ops())
+        }
+
+
+def pauli_from_label(label: str, num_qubits: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse a Pauli error into symplectic bits.
+
+    Args:
+        label: Either a dense Qiskit label ('IXZ', rightmost character on qubit 0) or a
+            sparse label of letter/qubit pairs ('X4 Z7'); 'I' or '' is the identity
+        num_qubits: Number of qubits (required for sparse labels)
+
+    Returns:
+        Tuple of (x, z) boolean arrays of length num_qubits
+    """
+    label = label.strip()
+    sparse = any(character.isdigit() for character in label) or ' ' in label
+    if not sparse and (num_qubits is None or len(label) == num_qubits):
+        letters = list(label[::-1])
+        num_qubits = len(letters)
+        terms = [(letter, qubit) for qubit, letter in enumerate(letters)]
+    else:
+        if num_qubits is None:
+            raise ValueError("num_qubits is required for sparse Pauli labels")
+        terms = [(term[0], int(term[1:])) for term in label.split() if term != 'I']
+    x = np.zeros(num_qubits, dtype=bool)
+    z = np.zeros(num_qubits, dtype=bool)
+    for letter, qubit in terms:
+        if letter not in PAULI_LABELS:
+            raise ValueError(f"Unknown Pauli '{letter}'")
+        x[qubit] ^= letter in 'XY'
+        z[qubit] ^= letter in 'ZY'
+    return x, z
+
+
+def pauli_label(x: np.ndarray, z: np.ndarray) -> str:
+    """Sparse label ('X4 Z7', or 'I' for the identity) of one Pauli given by its symplectic bits."""
+    letters = np.asarray(x, dtype=int) + 2 * np.asarray(z, dtype=int)
+    terms = [f"{'IXZY'[letter]}{qubit}" for qubit, letter in enumerate(letters) if letter]
+    return ' '.join(terms) or 'I'
+
+
+def enumerate_errors(num_qubits: int, max_weight: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Every Pauli error of weight at most ``max_weight``, ordered by weight.
+
+    Args:
+        num_qubits: Number of qubits
+        max_weight: Largest number of qubits hit by one error
+
+    Returns:
+        Tuple of (x, z) boolean arrays of shape (num_errors, num_qubits)
+    """
+    rows = []
+    for weight in range(max_weight + 1):
+        for qubits in combinations(range(num_qubits), weight):
+            for letters in product((1, 2, 3), repeat=weight):
+                row = np.zeros(num_qubits, dtype=np.int8)
+                row[list(qubits)] = letters
+                rows.append(row)
+    letters = np.array(rows, dtype=np.int8).reshape(-1, num_qubits)
+    return np.isin(letters, (1, 2)), np.isin(letters, (2, 3))
+
+
+@dataclass
+class StabilizerCode:
+    """A stabilizer code with one logical qubit, given by symplectic check and logical rows."""
+    check_x: np.ndarray
+    check_z: np.ndarray
+    logical_x: Tuple[np.ndarray, np.ndarray]
+    logical_z: Tuple[np.ndarray, np.ndarray]
+    check_sign: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_encoder(cls, circuit: QuantumCircuit, data_qubit: int = 0) -> "StabilizerCode":
+        """
+        Derive a code from a Clifford encoding circuit.
+
+        The encoder maps the logical qubit's X and Z to the logical operators and
+        Z on every other (|0>-initialized) qubit to a check generator.
+
+        Args:
+            circuit: Encoding circuit made of Clifford gates
+            data_qubit: Qubit holding the unencoded logical state
+
+        Returns:
+            The code
+        """
+        from qiskit.quantum_info import Clifford
+
+        clifford = Clifford(circuit)
+        others = [qubit for qubit in range(circuit.num_qubits) if qubit != data_qubit]
+        return cls(
+            clifford.stab_x[others].copy(),
+            clifford.stab_z[others].copy(),
+            (clifford.destab_x[data_qubit].copy(), clifford.destab_z[data_qubit].copy()),
+            (clifford.stab_x[data_qubit].copy(), clifford.stab_z[data_qubit].copy()),
+            clifford.stab_phase[others].copy()
+        )
+
+    @classmethod
+    def from_check_matrix(cls, checks: np.ndarray, logical_x: str, logical_z: str) -> "StabilizerCode":
+        """
+        Build a code from a binary check matrix.
+
+        Args:
+            checks: Array of shape (num_checks, 2 * num_qubits) laid out as [X part | Z part]
+            logical_x: Label of the logical X operator (dense or sparse, see ``pauli_from_label``)
+            logical_z: Label of the logical Z operator
+
+        Returns:
+            The code
+        """
+        checks = np.asarray(checks, dtype=bool)
+        n = checks.shape[1] // 2
+        return cls(checks[:, :n].copy(), checks[:, n:].copy(), pauli_from_label(logical_x, n), pauli_from_label(logical_z, n))
+
+    @classmethod
+    def from_labels(
+        cls,
+        checks: Sequence[str],
+        logical_x: str,
+        logical_z: str,
+        num_qubits: Optional[int] = None
+    ) -> "StabilizerCode":
+        """
+        Build a code from Pauli labels, e.g. ``from_labels(['ZZI', 'IZZ'], 'XXX', 'IIZ')``.
+
+        Args:
+            checks: Labels of the check generators (dense Qiskit labels or sparse 'Z0 Z1')
+            logical_x: Label of the logical X operator
+            logical_z: Label of the logical Z operator
+            num_qubits: Number of qubits (required for sparse labels)
+
+        Returns:
+            The code
+        """
+        n = num_qubits or len(checks[0])
+        rows = [pauli_from_label(label, n) for label in checks]
+        return cls(
+            np.array([x for x, _ in rows]),
+            np.array([z for _, z in rows]),
+            pauli_from_label(logical_x, n),
+            pauli_from_label(logical_z, n)
+        )
+
+    @property
+    def num_qubits(self) -> int:
+        return self.check_x.shape[1]
+
+    @property
+    def num_checks(self) -> int:
+        return self.check_x.shape[0]
+
+    def syndromes(self, x: np.ndarray, z: np.ndarray) -> np.ndarray:
+        """
+        Syndrome bits of Pauli errors.
+
+        Args:
+            x, z: Symplectic bits of shape (num_errors, num_qubits)
+
+        Returns:
+            Boolean array of shape (num_errors, num_checks); bit i is set when check i anticommutes
+        """
+        x = np.atleast_2d(x).astype(np.int64)
+        z = np.atleast_2d(z).astype(np.int64)
+        return ((x @ self.check_z.T.astype(np.int64) + z @ self.check_x.T.astype(np.int64)) % 2).astype(bool)
+
+    def syndrome_indices(self, x: np.ndarray, z: np.ndarray) -> np.ndarray:
+        """Syndromes as integers (check i is bit i), for indexing lookup tables."""
+        return self.syndromes(x, z) @ (1 << np.arange(self.num_checks, dtype=np.int64))
+
+    def logical_flips(self, x: np.ndarray, z: np.ndarray) -> np.ndarray:
+        """
+        Which logical Paulis a syndrome-free residual error applies.
+
+        Args:
+            x, z: Symplectic bits of shape (num_errors, num_qubits)
+
+        Returns:
+            Boolean array of shape (num_errors, 2): column 0 is a logical bit flip
+            (anticommutes with logical Z), column 1 a logical phase flip (anticommutes with logical X)
+        """
+        x = np.atleast_2d(x).astype(np.int64)
+        z = np.atleast_2d(z).astype(np.int64)
+        flips = np.empty((x.shape[0], 2), dtype=bool)
+        for column, (logical_x, logical_z) in enumerate((self.logical_z, self.logical_x)):
+            flips[:, column] = (x @ logical_z.astype(np.int64) + z @ logical_x.astype(np.int64)) % 2 == 1
+        return flips
+
+    def lookup_table(self, max_weight: int = 1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Minimum-weight correction for every syndrome reachable by errors of weight at most ``max_weight``.
+
+        Args:
+            max_weight: Largest error weight used to fill the table
+
+        Returns:
+            Tuple of (correction_x, correction_z, known), indexed by syndrome integer;
+            ``known`` is False for syndromes no enumerated error produces (their correction is I)
+        """
+        x, z = enumerate_errors(self.num_qubits, max_weight)
+        indices = self.syndrome_indices(x, z)
+        size = 1 << self.num_checks
+        # np.unique keeps the first (i.e. lowest-weight) error per syndrome
+        syndromes, first = np.unique(indices, return_index=True)
+        correction_x = np.zeros((size, self.num_qubits), dtype=bool)
+        correction_z = np.zeros((size, self.num_qubits), dtype=bool)
+        known = np.zeros(size, dtype=bool)
+        correction_x[syndromes] = x[first]
+        correction_z[syndromes] = z[first]
+        known[syndromes] = True
+        return correction_x, correction_z, known
+
+
+@dataclass
+class ErrorSweep:
+    """Outcome of correcting every injected error of a code with a lookup-table decoder."""
+    code: StabilizerCode
+    error_x: np.ndarray
+    error_z: np.ndarray
+    syndromes: np.ndarray
+    logical_flips: np.ndarray
+    correction_x: np.ndarray
+    correction_z: np.ndarray
+    known: np.ndarray
+
+    @property
+    def decoded(self) -> np.ndarray:
+        """Whether each injected error produced a syndrome present in the lookup table."""
+        return self.known[self.syndromes]
+
+    @property
+    def failed(self) -> np.ndarray:
+        """Whether each injected error leaves a logical error (or an undecodable syndrome) after correction."""
+        return self.logical_flips.any(axis=1) | ~self.decoded
+
+    def table(self) -> Dict[str, str]:
+        """Syndrome → correction for every decodable syndrome, syndrome bit 0 rightmost."""
+        width = self.code.num_checks
+        return {
+            format(index, f'0{width}b'): pauli_label(self.correction_x[index], self.correction_z[index])
+            for index in np.flatnonzero(self.known)
+        }
+
+    def report(self) -> List[Tuple[str, str, str]]:
+        """(error, syndrome, result) for every injected error; result is 'ok', the logical flip or 'undecodable'."""
+        width = self.code.num_checks
+        outcomes = {(False, False): 'ok', (True, False): 'logical X', (False, True): 'logical Z', (True, True): 'logical Y'}
+        rows = []
+        for x, z, syndrome, flips, decoded in zip(self.error_x, self.error_z, self.syndromes, self.logical_flips, self.decoded):
+            result = outcomes[tuple(flips)] if decoded else 'undecodable'
+            rows.append((pauli_label(x, z), format(int(syndrome), f'0{width}b'), result))
+        return rows
+
+    def failures_by_type(self) -> np.ndarray:
+        """
+        Number of failing errors per (#X, #Y, #Z) composition.
+
+        Returns:
+            Integer array of shape (n + 1, n + 1, n + 1)
+        """
+        n = self.code.num_qubits
+        num_x = (self.error_x & ~self.error_z).sum(axis=1)
+        num_y = (self.error_x & self.error_z).sum(axis=1)
+        num_z = (~self.error_x & self.error_z).sum(axis=1)
+        failed = self.failed
+        counts = np.zeros((n + 1, n + 1, n + 1), dtype=np.int64)
+        np.add.at(counts, (num_x[failed], num_y[failed], num_z[failed]), 1)
+        return counts
+
+    def logical_error_rate(
+        self,
+        physical_error_rates: Sequence[float],
+        pauli_weights: Tuple[float, float, float] = (1 / 3, 1 / 3, 1 / 3)
+    ) -> np.ndarray:
+        """
+        Logical error rate under independent single-qubit Pauli noise.
+
+        Each qubit suffers X, Y, Z with probability p times the matching entry of
+        ``pauli_weights``. The sum runs over the swept errors only, so it is exact
+        when the sweep covered every weight and a lower bound otherwise.
+
+        Args:
+            physical_error_rates: Values of p
+            pauli_weights: Relative X, Y, Z probabilities (sum to 1; the default is depolarizing noise)
+
+        Returns:
+            Logical error rate for every p
+        """
+        n = self.code.num_qubits
+        p = np.asarray(physical_error_rates, dtype=float)[:, None, None, None]
+        weights = np.asarray(pauli_weights, dtype=float)
+        exponents = np.arange(n + 1)
+        num_x, num_y, num_z = np.meshgrid(exponents, exponents, exponents, indexing='ij')
+        identity = np.clip(n - num_x - num_y - num_z, 0, None)
+        probability = (
+            (p * weights[0]) ** num_x * (p * weights[1]) ** num_y * (p * weights[2]) ** num_z
+            * (1 - p) ** identity
+        )
+        return (self.failures_by_type()[None] * probability).sum(axis=(1, 2, 3))
+
+
+def error_sweep(code: StabilizerCode, max_weight: int = 1, table_weight: Optional[int] = None) -> ErrorSweep:
+    """
+    Inject every Pauli error up to a weight, decode it and classify the residual.
+
+    Args:
+        code: The stabilizer code
+        max_weight: Largest injected error weight (use ``code.num_qubits`` for an exhaustive sweep)
+        table_weight: Largest error weight used to fill the lookup table (defaults to
+            min(max_weight, 2))
+
+    Returns:
+        The sweep, with one entry per injected error
+    """
+    if table_weight is None:
+        table_weight = min(max_weight, 2)
+    correction_x, correction_z, known = code.lookup_table(table_weight)
+    if max_weight == code.num_qubits:
+        # All 4^n errors: enumerate by base-4 digits instead of by weight
+        digits = (np.arange(4 ** code.num_qubits)[:, None] >> (2 * np.arange(code.num_qubits))) & 3
+        error_x, error_z = np.isin(digits, (1, 2)), np.isin(digits, (2, 3))
+    else:
+        error_x, error_z = enumerate_errors(code.num_qubits, max_weight)
+    syndromes = code.syndrome_indices(error_x, error_z)
+    residual_x = error_x ^ correction_x[syndromes]
+    residual_z = error_z ^ correction_z[syndromes]
+    flips = code.logical_flips(residual_x, residual_z)
+    return ErrorSweep(code, error_x, error_z, syndromes, flips, correction_x, correction_z, known)
+
+
+def syndrome_circuits(
+    encoder: QuantumCircuit,
+    code: StabilizerCode,
+    error_x: np.ndarray,
+    error_z: np.ndarray,
+    readout_basis: Optional[str] = None
+) -> List[QuantumCircuit]:
+    """
+    Build encoding + injected error + ancilla-based syndrome extraction circuits.
+
+    The circuits can be submitted together (e.g. ``IBMQuantumRunner.run_circuits``) or
+    sampled with ``stabilizer.run_circuit``; the 'syndrome' register's bit i is check i.
+
+    Args:
+        encoder: Encoding circuit on the code's data qubits
+        code: The stabilizer code
+        error_x, error_z: Errors to inject, shape (num_errors, num_qubits)
+        readout_basis: If 'X' or 'Z', also measure every data qubit in that basis into a
+            'readout' register (classical bits m ... m + n - 1)
+
+    Returns:
+        One circuit per error
+    """
+    n, m = code.num_qubits, code.num_checks
+    circuits = []
+    for x, z in zip(np.atleast_2d(error_x), np.atleast_2d(error_z)):
+        data = QuantumRegister(n, 'data')
+        ancilla = QuantumRegister(m, 'ancilla')
+        syndrome = ClassicalRegister(m, 'syndrome')
+        qc = QuantumCircuit(data, ancilla, syndrome)
+        qc.compose(encoder, data, inplace=True)
+        for qubit in range(n):
+            letter = int(x[qubit]) + 2 * int(z[qubit])
+            if letter:
+                getattr(qc, 'ixzy'[letter])(data[qubit])
+        qc.barrier()
+        for check in range(m):
+            qc.h(ancilla[check])
+            for qubit in range(n):
+                letter = int(code.check_x[check, qubit]) + 2 * int(code.check_z[check, qubit])
+                if letter:
+                    getattr(qc, ('', 'cx', 'cz', 'cy')[letter])(ancilla[check], data[qubit])
+            qc.h(ancilla[check])
+            if code.check_sign is not None and code.check_sign[check]:
+                # The code space is the -1 eigenspace of this check
+                qc.x(ancilla[check])
+        qc.measure(ancilla, syndrome)
+        if readout_basis is not None:
+            readout = ClassicalRegister(n, 'readout')
+            qc.add_register(readout)
+            if readout_basis == 'X':
+                qc.h(data)
+            qc.measure(data, readout)
+        circuits.append(qc)
+    return circuits
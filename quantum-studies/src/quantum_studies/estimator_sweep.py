@@ -0,0 +1,237 @@
+"""Estimator Sweep - Broadcast parameter-grid × observable scans in a single estimator PUB.
+
+A scan over an N-dimensional grid of parameter values and a list of observables
+is submitted as one PUB: the parameter values get shape grid + (1, num_params)
+and the observables shape (1, ..., 1, num_observables), so the estimator
+broadcasts them to grid + (num_observables,) expectation values in one call.
+Compiled circuits (and observables mapped onto their layouts) are cached, so
+repeated scans of the same ansatz skip transpilation entirely.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Pauli, SparsePauliOp
+from quantum_studies.transpile_cache import TranspileCache, circuit_fingerprint
+
+ObservableLike = Union[str, Pauli, SparsePauliOp]
+OBSERVABLE_DIM = 'observable'
+
+
+@dataclass
+class SweepResult:
+    """Expectation values and standard deviations of a sweep, labeled by parameter axes and observables."""
+    evs: np.ndarray
+    stds: np.ndarray
+    dims: Tuple[str, ...]
+    coords: Dict[str, np.ndarray]
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.evs.shape
+
+    def _index(self, dim: str, value: Any) -> int:
+        coords = self.coords[dim]
+        if dim == OBSERVABLE_DIM:
+            matches = np.flatnonzero(coords == value)
+            if not len(matches):
+                raise KeyError(f"Unknown observable '{value}'. Available: {', '.join(coords)}")
+            return int(matches[0])
+        return int(np.argmin(np.abs(coords - value)))
+
+    def sel(self, **indexers: Any) -> "SweepResult":
+        """
+        Select by coordinate value, dropping the selected dimensions.
+
+        Parameter axes select the nearest grid value; the observable axis selects by label.
+
+        Args:
+            **indexers: Dimension name mapped to the value to select
+
+        Returns:
+            The selected sub-sweep
+        """
+        unknown = set(indexers) - set(self.dims)
+        if unknown:
+            raise KeyError(f"Unknown dimensions: {', '.join(sorted(unknown))}")
+        index = tuple(self._index(dim, indexers[dim]) if dim in indexers else slice(None) for dim in self.dims)
+        dims = tuple(dim for dim in self.dims if dim not in indexers)
+        return SweepResult(
+            self.evs[index],
+            self.stds[index],
+            dims,
+            {dim: self.coords[dim] for dim in dims}
+        )
+
+    def argmin(self, observable: Optional[str] = None) -> Dict[str, float]:
+        """
+        Grid point with the lowest expectation value (e.g. the best VQE energy on a scan).
+
+        Args:
+            observable: Observable label (if None, the sweep must have a single observable)
+
+        Returns:
+            Dictionary mapping every parameter dimension to its value at the minimum
+        """
+        sweep = self.sel(observable=observable) if observable is not None else self
+        if OBSERVABLE_DIM in sweep.dims:
+            if len(sweep.coords[OBSERVABLE_DIM]) != 1:
+                raise ValueError("Pass the observable to minimize")
+            sweep = sweep.sel(observable=sweep.coords[OBSERVABLE_DIM][0])
+        position = np.unravel_index(np.argmin(sweep.evs), sweep.evs.shape)
+        return {dim: float(sweep.coords[dim][index]) for dim, index in zip(sweep.dims, position)}
+
+
+def observable_labels(observables: Union[Mapping[str, ObservableLike], Sequence[ObservableLike]]) -> List[str]:
+    """Labels for observables: dictionary keys, Pauli strings for single unit-weight terms, else 'obs<i>'."""
+    if isinstance(observables, Mapping):
+        return [str(label) for label in observables]
+    labels = []
+    for index, observable in enumerate(observables):
+        if isinstance(observable, str):
+            labels.append(observable)
+        elif isinstance(observable, Pauli):
+            labels.append(observable.to_label())
+        elif isinstance(observable, SparsePauliOp) and len(observable) == 1 and observable.coeffs[0] == 1:
+            labels.append(observable.paulis[0].to_label())
+        else:
+            labels.append(f"obs{index}")
+    return labels
+
+
+def parameter_grid(circuit: QuantumCircuit, grid: Mapping[str, Any]) -> Tuple[np.ndarray, Tuple[str, ...], Dict[str, np.ndarray]]:
+    """
+    Expand per-parameter axes into an array of parameter values.
+
+    Args:
+        circuit: Parameterized circuit
+        grid: Parameter name mapped to a 1-D array of values (one grid axis) or a
+            scalar (held fixed, no axis)
+
+    Returns:
+        Tuple of (values of shape grid_shape + (num_params,) in ``circuit.parameters``
+        order, axis names, axis coordinates)
+    """
+    names = [parameter.name for parameter in circuit.parameters]
+    missing = [name for name in names if name not in grid]
+    unknown = [name for name in grid if name not in names]
+    if missing or unknown:
+        raise ValueError(f"Grid must give every circuit parameter exactly once (missing: {missing}, unknown: {unknown})")
+
+    dims = tuple(name for name in grid if np.ndim(grid[name]) == 1)
+    coords = {name: np.asarray(grid[name], dtype=float) for name in dims}
+    shape = tuple(len(coords[name]) for name in dims)
+    values = np.empty(shape + (len(names),), dtype=float)
+    for column, name in enumerate(names):
+        if name in coords:
+            axis_shape = [1] * len(dims)
+            axis_shape[dims.index(name)] = -1
+            values[..., column] = coords[name].reshape(axis_shape)
+        else:
+            values[..., column] = float(grid[name])
+    return values, dims, coords
+
+
+class EstimatorSweep:
+    """Runs parameter-grid × observable scans as single broadcast estimator PUBs."""
+
+    def __init__(
+        self,
+        estimator: Any = None,
+        backend: Any = None,
+        optimization_level: int = 1,
+        transpile_cache: Optional[TranspileCache] = None
+    ):
+        """
+        Initialize the sweep runner.
+
+        Args:
+            estimator: EstimatorV2-compatible primitive (if None, a ``StatevectorEstimator``)
+            backend: Backend to compile circuits for (if None, circuits run as written)
+            optimization_level: Transpilation optimization level (0-3)
+            transpile_cache: Cache of compiled circuits (if None, a private in-memory cache)
+        """
+        if estimator is None:
+            from qiskit.primitives import StatevectorEstimator
+
+            estimator = StatevectorEstimator()
+        self.estimator = estimator
+        self.backend = backend
+        self.optimization_level = optimization_level
+        self.transpile_cache = transpile_cache or TranspileCache()
+        self._observable_cache: Dict[Tuple[str, Tuple[str, ...]], np.ndarray] = {}
+
+    def compile(self, circuit: QuantumCircuit) -> QuantumCircuit:
+        """Compile a circuit for the backend (cached); without a backend it is returned unchanged."""
+        if self.backend is None:
+            return circuit
+        return self.transpile_cache.transpile([circuit], self.backend, self.optimization_level)[0]
+
+    def _observables(self, compiled: QuantumCircuit, observables: Sequence[ObservableLike]) -> np.ndarray:
+        """Observables as SparsePauliOps mapped onto the compiled circuit's layout (cached)."""
+        operators = [SparsePauliOp(observable) for observable in observables]
+        key = (circuit_fingerprint(compiled), tuple(str(operator) for operator in operators))
+        if key not in self._observable_cache:
+            if compiled.layout is not None:
+                operators = [operator.apply_layout(compiled.layout) for operator in operators]
+            mapped = np.empty(len(operators), dtype=object)
+            mapped[:] = operators
+            self._observable_cache[key] = mapped
+        return self._observable_cache[key]
+
+    def pub(
+        self,
+        circuit: QuantumCircuit,
+        grid: Mapping[str, Any],
+        observables: Union[Mapping[str, ObservableLike], Sequence[ObservableLike]],
+        precision: Optional[float] = None
+    ) -> Tuple:
+        """
+        Build the single broadcast PUB of a sweep.
+
+        Args:
+            circuit: Parameterized circuit without measurements
+            grid: Parameter name mapped to axis values or a fixed scalar (see ``parameter_grid``)
+            observables: Observables, as a list or a dictionary keyed by label
+            precision: Target precision for sampling-based estimators
+
+        Returns:
+            PUB tuple ``(circuit, observables, values[, precision])``
+        """
+        operators = list(observables.values()) if isinstance(observables, Mapping) else list(observables)
+        values, dims, _ = parameter_grid(circuit, grid)
+        compiled = self.compile(circuit)
+        mapped = self._observables(compiled, operators).reshape((1,) * len(dims) + (len(operators),))
+        values = values[..., None, :]
+        return (compiled, mapped, values) if precision is None else (compiled, mapped, values, precision)
+
+    def run(
+        self,
+        circuit: QuantumCircuit,
+        grid: Mapping[str, Any],
+        observables: Union[Mapping[str, ObservableLike], Sequence[ObservableLike]],
+        precision: Optional[float] = None
+    ) -> SweepResult:
+        """
+        Evaluate every observable at every grid point in one estimator call.
+
+        Args:
+            circuit: Parameterized circuit without measurements
+            grid: Parameter name mapped to axis values or a fixed scalar (see ``parameter_grid``)
+            observables: Observables, as a list or a dictionary keyed by label
+            precision: Target precision for sampling-based estimators
+
+        Returns:
+            Labeled result with arrays of shape grid_shape + (num_observables,)
+        """
+        _, dims, coords = parameter_grid(circuit, grid)
+        pub_result = self.estimator.run([self.pub(circuit, grid, observables, precision)]).result()[0]
+        coords = dict(coords)
+        coords[OBSERVABLE_DIM] = np.array(observable_labels(observables))
+        return SweepResult(
+            np.asarray(pub_result.data.evs),
+            np.asarray(pub_result.data.stds),
+            dims + (OBSERVABLE_DIM,),
+            coords
+        )
@@ -63,29 +63,23 @@ def example_multiple_backends(api_key):
     
     results = {}
     
-    # Run on first few available backends (limit to avoid excessive queue time)
-    for backend in backends[:3]:  # Limit to first 3 backends
-        try:
-            print(f"\n{'='*50}")
-            print(f"Running on {backend.name}")
-            print(f"{'='*50}")
-            
-            counts, result = runner.run_circuit(
-                circuit=circuit,
-                shots=1024,
-                backend_name=backend.name,
-                plot_results=False  # Don't plot to avoid too many plots
-            )
-            
-            fidelity = runner.calculate_bell_state_fidelity(counts)
-            results[backend.name] = {
-                'counts': counts,
-                'fidelity': fidelity,
-                'qubits': backend.num_qubits
-            }
-            
-        except Exception as e:
-            print(f"Failed to run on {backend.name}: {e}")
+    # Submit to the first few available backends at once (limit to avoid excessive queue time)
+    backend_qubits = {backend.name: backend.num_qubits for backend in backends[:3]}
+    print(f"\nRunning on {', '.join(backend_qubits)} concurrently")
+    outcomes = runner.run_on_backends(circuit, list(backend_qubits), shots=1024)
+    
+    for backend_name, outcome in outcomes.items():
+        if isinstance(outcome, Exception):
+            print(f"Failed to run on {backend_name}: {outcome}")
+            continue
+        
+        counts = runner.get_counts(outcome[0])
+        fidelity = runner.calculate_bell_state_fidelity(counts)
+        results[backend_name] = {
+            'counts': counts,
+            'fidelity': fidelity,
+            'qubits': backend_qubits[backend_name]
+        }
     
     # Print summary
     print(f"\n{'='*50}")
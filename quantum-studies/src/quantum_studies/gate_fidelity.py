@@ -0,0 +1,179 @@
+"""Gate Fidelity - Vectorized process fidelity, average gate fidelity and diamond-norm bounds.
+
+Compares stacks of channels against target unitaries in one pass instead of one
+``Operator`` pair at a time. Channels are given as arrays of shape (batch, d, d)
+of operators, or (batch, d^2, d^2) Choi matrices or Pauli transfer matrices in
+Qiskit's conventions. Targets are a single unitary of shape (d, d), shared by
+the whole batch, or one unitary per channel of shape (batch, d, d).
+
+Like ``qiskit.quantum_info.average_gate_fidelity``, every quantity is invariant
+under a global phase of the channel or target operator.
+"""
+
+from typing import Dict
+import numpy as np
+from qiskit.quantum_info import pauli_basis
+
+REPRESENTATIONS = ('unitary', 'choi', 'ptm')
+
+
+def _dimension(channels: np.ndarray, rep: str) -> int:
+    """Input dimension d of the channels in a stack."""
+    if rep not in REPRESENTATIONS:
+        raise ValueError(f"Unknown representation '{rep}'. Available: {', '.join(REPRESENTATIONS)}")
+    size = channels.shape[-1]
+    return size if rep == 'unitary' else int(round(np.sqrt(size)))
+
+
+def _as_stack(array: np.ndarray) -> np.ndarray:
+    """Promote a single matrix to a stack of one."""
+    array = np.asarray(array)
+    return array[None] if array.ndim == 2 else array
+
+
+def choi_from_unitaries(unitaries: np.ndarray) -> np.ndarray:
+    """
+    Choi matrices of unitary channels, in Qiskit's column-stacking convention.
+
+    Args:
+        unitaries: Array of shape (batch, d, d)
+
+    Returns:
+        Array of shape (batch, d^2, d^2)
+    """
+    unitaries = _as_stack(unitaries)
+    vectors = np.swapaxes(unitaries, -1, -2).reshape(unitaries.shape[0], -1)
+    return vectors[:, :, None] * vectors[:, None, :].conj()
+
+
+def ptm_from_unitaries(unitaries: np.ndarray) -> np.ndarray:
+    """
+    Pauli transfer matrices R_ij = Tr(P_i U P_j U^dagger) / d of unitary channels.
+
+    Args:
+        unitaries: Array of shape (batch, d, d), d a power of two
+
+    Returns:
+        Real array of shape (batch, d^2, d^2), Paulis ordered as ``qiskit.quantum_info.pauli_basis``
+    """
+    unitaries = _as_stack(unitaries)
+    dim = unitaries.shape[-1]
+    paulis = pauli_basis(dim.bit_length() - 1).to_matrix(array=True)
+    # Conjugate every Pauli by every unitary, then project back onto the basis
+    conjugated = unitaries[:, None] @ paulis[None] @ np.conj(np.swapaxes(unitaries, -1, -2))[:, None]
+    return np.einsum('iab,zjba->zij', paulis, conjugated).real / dim
+
+
+def process_fidelity(channels: np.ndarray, targets: np.ndarray, rep: str = 'unitary') -> np.ndarray:
+    """
+    Process (entanglement) fidelity of every channel in a stack with its target unitary.
+
+    Args:
+        channels: Operators (batch, d, d), or Choi matrices / PTMs (batch, d^2, d^2)
+        targets: Target unitary (d, d) or one per channel (batch, d, d)
+        rep: Representation of ``channels``: 'unitary', 'choi' or 'ptm'
+
+    Returns:
+        Array of shape (batch,)
+    """
+    channels, targets = _as_stack(channels), _as_stack(targets)
+    dim = _dimension(channels, rep)
+    if rep == 'unitary':
+        # |Tr(U^dagger V)|^2 / d^2; the modulus removes any global phase
+        overlap = np.einsum('bij,bij->b', np.conj(targets), channels)
+        return np.abs(overlap) ** 2 / dim ** 2
+    if rep == 'choi':
+        vectors = np.swapaxes(targets, -1, -2).reshape(targets.shape[0], -1)
+        fidelity = np.einsum('bi,bij,bj->b', vectors.conj(), channels, vectors)
+    else:
+        fidelity = np.einsum('bij,bij->b', ptm_from_unitaries(targets), channels)
+    return np.real(fidelity) / dim ** 2
+
+
+def average_gate_fidelity(channels: np.ndarray, targets: np.ndarray, rep: str = 'unitary') -> np.ndarray:
+    """
+    Average gate fidelity (d F_pro + 1) / (d + 1) of every channel in a stack.
+
+    Args:
+        channels: Operators (batch, d, d), or Choi matrices / PTMs (batch, d^2, d^2)
+        targets: Target unitary (d, d) or one per channel (batch, d, d)
+        rep: Representation of ``channels``: 'unitary', 'choi' or 'ptm'
+
+    Returns:
+        Array of shape (batch,)
+    """
+    dim = _dimension(_as_stack(channels), rep)
+    return (dim * process_fidelity(channels, targets, rep) + 1) / (dim + 1)
+
+
+def _unitary_diamond_distance(channels: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    Exact ||V - U||_diamond of unitary channels.
+
+    Equals 2 sqrt(1 - delta^2), with delta the distance from the origin to the
+    convex hull of the eigenvalues of U^dagger V: 2 sin(arc / 2) when the
+    eigenvalues span an arc shorter than pi, else 2.
+    """
+    relative = np.conj(np.swapaxes(targets, -1, -2)) @ channels
+    angles = np.sort(np.angle(np.linalg.eigvals(relative)), axis=-1)
+    gaps = np.diff(angles, axis=-1, append=angles[:, :1] + 2 * np.pi)
+    arc = 2 * np.pi - gaps.max(axis=-1)
+    return np.where(arc < np.pi, 2 * np.sin(np.minimum(arc, np.pi) / 2), 2.0)
+
+
+def _diamond_bound(channels: np.ndarray, targets: np.ndarray, rep: str, fidelity: np.ndarray) -> np.ndarray:
+    """Diamond-norm bound of stacked channels given their process fidelities."""
+    dim = _dimension(channels, rep)
+    bound = np.minimum(2 * dim * np.sqrt(np.clip(1 - fidelity, 0, None)), 2.0)
+    if rep != 'unitary':
+        return bound
+
+    targets = np.broadcast_to(targets, channels.shape)
+    gram = np.conj(np.swapaxes(channels, -1, -2)) @ channels
+    unitary = np.all(np.isclose(gram, np.eye(dim), atol=1e-10), axis=(-2, -1))
+    if unitary.any():
+        bound[unitary] = _unitary_diamond_distance(channels[unitary], targets[unitary])
+    return bound
+
+
+def diamond_norm_bound(channels: np.ndarray, targets: np.ndarray, rep: str = 'unitary') -> np.ndarray:
+    """
+    Upper bound on ||E - U||_diamond for every channel in a stack.
+
+    Unitary operators get the exact value. Other channels use the Fuchs-van de
+    Graaf bound on the normalized Choi states, ||E - U||_diamond <= 2 d sqrt(1 - F_pro),
+    capped at 2; it only holds for CPTP channels.
+
+    Args:
+        channels: Operators (batch, d, d), or Choi matrices / PTMs (batch, d^2, d^2)
+        targets: Target unitary (d, d) or one per channel (batch, d, d)
+        rep: Representation of ``channels``: 'unitary', 'choi' or 'ptm'
+
+    Returns:
+        Array of shape (batch,) with values in [0, 2]
+    """
+    channels, targets = _as_stack(channels), _as_stack(targets)
+    return _diamond_bound(channels, targets, rep, process_fidelity(channels, targets, rep))
+
+
+def gate_fidelities(channels: np.ndarray, targets: np.ndarray, rep: str = 'unitary') -> Dict[str, np.ndarray]:
+    """
+    Process fidelity, average gate fidelity and diamond-norm bound in one pass.
+
+    Args:
+        channels: Operators (batch, d, d), or Choi matrices / PTMs (batch, d^2, d^2)
+        targets: Target unitary (d, d) or one per channel (batch, d, d)
+        rep: Representation of ``channels``: 'unitary', 'choi' or 'ptm'
+
+    Returns:
+        Dictionary of arrays of shape (batch,) keyed by 'process_fidelity',
+        'average_gate_fidelity' and 'diamond_norm_bound'
+    """
+    channels, targets = _as_stack(channels), _as_stack(targets)
+    dim = _dimension(channels, rep)
+    fidelity = process_fidelity(channels, targets, rep)
+    return {
+        'process_fidelity': fidelity,
+        'average_gate_fidelity': (dim * fidelity + 1) / (dim + 1),
+        'diamond_norm_bound': _diamond_bound(channels, targets, rep, fidelity)
+    }
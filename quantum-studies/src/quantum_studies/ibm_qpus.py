@@ -1,27 +1,75 @@
-"""IBM Quantum Runner - A reusable module for running quantum circuits on IBM QPUs."""
+"""IBM Quantum Runner - A reusable module for running quantum circuits on IBM QPUs.
 
+Only the modules needed to submit jobs are imported eagerly. The runtime service
+(``qiskit_ibm_runtime``) and the plotting stack (``matplotlib`` and
+``qiskit.visualization``) are imported on first use, so headless workers that only
+submit circuits start quickly.
+"""
+
+import asyncio
 import os
-from typing import Dict, List, Optional, Union, Tuple, Any
-from qiskit import QuantumCircuit, transpile
-from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2
-from qiskit.visualization import plot_histogram
-import matplotlib.pyplot as plt
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union, Tuple, Any, Sequence, AsyncIterator
+import numpy as np
+from qiskit import QuantumCircuit
+from quantum_studies.async_utils import run_sync
+from quantum_studies.backend_cache import BackendMetadataCache
+from quantum_studies.circuit_template import CompiledTemplate
+from quantum_studies.counts_analysis import population
+from quantum_studies.measurement_planner import MeasurementPlan
+from quantum_studies.noise_aware_layout import LayoutSelection, select_layouts
+from quantum_studies.providers import IBMRuntimeProvider, RuntimeProvider
+from quantum_studies.scheduler import QueueAwareScheduler
+from quantum_studies.shot_data import ShotArray
+from quantum_studies.transpile_cache import TranspileCache
+
+
+@dataclass
+class JobHandle:
+    """A submitted, not yet awaited, sampler job."""
+    
+    job: Any
+    backend_name: str
+    num_pubs: int
+    submitted_at: float = field(default_factory=time.monotonic)
+    
+    @property
+    def job_id(self) -> str:
+        return self.job.job_id()
 
 
 class IBMQuantumRunner:
     """A class to handle IBM Quantum backend operations."""
     
-    def __init__(self, api_key: Optional[str] = None, channel: str = "ibm_quantum_platform"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        channel: str = "ibm_quantum_platform",
+        transpile_cache: Optional[TranspileCache] = None,
+        provider: Optional[RuntimeProvider] = None
+    ):
         """
         Initialize the IBM Quantum Runner.
         
         Args:
             api_key: IBM Quantum API key. If None, tries to load from environment or saved account.
             channel: IBM Quantum channel ('ibm_quantum_platform' or 'ibm_cloud')
+            transpile_cache: Cache for transpiled circuits (if None, an in-memory cache is used)
+            provider: Source of backends and samplers (if None, IBM Quantum through
+                QiskitRuntimeService; pass a LocalRuntimeProvider to run offline)
         """
         self.channel = channel
+        self.provider = None
         self.service = None
         self.backend = None
+        self.metadata = None
+        self.scheduler = None
+        self.transpile_cache = transpile_cache if transpile_cache is not None else TranspileCache()
+        
+        if provider is not None:
+            self._attach_provider(provider)
+            return
         
         if api_key:
             self._save_account(api_key, channel)
@@ -30,6 +78,8 @@ class IBMQuantumRunner:
     
     def _save_account(self, api_key: str, channel: str) -> None:
         """Save IBM Quantum account credentials."""
+        from qiskit_ibm_runtime import QiskitRuntimeService
+        
         try:
             QiskitRuntimeService.save_account(
                 channel=channel, 
@@ -43,9 +93,17 @@ class IBMQuantumRunner:
     def _initialize_service(self) -> None:
         """Initialize the Qiskit Runtime Service."""
         try:
-            self.service = QiskitRuntimeService(channel=self.channel)
+            provider = IBMRuntimeProvider(channel=self.channel)
         except Exception as e:
             raise RuntimeError(f"Failed to initialize service: {e}")
+        self._attach_provider(provider)
+    
+    def _attach_provider(self, provider: RuntimeProvider) -> None:
+        """Use a provider for backends and samplers, and build the caches on top of it."""
+        self.provider = provider
+        self.service = getattr(provider, 'service', provider)
+        self.metadata = BackendMetadataCache(provider)
+        self.scheduler = QueueAwareScheduler(self.metadata)
     
     def list_backends(self, min_qubits: int = 1, operational_only: bool = True) -> List:
         """
@@ -61,16 +119,14 @@ class IBMQuantumRunner:
         if not self.service:
             raise RuntimeError("Service not initialized")
         
-        backends = self.service.backends(
-            simulator=False, 
-            operational=operational_only,
-            min_num_qubits=min_qubits
-        )
+        backends = self.metadata.backends(min_qubits=min_qubits, operational_only=operational_only)
+        statuses = self.metadata.statuses(backends)
         
         print(f"\nAvailable quantum backends (min {min_qubits} qubits):")
         for backend in backends:
-            status = backend.status()
-            queue_length = getattr(status, 'pending_jobs', 'N/A')
+            queue_length = statuses[backend.name]['pending_jobs']
+            if queue_length is None:
+                queue_length = 'N/A'
             print(f"- {backend.name}: {backend.num_qubits} qubits, Queue: {queue_length}")
         
         return backends
@@ -86,14 +142,14 @@ class IBMQuantumRunner:
             raise RuntimeError("Service not initialized")
         
         try:
-            self.backend = self.service.backend(backend_name)
+            self.backend = self.metadata.backend(backend_name)
             print(f"\nSelected backend: {self.backend.name}")
             print(f"Number of qubits: {self.backend.num_qubits}")
             
-            status = self.backend.status()
-            print(f"Backend status: {status.status_msg}")
-            if hasattr(status, 'pending_jobs'):
-                print(f"Queue length: {status.pending_jobs}")
+            status = self.metadata.status(self.backend)
+            print(f"Backend status: {status['status_msg']}")
+            if status['pending_jobs'] is not None:
+                print(f"Queue length: {status['pending_jobs']}")
                 
         except Exception as e:
             raise RuntimeError(f"Failed to select backend '{backend_name}': {e}")
@@ -104,7 +160,7 @@ class IBMQuantumRunner:
         shots: int = 1024,
         optimization_level: int = 1,
         backend_name: Optional[str] = None,
-        plot_results: bool = True,
+        plot_results: bool = False,
         title: Optional[str] = None
     ) -> Tuple[Dict[str, int], Any]:
         """
@@ -115,7 +171,7 @@ class IBMQuantumRunner:
             shots: Number of shots to execute
             optimization_level: Transpilation optimization level (0-3)
             backend_name: Backend to use (if None, uses currently selected backend)
-            plot_results: Whether to plot the histogram
+            plot_results: Whether to plot the histogram (imports matplotlib)
             title: Title for the histogram plot
             
         Returns:
@@ -130,11 +186,11 @@ class IBMQuantumRunner:
         
         try:
             # Transpile the circuit for the selected backend
-            transpiled_circuit = transpile(circuit, self.backend, optimization_level=optimization_level)
+            transpiled_circuit = self._transpile([circuit], optimization_level)[0]
             print(f"\nTranspiled circuit depth: {transpiled_circuit.depth()}")
             
             # Create a Sampler primitive
-            sampler = SamplerV2(self.backend)
+            sampler = self.provider.sampler(self.backend)
             
             # Run the job
             print(f"\nSubmitting job to {self.backend.name}...")
@@ -146,32 +202,618 @@ class IBMQuantumRunner:
             # Get the result
             result = job.result()
             
-            # Get the classic registers names dynamically
-            return result
+        except Exception as e:
+            self._print_troubleshooting_info(e)
+            raise
+        
+        if plot_results:
+            self.plot_counts(self.get_counts(result[0]), title=title or f"Results on {self.backend.name}")
+        
+        return result
+    
+    def run_circuits(
+        self,
+        pubs: Sequence[Union[QuantumCircuit, Tuple]],
+        shots: int = 1024,
+        optimization_level: int = 1,
+        backend_name: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Run a batch of circuits on the selected backend with as few jobs as possible.
+        
+        Every entry of ``pubs`` is either a ``QuantumCircuit`` or a tuple
+        ``(circuit, parameter_values, shots)`` where the last two items are optional.
+        The PUBs are packed into ``SamplerV2`` jobs holding at most
+        ``max_experiments`` circuit executions each. All jobs are submitted before
+        any result is awaited, so they share the queue wait.
+        
+        Args:
+            pubs: Circuits or (circuit, parameter_values, shots) tuples to run
+            shots: Default number of shots for PUBs that do not set their own
+            optimization_level: Transpilation optimization level (0-3)
+            backend_name: Backend to use (if None, uses currently selected backend)
+            
+        Returns:
+            List of per-PUB results, in the same order as ``pubs``
+        """
+        if backend_name:
+            self.select_backend(backend_name)
+        
+        if not self.backend:
+            raise RuntimeError("No backend selected. Use select_backend() first.")
+        
+        if not pubs:
+            return []
+        
+        try:
+            handles = self.submit_circuits(pubs, shots=shots, optimization_level=optimization_level)
+            
+            results = []
+            for handle in handles:
+                results.extend(handle.job.result())
+            return results
+            
+        except Exception as e:
+            self._print_troubleshooting_info(e)
+            raise
+    
+    def submit_circuits(
+        self,
+        pubs: Sequence[Union[QuantumCircuit, Tuple]],
+        shots: int = 1024,
+        optimization_level: int = 1,
+        backend_name: Optional[str] = None
+    ) -> List[JobHandle]:
+        """
+        Transpile and submit a batch of PUBs without waiting for the results.
+        
+        See ``run_circuits`` for the accepted PUB forms. Passing ``backend_name``
+        does not change the selected backend.
+        
+        Args:
+            pubs: Circuits or (circuit, parameter_values, shots) tuples to run
+            shots: Default number of shots for PUBs that do not set their own
+            optimization_level: Transpilation optimization level (0-3)
+            backend_name: Backend to use (if None, uses currently selected backend)
+            
+        Returns:
+            Handles of the submitted jobs; their results concatenate to the PUBs in order
+        """
+        backend = self._get_backend(backend_name)
+        normalized = [self._normalize_pub(pub) for pub in pubs]
+        
+        transpiled = self._transpile([circuit for circuit, _, _ in normalized], optimization_level, backend=backend)
+        transpiled_pubs = [
+            (circuit, values, pub_shots)
+            for circuit, (_, values, pub_shots) in zip(transpiled, normalized)
+        ]
+        
+        batches = self._pack_pubs(transpiled_pubs, self._max_experiments(backend))
+        
+        sampler = self.provider.sampler(backend)
+        handles = []
+        print(f"\nSubmitting {len(transpiled_pubs)} PUBs in {len(batches)} job(s) to {backend.name}...")
+        for batch in batches:
+            job = sampler.run(batch, shots=shots)
+            print(f"Job ID: {job.job_id()} ({len(batch)} PUBs)")
+            handles.append(JobHandle(job=job, backend_name=backend.name, num_pubs=len(batch)))
+        return handles
+    
+    def compile_template(
+        self,
+        circuit: QuantumCircuit,
+        optimization_level: int = 1,
+        backend_name: Optional[str] = None
+    ) -> CompiledTemplate:
+        """
+        Transpile a parameterized circuit once for a backend, for repeated sweeps.
+        
+        Args:
+            circuit: Parameterized circuit with measurements
+            optimization_level: Transpilation optimization level (0-3)
+            backend_name: Backend to compile for (if None, uses currently selected backend)
+            
+        Returns:
+            The compiled template, sharing this runner's transpile cache
+        """
+        backend = self._get_backend(backend_name)
+        return CompiledTemplate(circuit, backend, optimization_level, self.transpile_cache)
+    
+    def select_layouts(
+        self,
+        circuits: List[QuantumCircuit],
+        trials: int = 16,
+        optimization_level: int = 3,
+        backend_name: Optional[str] = None
+    ) -> List[LayoutSelection]:
+        """
+        Transpile circuits with many seeded layout/routing trials, scored on the backend's error map.
+        
+        Args:
+            circuits: Circuits to transpile
+            trials: Number of seeded trials per circuit
+            optimization_level: Transpilation optimization level (0-3)
+            backend_name: Backend to compile for (if None, uses currently selected backend)
             
+        Returns:
+            One selection per circuit; ``selection.circuit`` is the most likely to succeed
+        """
+        backend = self._get_backend(backend_name)
+        print(f"\nRunning {trials} layout trials for {len(circuits)} circuit(s) on {backend.name}...")
+        selections = select_layouts(circuits, backend, trials=trials, optimization_levels=(optimization_level,))
+        for index, selection in enumerate(selections):
+            print(f"Circuit {index}: estimated success probability {selection.best.success_probability:.3f} "
+                  f"(depth-only choice: {selection.min_depth.success_probability:.3f})")
+        return selections
+    
+    def run_template(
+        self,
+        template: CompiledTemplate,
+        values: Any,
+        shots: int = 1024
+    ) -> List[Any]:
+        """
+        Sample a compiled template over a parameter array without transpiling again.
+        
+        The parameter sets are flattened in row-major order and split into PUBs of
+        at most ``max_experiments`` sets, so a small sweep is a single PUB in a
+        single job and a large one is spread over as few jobs as possible.
+        
+        Args:
+            template: Template from ``compile_template``
+            values: Parameter values (see ``CompiledTemplate.values``)
+            shots: Shots per parameter set
+            
+        Returns:
+            One PUB result per chunk of parameter sets, in order
+        """
+        backend = template.backend
+        bound = template.values(values)
+        bound = bound.reshape(-1, bound.shape[-1])
+        chunk = self._max_experiments(backend)
+        pubs = [(template.compiled, bound[start:start + chunk], None) for start in range(0, len(bound), chunk)]
+        
+        try:
+            sampler = self.provider.sampler(backend)
+            batches = self._pack_pubs(pubs, chunk)
+            print(f"\nSubmitting {len(bound)} parameter sets as {len(pubs)} PUB(s) in {len(batches)} job(s) to {backend.name}...")
+            jobs = [sampler.run(batch, shots=shots) for batch in batches]
+            results = []
+            for job in jobs:
+                print(f"Job ID: {job.job_id()}")
+                results.extend(job.result())
+            return results
         except Exception as e:
             self._print_troubleshooting_info(e)
             raise
     
-    def calculate_bell_state_fidelity(self, counts: Dict[str, int]) -> float:
+    def estimate_observable(
+        self,
+        circuit: QuantumCircuit,
+        observable: Any,
+        shots: int = 4096,
+        optimization_level: int = 1,
+        qubit_wise: bool = True,
+        backend_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Estimate an observable from one batch of commuting-group measurement circuits.
+        
+        The observable's Pauli terms are grouped (see ``MeasurementPlan``), one
+        basis-rotation circuit per group is submitted through ``run_circuits``,
+        and every term is rebuilt from its group's shared counts.
+        
+        Args:
+            circuit: State preparation without final measurements
+            observable: ``SparsePauliOp`` (or ``PauliTable``) to estimate
+            shots: Shots per group circuit
+            optimization_level: Transpilation optimization level (0-3)
+            qubit_wise: Use qubit-wise instead of fully commuting groups
+            backend_name: Backend to use (if None, uses currently selected backend)
+            
+        Returns:
+            Dictionary with the expectation value, the per-term values and the number of circuits
+        """
+        plan = MeasurementPlan(observable, qubit_wise=qubit_wise)
+        print(f"\nMeasuring {len(plan.table)} Pauli terms with {plan.num_circuits} circuit(s)")
+        results = self.run_circuits(
+            plan.circuits(circuit),
+            shots=shots,
+            optimization_level=optimization_level,
+            backend_name=backend_name
+        )
+        samples = [self.get_shots(result, 'meas') for result in results]
+        return {
+            'expectation_value': plan.expectation_value(samples),
+            'term_values': plan.term_values(samples),
+            'num_circuits': plan.num_circuits
+        }
+    
+    def select_least_busy_backend(
+        self,
+        circuits: Union[QuantumCircuit, Sequence[QuantumCircuit]],
+        required_gates: Optional[Sequence[str]] = None
+    ) -> str:
+        """
+        Select the backend expected to run the given circuits soonest.
+        
+        Only operational backends with enough qubits are considered; among those, the
+        shortest queue wins, preferring backends that need no routing on ties.
+        
+        Args:
+            circuits: Circuit or circuits that will be run
+            required_gates: Gates that must be native to the backend
+            
+        Returns:
+            Name of the selected backend
+        """
+        if isinstance(circuits, QuantumCircuit):
+            circuits = [circuits]
+        candidates = self.scheduler.candidates_for(circuits, required_gates=required_gates)
+        if not candidates:
+            raise RuntimeError("No operational backend satisfies the circuit requirements")
+        self.select_backend(candidates[0].name)
+        return candidates[0].name
+    
+    def run_circuits_scheduled(
+        self,
+        pubs: Sequence[Union[QuantumCircuit, Tuple]],
+        shots: int = 1024,
+        optimization_level: int = 1,
+        max_backends: int = 1,
+        required_gates: Optional[Sequence[str]] = None
+    ) -> List[Any]:
+        """
+        Run a batch on the least loaded backends, optionally split across several of them.
+        
+        Args:
+            pubs: Circuits or (circuit, parameter_values, shots) tuples to run
+            shots: Default number of shots for PUBs that do not set their own
+            optimization_level: Transpilation optimization level (0-3)
+            max_backends: Maximum number of backends to spread the batch over
+            required_gates: Gates that must be native to the backend
+            
+        Returns:
+            List of per-PUB results, in the same order as ``pubs``
+        """
+        if not pubs:
+            return []
+        
+        normalized = [self._normalize_pub(pub) for pub in pubs]
+        candidates = self.scheduler.candidates_for(
+            [circuit for circuit, _, _ in normalized],
+            required_gates=required_gates
+        )
+        assignment = self.scheduler.split(len(normalized), candidates, max_backends=max_backends)
+        
+        groups: Dict[str, List[int]] = {}
+        for index, backend_name in enumerate(assignment):
+            groups.setdefault(backend_name, []).append(index)
+        
+        try:
+            submitted = [
+                (indices, self.submit_circuits(
+                    [normalized[i] for i in indices],
+                    shots=shots,
+                    optimization_level=optimization_level,
+                    backend_name=backend_name
+                ))
+                for backend_name, indices in groups.items()
+            ]
+            all_handles = [handle for _, handles in submitted for handle in handles]
+            job_results = run_sync(self._gather_results(all_handles))
+        except Exception as e:
+            self._print_troubleshooting_info(e)
+            raise
+        
+        results: List[Any] = [None] * len(normalized)
+        position = 0
+        for indices, handles in submitted:
+            group_results = []
+            for _ in handles:
+                group_results.extend(job_results[position])
+                position += 1
+            for index, result in zip(indices, group_results):
+                results[index] = result
+        return results
+    
+    def submit_circuit(
+        self,
+        circuit: QuantumCircuit,
+        shots: int = 1024,
+        optimization_level: int = 1,
+        backend_name: Optional[str] = None
+    ) -> JobHandle:
+        """
+        Transpile and submit a circuit without waiting for its result.
+        
+        Unlike ``run_circuit``, passing ``backend_name`` does not change the selected
+        backend, so submissions to several backends can be made concurrently.
+        
+        Args:
+            circuit: The quantum circuit to run
+            shots: Number of shots to execute
+            optimization_level: Transpilation optimization level (0-3)
+            backend_name: Backend to use (if None, uses currently selected backend)
+            
+        Returns:
+            Handle of the submitted job
+        """
+        backend = self._get_backend(backend_name)
+        transpiled_circuit = self._transpile([circuit], optimization_level, backend=backend)[0]
+        job = self.provider.sampler(backend).run([transpiled_circuit], shots=shots)
+        print(f"Submitted job {job.job_id()} to {backend.name}")
+        return JobHandle(job=job, backend_name=backend.name, num_pubs=1)
+    
+    async def wait_for(
+        self,
+        handle: JobHandle,
+        initial_delay: float = 1.0,
+        max_delay: float = 60.0,
+        backoff: float = 2.0
+    ) -> Any:
+        """
+        Poll a job with exponential backoff until it finishes, without blocking the event loop.
+        
+        Args:
+            handle: Handle returned by ``submit_circuit``
+            initial_delay: Seconds before the first status check
+            max_delay: Upper bound for the delay between status checks
+            backoff: Factor the delay grows by after each check
+            
+        Returns:
+            The job result
+        """
+        delay = initial_delay
+        while not await asyncio.to_thread(handle.job.in_final_state):
+            await asyncio.sleep(delay)
+            delay = min(delay * backoff, max_delay)
+        return await asyncio.to_thread(handle.job.result)
+    
+    async def as_completed(
+        self,
+        handles: Sequence[JobHandle],
+        **poll_options: float
+    ) -> AsyncIterator[Tuple[JobHandle, Any]]:
+        """
+        Yield (handle, result) pairs in the order the jobs finish.
+        
+        A job that fails yields its exception as the result instead of stopping
+        the iteration.
+        
+        Args:
+            handles: Handles returned by ``submit_circuit``
+            **poll_options: Polling options forwarded to ``wait_for``
+        """
+        async def wait(handle: JobHandle) -> Tuple[JobHandle, Any]:
+            try:
+                return handle, await self.wait_for(handle, **poll_options)
+            except Exception as e:
+                return handle, e
+        
+        for next_done in asyncio.as_completed([wait(handle) for handle in handles]):
+            yield await next_done
+    
+    async def run_on_backends_async(
+        self,
+        circuit: QuantumCircuit,
+        backend_names: Sequence[str],
+        shots: int = 1024,
+        optimization_level: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Submit the same circuit to several backends at once and collect every result.
+        
+        Args:
+            circuit: The quantum circuit to run
+            backend_names: Backends to run on, each at most once
+            shots: Number of shots to execute
+            optimization_level: Transpilation optimization level (0-3)
+            
+        Returns:
+            Dictionary mapping backend name to its result, or to the exception it raised
+            
+        Raises:
+            ValueError: If a backend name is repeated, since its results would overwrite each other
+        """
+        duplicates = sorted({name for name in backend_names if list(backend_names).count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate backend names: {', '.join(duplicates)}. Pass each backend once.")
+        results: Dict[str, Any] = {}
+        submissions = await asyncio.gather(
+            *[
+                asyncio.to_thread(self.submit_circuit, circuit, shots, optimization_level, name)
+                for name in backend_names
+            ],
+            return_exceptions=True
+        )
+        handles = []
+        requested: Dict[int, str] = {}
+        for name, submission in zip(backend_names, submissions):
+            if isinstance(submission, Exception):
+                results[name] = submission
+            else:
+                handles.append(submission)
+                requested[id(submission)] = name
+        
+        async for handle, result in self.as_completed(handles):
+            elapsed = time.monotonic() - handle.submitted_at
+            print(f"Job {handle.job_id} on {handle.backend_name} finished after {elapsed:.1f}s")
+            results[requested[id(handle)]] = result
+        
+        return {name: results[name] for name in backend_names}
+    
+    def run_on_backends(
+        self,
+        circuit: QuantumCircuit,
+        backend_names: Sequence[str],
+        shots: int = 1024,
+        optimization_level: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Blocking wrapper around ``run_on_backends_async``.
+        
+        The total wait is roughly that of the slowest backend instead of the sum
+        of all of them. Inside a running event loop (e.g. a notebook) the jobs are
+        awaited on a worker thread; ``await run_on_backends_async`` avoids blocking the loop.
+        """
+        return run_sync(self.run_on_backends_async(circuit, backend_names, shots, optimization_level))
+    
+    async def _gather_results(self, handles: Sequence[JobHandle]) -> List[Any]:
+        """Wait for every job concurrently and return the results in handle order."""
+        return await asyncio.gather(*[self.wait_for(handle) for handle in handles])
+    
+    @staticmethod
+    def get_counts(pub_result: Any, register: Optional[str] = None) -> Dict[str, int]:
+        """
+        Extract measurement counts from a sampler PUB result.
+        
+        Args:
+            pub_result: A single PUB result (e.g. ``result[0]``)
+            register: Classical register to read (if None, uses 'meas' when present,
+                otherwise all registers joined)
+            
+        Returns:
+            Measurement counts dictionary
+        """
+        data = pub_result.data
+        if register is None and hasattr(data, 'meas'):
+            register = 'meas'
+        if register is not None:
+            return getattr(data, register).get_counts()
+        return pub_result.join_data().get_counts()
+    
+    @staticmethod
+    def get_shots(pub_result: Any, register: Optional[str] = None) -> ShotArray:
+        """
+        Extract per-shot outcomes from a sampler PUB result as a bit-packed array.
+        
+        Args:
+            pub_result: A single PUB result (e.g. ``result[0]``)
+            register: Classical register to read (if None, uses 'meas' when present,
+                otherwise all registers joined)
+            
+        Returns:
+            Bit-packed shot array
+        """
+        data = pub_result.data
+        if register is None and hasattr(data, 'meas'):
+            register = 'meas'
+        if register is not None:
+            return ShotArray.from_bit_array(getattr(data, register))
+        return ShotArray.from_bit_array(pub_result.join_data())
+    
+    def _get_backend(self, backend_name: Optional[str] = None) -> Any:
+        """Resolve a backend by name without changing the selected backend."""
+        if backend_name:
+            if not self.service:
+                raise RuntimeError("Service not initialized")
+            return self.metadata.backend(backend_name)
+        if not self.backend:
+            raise RuntimeError("No backend selected. Use select_backend() first.")
+        return self.backend
+    
+    def _transpile(
+        self,
+        circuits: List[QuantumCircuit],
+        optimization_level: int,
+        backend: Optional[Any] = None
+    ) -> List[QuantumCircuit]:
+        """Transpile circuits for a backend (default: the selected one), reusing cached results."""
+        return self.transpile_cache.transpile(
+            circuits,
+            backend if backend is not None else self.backend,
+            optimization_level=optimization_level
+        )
+    
+    @staticmethod
+    def _normalize_pub(pub: Union[QuantumCircuit, Tuple]) -> Tuple[QuantumCircuit, Any, Optional[int]]:
+        """Coerce a circuit or PUB tuple into a (circuit, parameter_values, shots) triple."""
+        if isinstance(pub, QuantumCircuit):
+            return pub, None, None
+        if not isinstance(pub, tuple) or not 1 <= len(pub) <= 3:
+            raise ValueError(f"Invalid PUB: {pub!r}. Expected a circuit or (circuit, values, shots) tuple.")
+        circuit, values, pub_shots = tuple(pub) + (None,) * (3 - len(pub))
+        return circuit, values, pub_shots
+    
+    @staticmethod
+    def _pub_size(pub: Tuple[QuantumCircuit, Any, Optional[int]]) -> int:
+        """Number of circuit executions a PUB expands to once its parameters are bound."""
+        circuit, values, _ = pub
+        if values is None or circuit.num_parameters == 0:
+            return 1
+        shape = np.shape(values)
+        return int(np.prod(shape[:-1])) if len(shape) > 1 else 1
+    
+    @classmethod
+    def _pack_pubs(cls, pubs: List[Tuple], max_experiments: int) -> List[List[Tuple]]:
+        """Greedily split PUBs, in order, into batches of at most max_experiments executions."""
+        batches: List[List[Tuple]] = []
+        current: List[Tuple] = []
+        current_size = 0
+        for pub in pubs:
+            size = cls._pub_size(pub)
+            if current and current_size + size > max_experiments:
+                batches.append(current)
+                current, current_size = [], 0
+            current.append(pub)
+            current_size += size
+        if current:
+            batches.append(current)
+        return batches
+    
+    def _max_experiments(self, backend: Optional[Any] = None, default: int = 300) -> int:
+        """Maximum number of circuit executions a backend (default: the selected one) accepts per job."""
+        try:
+            max_experiments = self.metadata.configuration(backend or self.backend)['max_experiments']
+        except Exception:
+            max_experiments = None
+        return max_experiments or default
+    
+    def calculate_bell_state_fidelity(
+        self,
+        counts: Dict[str, int],
+        target_states: Sequence[str] = ('00', '11')
+    ) -> float:
         """
         Calculate Bell state fidelity from measurement counts.
         
         Args:
             counts: Measurement counts dictionary
+            target_states: Outcomes expected from the ideal state
             
         Returns:
             Fidelity percentage
         """
         total_shots = sum(counts.values())
-        bell_state_counts = counts.get('00', 0) + counts.get('11', 0)
-        fidelity = bell_state_counts / total_shots * 100
+        fidelity = population([counts], target_states)[0] * 100
         
         print(f"\nBell state fidelity: {fidelity:.1f}%")
-        print(f"Expected outcomes (00, 11): {bell_state_counts}/{total_shots}")
+        print(f"Expected outcomes ({', '.join(target_states)}): {round(fidelity * total_shots / 100)}/{total_shots}")
         
         return fidelity
     
+    def plot_counts(self, counts: Dict[str, int], title: Optional[str] = None) -> Any:
+        """
+        Plot measurement counts as a histogram.
+        
+        Matplotlib and the Qiskit visualization module are imported here rather than
+        at module load, so only callers that plot pay for them.
+        
+        Args:
+            counts: Measurement counts dictionary
+            title: Title for the histogram plot
+            
+        Returns:
+            The matplotlib figure
+        """
+        import matplotlib.pyplot as plt
+        from qiskit.visualization import plot_histogram
+        
+        figure = plot_histogram(counts, title=title)
+        plt.show()
+        return figure
+    
     def get_backend_info(self) -> Dict[str, Any]:
         """
         Get detailed information about the current backend.
@@ -182,22 +824,35 @@ class IBMQuantumRunner:
         if not self.backend:
             raise RuntimeError("No backend selected")
         
-        status = self.backend.status()
-        config = self.backend.configuration()
+        status = self.metadata.status(self.backend)
+        config = self.metadata.configuration(self.backend)
         
         info = {
             'name': self.backend.name,
-            'num_qubits': self.backend.num_qubits,
-            'status': status.status_msg,
-            'pending_jobs': getattr(status, 'pending_jobs', None),
-            'basis_gates': config.basis_gates,
-            'coupling_map': config.coupling_map,
-            'max_shots': config.max_shots,
-            'max_experiments': config.max_experiments
+            'num_qubits': config['num_qubits'],
+            'status': status['status_msg'],
+            'pending_jobs': status['pending_jobs'],
+            'basis_gates': config['basis_gates'],
+            'coupling_map': config['coupling_map'],
+            'max_shots': config['max_shots'],
+            'max_experiments': config['max_experiments']
         }
         
         return info
     
+    def refresh_backend_metadata(self, backend_name: Optional[str] = None, field: Optional[str] = None) -> None:
+        """
+        Drop cached backend metadata so the next call fetches it from the service.
+        
+        Args:
+            backend_name: Only refresh this backend (if None, all backends)
+            field: Only refresh this field ('backend', 'configuration', 'status'
+                or 'backends'; if None, all fields)
+        """
+        if not self.metadata:
+            raise RuntimeError("Service not initialized")
+        self.metadata.refresh(backend_name=backend_name, field=field)
+    
     def _print_troubleshooting_info(self, error: Exception) -> None:
         """Print troubleshooting information when errors occur."""
         print(f"Error: {error}")
@@ -0,0 +1,190 @@
+"""Measurement Planner - Estimate many Pauli observables from a few commuting-group circuits.
+
+An observable is split into groups of commuting Pauli terms with the greedy
+graph coloring of ``PauliTable``. Every group gets one circuit: the state
+preparation followed by a basis change that maps all of the group's terms to
+Z strings, then a measurement of every qubit. All group circuits go out as a
+single sampler batch, and every term's expectation value is rebuilt from its
+group's shared counts, so the number of circuits (and queue waits) drops by the
+grouping factor.
+
+Qubit-wise commuting groups only need single-qubit rotations (H for X, Sdg then
+H for Y). Fully commuting groups are larger but need a Clifford diagonalizing
+circuit with two-qubit gates.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Union
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import PauliList, SparsePauliOp, StabilizerState
+from quantum_studies.pauli_table import PauliTable
+from quantum_studies.shot_data import ShotArray, SparseCounts, unpack_bits
+
+SamplesLike = Union[Dict[str, int], SparseCounts, ShotArray]
+
+
+@dataclass
+class MeasurementGroup:
+    """A set of commuting terms measured together by one circuit."""
+    terms: np.ndarray
+    rotation: QuantumCircuit
+    diagonal: PauliTable
+
+
+def _independent_rows(symplectic: np.ndarray) -> List[int]:
+    """Indices of a maximal linearly independent (over GF(2)) subset of boolean rows."""
+    reduced = np.array(symplectic, dtype=bool)
+    pivots: List[int] = []
+    basis: List[np.ndarray] = []
+    columns: List[int] = []
+    for index, row in enumerate(reduced):
+        row = row.copy()
+        for vector, column in zip(basis, columns):
+            if row[column]:
+                row ^= vector
+        if row.any():
+            basis.append(row)
+            columns.append(int(np.argmax(row)))
+            pivots.append(index)
+    return pivots
+
+
+def _qubit_wise_group(table: PauliTable, terms: np.ndarray) -> MeasurementGroup:
+    """Single-qubit basis rotations mapping every term of a qubit-wise commuting group to a Z string."""
+    group = table[terms]
+    basis_x = np.bitwise_or.reduce(group.x, axis=0)[None]
+    basis_z = np.bitwise_or.reduce(group.z, axis=0)[None]
+    x_qubits = unpack_bits(basis_x, table.num_qubits)[0]
+    y_qubits = x_qubits & unpack_bits(basis_z, table.num_qubits)[0]
+    rotation = QuantumCircuit(table.num_qubits)
+    for qubit in np.flatnonzero(y_qubits):
+        rotation.sdg(int(qubit))
+    for qubit in np.flatnonzero(x_qubits):
+        rotation.h(int(qubit))
+    diagonal = PauliTable(np.zeros_like(group.x), group.support, table.num_qubits, group.phase, group.coeffs)
+    return MeasurementGroup(terms, rotation, diagonal)
+
+
+def _commuting_group(table: PauliTable, terms: np.ndarray) -> MeasurementGroup:
+    """Clifford rotation mapping every term of a commuting group to a signed Z string."""
+    group = table[terms]
+    n = table.num_qubits
+    symplectic = np.hstack([unpack_bits(group.x, n), unpack_bits(group.z, n)])
+    labels = PauliTable(group.x, group.z, n).to_labels()
+    generators = [labels[index] for index in _independent_rows(symplectic)]
+    if not generators:
+        # Only identity terms: nothing to rotate
+        return MeasurementGroup(terms, QuantumCircuit(n), group)
+    clifford = StabilizerState.from_stabilizer_list(generators, allow_underconstrained=True).clifford
+    # Pauli.evolve(C) is C^dagger P C: the term as seen after applying C^dagger to the state
+    evolved = PauliList(labels).evolve(clifford)
+    if evolved.x.any():
+        raise ValueError("Group terms do not commute")
+    diagonal = PauliTable.from_bool(evolved.x, evolved.z, evolved.phase + group.phase, group.coeffs)
+    return MeasurementGroup(terms, clifford.adjoint().to_circuit(), diagonal)
+
+
+class MeasurementPlan:
+    """Commuting groups of an observable, their measurement circuits and the estimator over their counts."""
+
+    def __init__(self, observable: Union[SparsePauliOp, PauliTable], qubit_wise: bool = True):
+        """
+        Group the terms of an observable.
+
+        Args:
+            observable: Observable to estimate
+            qubit_wise: Use qubit-wise commuting groups (single-qubit rotations only)
+                instead of fully commuting groups
+        """
+        self.table = observable if isinstance(observable, PauliTable) else PauliTable.from_sparse_pauli_op(observable)
+        self.qubit_wise = qubit_wise
+        if qubit_wise:
+            self.groups = [_qubit_wise_group(self.table, terms) for terms in self.table.group_qubit_wise_commuting()]
+        else:
+            self.groups = [_commuting_group(self.table, terms) for terms in self.table.group_commuting()]
+
+    @property
+    def num_circuits(self) -> int:
+        return len(self.groups)
+
+    @property
+    def grouping_factor(self) -> float:
+        """Terms per circuit, i.e. how many fewer circuits than one per term."""
+        return len(self.table) / max(self.num_circuits, 1)
+
+    def circuits(self, circuit: QuantumCircuit) -> List[QuantumCircuit]:
+        """
+        Measurement circuits of every group for a state preparation.
+
+        Args:
+            circuit: State preparation without final measurements
+
+        Returns:
+            One circuit per group, measuring every qubit into a 'meas' register
+        """
+        if circuit.num_qubits != self.table.num_qubits:
+            raise ValueError(f"Circuit has {circuit.num_qubits} qubits, observable {self.table.num_qubits}")
+        measured = []
+        for index, group in enumerate(self.groups):
+            group_circuit = circuit.compose(group.rotation)
+            group_circuit.measure_all()
+            group_circuit.name = f"{circuit.name}_group{index}"
+            measured.append(group_circuit)
+        return measured
+
+    def term_values(self, samples: Sequence[SamplesLike]) -> np.ndarray:
+        """
+        Expectation value of every term from the counts of the group circuits.
+
+        Args:
+            samples: Counts of each circuit from ``circuits``, in order
+
+        Returns:
+            Array of shape (num_terms,), coefficients not applied
+        """
+        if len(samples) != len(self.groups):
+            raise ValueError(f"Expected counts for {len(self.groups)} circuits, got {len(samples)}")
+        values = np.empty(len(self.table), dtype=complex)
+        for group, group_samples in zip(self.groups, samples):
+            values[group.terms] = group.diagonal.expectation_values_from_samples(group_samples)
+        return values.real if not (self.table.phase % 2).any() else values
+
+    def expectation_value(self, samples: Sequence[SamplesLike]) -> float:
+        """Expectation value of the whole observable from the counts of the group circuits."""
+        value = complex(self.table.coeffs @ self.term_values(samples))
+        return value.real if abs(value.imag) < 1e-12 else value
+
+
+def estimate_observable(
+    circuit: QuantumCircuit,
+    observable: Union[SparsePauliOp, PauliTable],
+    sampler: Any = None,
+    shots: int = 4096,
+    qubit_wise: bool = True
+) -> Dict[str, Any]:
+    """
+    Estimate an observable with one sampler batch of commuting-group circuits.
+
+    Args:
+        circuit: State preparation without final measurements
+        observable: Observable to estimate
+        sampler: SamplerV2-compatible primitive (if None, a ``StatevectorSampler``)
+        shots: Shots per group circuit
+        qubit_wise: Use qubit-wise instead of fully commuting groups
+
+    Returns:
+        Dictionary with the expectation value, the per-term values and the number of circuits
+    """
+    if sampler is None:
+        from qiskit.primitives import StatevectorSampler
+
+        sampler = StatevectorSampler()
+    plan = MeasurementPlan(observable, qubit_wise)
+    result = sampler.run(plan.circuits(circuit), shots=shots).result()
+    samples = [ShotArray.from_bit_array(pub_result.data.meas) for pub_result in result]
+    return {
+        'expectation_value': plan.expectation_value(samples),
+        'term_values': plan.term_values(samples),
+        'num_circuits': plan.num_circuits
+    }
@@ -0,0 +1,236 @@
+"""Noise Aware Layout - Pick layouts and routings by estimated success probability on a backend's error map.
+
+The preset pass managers choose between layout and routing trials by circuit
+size, so on a heterogeneous device the lowest-depth result can still land on
+the noisiest qubits and couplers. Here many seeded transpilations run in
+parallel through a ``TranspileService`` and each result is scored against the
+backend calibration data:
+
+    ESP = prod(1 - gate error) * prod(1 - readout error) * prod(idle fidelity)
+
+where the idle fidelity of a qubit waiting for time t is the average fidelity
+1/2 + exp(-t/T1)/6 + exp(-t/T2)/3 of the amplitude-damping and dephasing
+channel. Idle times come from an as-soon-as-possible schedule built from the
+calibrated gate durations. The trial with the highest ESP is kept.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.transpiler import Target
+from quantum_studies.transpile_service import TranspileService
+
+# Seconds per unit of a ``Delay`` instruction (besides 'dt')
+_TIME_UNITS = {'s': 1.0, 'ms': 1e-3, 'us': 1e-6, 'ns': 1e-9, 'ps': 1e-12}
+
+
+@dataclass
+class ErrorMap:
+    """Calibration data of a backend: gate errors and durations, readout errors, T1 and T2."""
+    num_qubits: int
+    gate_errors: Dict[Tuple[str, Tuple[int, ...]], float]
+    gate_durations: Dict[Tuple[str, Tuple[int, ...]], float]
+    readout_errors: np.ndarray
+    t1: np.ndarray
+    t2: np.ndarray
+    dt: Optional[float] = None
+
+    @classmethod
+    def from_target(cls, target: Target) -> "ErrorMap":
+        """
+        Read the calibration data of a transpiler ``Target``; missing values count as ideal.
+
+        Args:
+            target: Target with instruction properties and qubit properties
+
+        Returns:
+            The error map
+        """
+        gate_errors: Dict[Tuple[str, Tuple[int, ...]], float] = {}
+        gate_durations: Dict[Tuple[str, Tuple[int, ...]], float] = {}
+        for name in target.operation_names:
+            for qargs, properties in (target[name] or {}).items():
+                if qargs is None or properties is None:
+                    continue
+                if properties.error is not None:
+                    gate_errors[(name, qargs)] = properties.error
+                if properties.duration is not None:
+                    gate_durations[(name, qargs)] = properties.duration
+
+        n = target.num_qubits
+        readout_errors = np.array([gate_errors.get(('measure', (qubit,)), 0.0) for qubit in range(n)])
+        t1 = np.full(n, np.inf)
+        t2 = np.full(n, np.inf)
+        for qubit, properties in enumerate(target.qubit_properties or []):
+            if properties is not None:
+                t1[qubit] = properties.t1 or np.inf
+                t2[qubit] = properties.t2 or np.inf
+        return cls(n, gate_errors, gate_durations, readout_errors, t1, t2, target.dt)
+
+    @classmethod
+    def from_backend(cls, backend: Any) -> "ErrorMap":
+        """Read the calibration data of a BackendV2 through its ``target``."""
+        return cls.from_target(backend.target)
+
+    def _delay_seconds(self, operation: Any) -> float:
+        unit = getattr(operation, 'unit', 'dt')
+        if unit == 'dt':
+            return float(operation.duration) * (self.dt or 0.0)
+        return float(operation.duration) * _TIME_UNITS[unit]
+
+    def success_probability(self, circuit: QuantumCircuit) -> float:
+        """
+        Estimated success probability of a circuit transpiled for this backend.
+
+        Args:
+            circuit: Circuit over the backend's physical qubits
+
+        Returns:
+            The ESP, between 0 and 1
+        """
+        if circuit.num_qubits > self.num_qubits:
+            raise ValueError(f"Circuit has {circuit.num_qubits} qubits, backend {self.num_qubits}")
+        log_probability = 0.0
+        # As-soon-as-possible schedule: when each qubit is next free, its busy time and first use
+        free_at = np.zeros(self.num_qubits)
+        busy = np.zeros(self.num_qubits)
+        first_use = np.full(self.num_qubits, np.inf)
+        for instruction in circuit.data:
+            operation = instruction.operation
+            qubits = tuple(circuit.find_bit(qubit).index for qubit in instruction.qubits)
+            if not qubits:
+                continue
+            start = free_at[list(qubits)].max()
+            if operation.name == 'barrier':
+                free_at[list(qubits)] = start
+                continue
+            if operation.name == 'delay':
+                free_at[list(qubits)] = start + self._delay_seconds(operation)
+                continue
+            key = (operation.name, qubits)
+            log_probability += np.log1p(-min(self.gate_errors.get(key, 0.0), 1.0))
+            duration = self.gate_durations.get(key, 0.0)
+            free_at[list(qubits)] = start + duration
+            busy[list(qubits)] += duration
+            first_use[list(qubits)] = np.minimum(first_use[list(qubits)], start)
+
+        used = np.isfinite(first_use)
+        # A qubit idles between its first operation and the end of its last one
+        idle = np.clip(free_at[used] - first_use[used] - busy[used], 0, None)
+        idle_fidelity = 0.5 + np.exp(-idle / self.t1[used]) / 6 + np.exp(-idle / self.t2[used]) / 3
+        return float(np.exp(log_probability + np.log(idle_fidelity).sum()))
+
+
+@dataclass
+class LayoutTrial:
+    """One seeded transpilation of a circuit and its score."""
+    seed: int
+    optimization_level: int
+    circuit: QuantumCircuit
+    success_probability: float
+    layout: List[int]
+    two_qubit_gates: int
+    depth: int
+
+
+@dataclass
+class LayoutSelection:
+    """Every successful trial for one circuit, best estimated success probability first."""
+    trials: List[LayoutTrial]
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def best(self) -> LayoutTrial:
+        return self.trials[0]
+
+    @property
+    def circuit(self) -> QuantumCircuit:
+        return self.best.circuit
+
+    @property
+    def min_depth(self) -> LayoutTrial:
+        """The trial a depth-only choice would have kept, for comparison."""
+        return min(self.trials, key=lambda trial: (trial.depth, trial.two_qubit_gates, trial.seed))
+
+
+def _trial(result: Any, error_map: ErrorMap) -> LayoutTrial:
+    circuit = result.circuit
+    layout = circuit.layout.final_index_layout() if circuit.layout is not None else list(range(circuit.num_qubits))
+    return LayoutTrial(
+        seed=result.seed,
+        optimization_level=result.optimization_level,
+        circuit=circuit,
+        success_probability=error_map.success_probability(circuit),
+        layout=layout,
+        two_qubit_gates=sum(1 for instruction in circuit.data if instruction.operation.num_qubits == 2),
+        depth=circuit.depth()
+    )
+
+
+def select_layouts(
+    circuits: Sequence[QuantumCircuit],
+    backend: Any,
+    trials: int = 16,
+    optimization_levels: Sequence[int] = (3,),
+    seed: int = 0,
+    service: Optional[TranspileService] = None,
+    error_map: Optional[ErrorMap] = None,
+    max_workers: Optional[int] = None
+) -> List[LayoutSelection]:
+    """
+    Transpile every circuit with many seeds in parallel and keep the most likely to succeed.
+
+    Args:
+        circuits: Circuits to transpile
+        backend: BackendV2 to transpile for and score against
+        trials: Number of seeded layout/routing trials per circuit and optimization level
+        optimization_levels: Optimization levels to try
+        seed: First transpiler seed; trials use seed, seed + 1, ...
+        service: Service to run the trials on; it must know the backend by name
+            (if None, a temporary one)
+        error_map: Calibration data to score with (if None, read from the backend)
+        max_workers: Worker processes of the temporary service
+
+    Returns:
+        One selection per circuit, in order
+    """
+    error_map = error_map or ErrorMap.from_backend(backend)
+    seeds = range(seed, seed + trials)
+    own_service = service is None
+    if own_service:
+        service = TranspileService({backend.name: backend}, max_workers=max_workers)
+    elif backend.name not in service.targets:
+        raise ValueError(f"Service has no target named '{backend.name}'")
+
+    selections = [LayoutSelection([]) for _ in circuits]
+    try:
+        for result in service.stream(circuits, [backend.name], optimization_levels, seeds=seeds):
+            selection = selections[result.circuit_index]
+            if result.ok:
+                selection.trials.append(_trial(result, error_map))
+            else:
+                selection.errors.append(result.error)
+    finally:
+        if own_service:
+            service.close()
+
+    for index, selection in enumerate(selections):
+        if not selection.trials:
+            raise RuntimeError(f"Every trial of circuit {index} failed: {selection.errors[0]}")
+        selection.trials.sort(key=lambda trial: (-trial.success_probability, trial.two_qubit_gates, trial.seed))
+    return selections
+
+
+def select_layout(
+    circuit: QuantumCircuit,
+    backend: Any,
+    trials: int = 16,
+    optimization_levels: Sequence[int] = (3,),
+    seed: int = 0,
+    service: Optional[TranspileService] = None,
+    error_map: Optional[ErrorMap] = None,
+    max_workers: Optional[int] = None
+) -> LayoutSelection:
+    """Single-circuit form of ``select_layouts``."""
+    return select_layouts([circuit], backend, trials, optimization_levels, seed, service, error_map, max_workers)[0]
@@ -0,0 +1,345 @@
+"""Pauli Table - Bit-packed symplectic storage and algebra for large lists of Pauli operators.
+
+Every Pauli is stored as packed X and Z bit rows (qubit ``q`` in word ``q // 64``
+at bit ``q % 64``, the same layout as ``shot_data``) plus a phase exponent, so a
+10^5-term Hamiltonian on 50 qubits takes a few megabytes. Products, commutation,
+qubit-wise commuting grouping and expectation values all work on the packed
+words directly and never build a 2^n x 2^n matrix.
+
+Phases follow ``qiskit.quantum_info.Pauli.phase``: a row with phase ``q`` and
+label ``P`` is the operator (-i)^q P, where Y is the usual Pauli Y.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Union
+import numpy as np
+from qiskit.quantum_info import PauliList, SparsePauliOp
+from quantum_studies.shot_data import ShotArray, SparseCounts, as_sparse_counts, num_words, pack_bits, unpack_bits
+
+LABEL_PHASES = {'': 0, '-i': 1, '-': 2, 'i': 3}
+
+
+def pauli_product_phase(x1: np.ndarray, z1: np.ndarray, x2: np.ndarray, z2: np.ndarray) -> np.ndarray:
+    """
+    Exponent of i picked up when multiplying Pauli rows P1 · P2, summed over qubits.
+
+    Args:
+        x1, z1: Packed X/Z bits of the left factors (broadcastable against x2, z2)
+        x2, z2: Packed X/Z bits of the right factors, shape (..., words)
+
+    Returns:
+        Integer array over the leading dimensions
+    """
+    y1 = x1 & z1
+    only_x1 = x1 & ~z1
+    only_z1 = ~x1 & z1
+    plus = (y1 & z2 & ~x2) | (only_x1 & z2 & x2) | (only_z1 & x2 & ~z2)
+    minus = (y1 & x2 & ~z2) | (only_x1 & z2 & ~x2) | (only_z1 & x2 & z2)
+    return np.bitwise_count(plus).sum(axis=-1, dtype=np.int64) - np.bitwise_count(minus).sum(axis=-1, dtype=np.int64)
+
+
+def _parity(words: np.ndarray) -> np.ndarray:
+    """Parity of the set bits of every packed row."""
+    return (np.bitwise_count(words).sum(axis=-1, dtype=np.int64) & 1).astype(bool)
+
+
+def _walsh_hadamard(values: np.ndarray) -> np.ndarray:
+    """F[z] = sum_b values[b] (-1)^popcount(b & z), for a vector of length 2^n."""
+    out = np.array(values, copy=True)
+    size = len(out)
+    half = 1
+    while half < size:
+        blocks = out.reshape(-1, 2, half)
+        blocks[:] = np.stack([blocks[:, 0] + blocks[:, 1], blocks[:, 0] - blocks[:, 1]], axis=1)
+        half *= 2
+    return out
+
+
+class PauliTable:
+    """A list of weighted Pauli operators stored as packed symplectic bit rows."""
+
+    def __init__(
+        self,
+        x: np.ndarray,
+        z: np.ndarray,
+        num_qubits: int,
+        phase: Optional[np.ndarray] = None,
+        coeffs: Optional[np.ndarray] = None
+    ):
+        """
+        Initialize a Pauli table.
+
+        Args:
+            x: Packed X bits, shape (num_terms, num_words(num_qubits)) with dtype uint64
+            z: Packed Z bits, same shape as ``x``
+            num_qubits: Number of qubits
+            phase: Phase exponents q of (-i)^q (if None, all zero)
+            coeffs: Coefficient of every term (if None, all one)
+        """
+        self.x = np.asarray(x, dtype=np.uint64)
+        self.z = np.asarray(z, dtype=np.uint64)
+        self.num_qubits = num_qubits
+        terms = self.x.shape[0]
+        self.phase = np.zeros(terms, dtype=np.int64) if phase is None else np.asarray(phase, dtype=np.int64) % 4
+        self.coeffs = np.ones(terms, dtype=complex) if coeffs is None else np.asarray(coeffs, dtype=complex)
+
+    @classmethod
+    def from_bool(cls, x: np.ndarray, z: np.ndarray, phase: Optional[np.ndarray] = None, coeffs: Optional[np.ndarray] = None) -> "PauliTable":
+        """
+        Build a table from boolean symplectic arrays.
+
+        Args:
+            x: Boolean array of shape (num_terms, num_qubits), column ``q`` is qubit ``q``
+            z: Boolean array of the same shape
+            phase: Phase exponents q of (-i)^q
+            coeffs: Coefficient of every term
+
+        Returns:
+            The table
+        """
+        x, z = np.atleast_2d(x), np.atleast_2d(z)
+        return cls(pack_bits(x), pack_bits(z), x.shape[1], phase, coeffs)
+
+    @classmethod
+    def from_labels(cls, labels: Sequence[str], coeffs: Optional[Sequence[complex]] = None) -> "PauliTable":
+        """
+        Build a table from Pauli labels such as 'XIZ' or '-iYY'.
+
+        Args:
+            labels: Labels in Qiskit order (the rightmost character acts on qubit 0)
+            coeffs: Coefficient of every term
+
+        Returns:
+            The table
+        """
+        labels = list(labels)
+        phase = np.zeros(len(labels), dtype=np.int64)
+        if any(label[:1] not in 'IXYZ' for label in labels):
+            for index, label in enumerate(labels):
+                body = label.lstrip('-i')
+                phase[index] = LABEL_PHASES[label[:len(label) - len(body)]]
+                labels[index] = body
+        num_qubits = len(labels[0]) if labels else 0
+        chars = np.array(labels, dtype=f'S{max(num_qubits, 1)}').view(np.uint8).reshape(len(labels), -1)[:, ::-1]
+        x = (chars == ord('X')) | (chars == ord('Y'))
+        z = (chars == ord('Z')) | (chars == ord('Y'))
+        return cls.from_bool(x[:, :num_qubits], z[:, :num_qubits], phase, coeffs)
+
+    @classmethod
+    def from_sparse_pauli_op(cls, operator: SparsePauliOp) -> "PauliTable":
+        """Build a table from a ``SparsePauliOp`` (or a ``PauliList``, with unit coefficients)."""
+        paulis = operator.paulis if isinstance(operator, SparsePauliOp) else PauliList(operator)
+        coeffs = operator.coeffs if isinstance(operator, SparsePauliOp) else None
+        return cls.from_bool(paulis.x, paulis.z, paulis.phase, coeffs)
+
+    def to_sparse_pauli_op(self) -> SparsePauliOp:
+        """Convert to a ``SparsePauliOp``, folding phases into the coefficients."""
+        x = unpack_bits(self.x, self.num_qubits)
+        z = unpack_bits(self.z, self.num_qubits)
+        return SparsePauliOp(PauliList.from_symplectic(z, x, self.phase), self.coeffs.copy())
+
+    def to_labels(self) -> List[str]:
+        """Labels of every term, including phase prefixes."""
+        x = unpack_bits(self.x, self.num_qubits)[:, ::-1]
+        z = unpack_bits(self.z, self.num_qubits)[:, ::-1]
+        chars = np.choose(x + 2 * z, np.array([ord('I'), ord('X'), ord('Z'), ord('Y')], dtype=np.uint8))
+        bodies = np.ascontiguousarray(chars.astype(np.uint8)).view(f'S{max(self.num_qubits, 1)}').ravel().astype(str)
+        prefixes = {value: key for key, value in LABEL_PHASES.items()}
+        return [prefixes[int(q)] + body for q, body in zip(self.phase, bodies)]
+
+    def __len__(self) -> int:
+        return self.x.shape[0]
+
+    def __getitem__(self, index: Any) -> "PauliTable":
+        index = np.atleast_1d(np.arange(len(self))[index])
+        return PauliTable(self.x[index], self.z[index], self.num_qubits, self.phase[index], self.coeffs[index])
+
+    def __repr__(self) -> str:
+        return f"PauliTable(num_terms={len(self)}, num_qubits={self.num_qubits})"
+
+    @property
+    def support(self) -> np.ndarray:
+        """Packed mask of the qubits every term acts on non-trivially."""
+        return self.x | self.z
+
+    def weights(self) -> np.ndarray:
+        """Number of non-identity qubits of every term."""
+        return np.bitwise_count(self.support).sum(axis=1, dtype=np.int64)
+
+    def is_diagonal(self) -> np.ndarray:
+        """Whether every term is a product of I and Z only."""
+        return ~self.x.any(axis=1)
+
+    def dot(self, other: "PauliTable") -> "PauliTable":
+        """
+        Term-by-term products self[k] · other[k] (either table may have a single term), like ``PauliList.dot``.
+
+        Args:
+            other: Table of the right factors
+
+        Returns:
+            Table of the products, with phases and coefficients multiplied
+        """
+        phase = self.phase + other.phase - pauli_product_phase(self.x, self.z, other.x, other.z)
+        return PauliTable(self.x ^ other.x, self.z ^ other.z, self.num_qubits, phase, self.coeffs * other.coeffs)
+
+    def commutes(self, other: "PauliTable") -> np.ndarray:
+        """
+        Term-by-term commutation with another table (either may have a single term).
+
+        Args:
+            other: Table to compare against
+
+        Returns:
+            Boolean array, True where the terms commute
+        """
+        return ~_parity((self.x & other.z) ^ (self.z & other.x))
+
+    def qubit_wise_commutes(self, other: "PauliTable") -> np.ndarray:
+        """Term-by-term check that the terms agree on every qubit where both act non-trivially."""
+        overlap = self.support & other.support
+        return ~(((self.x ^ other.x) | (self.z ^ other.z)) & overlap).any(axis=-1)
+
+    def group_qubit_wise_commuting(self) -> List[np.ndarray]:
+        """
+        Partition the terms into qubit-wise commuting groups (greedy graph coloring).
+
+        Terms are visited heaviest first and placed in the first group whose
+        per-qubit measurement basis they agree with, so each check is a few word
+        operations against every open group rather than against every member
+        (O(num_terms * num_groups) overall).
+
+        Returns:
+            List of term-index arrays, one per group
+        """
+        capacity = 16
+        basis_x = np.zeros((capacity, self.x.shape[1]), dtype=np.uint64)
+        basis_z = np.zeros_like(basis_x)
+        members: List[List[int]] = []
+        for term in np.argsort(-self.weights(), kind='stable'):
+            x, z = self.x[term], self.z[term]
+            open_x, open_z = basis_x[:len(members)], basis_z[:len(members)]
+            conflicts = ((open_x ^ x) | (open_z ^ z)) & (open_x | open_z) & (x | z)
+            fits = np.flatnonzero(~conflicts.any(axis=1))
+            if len(fits):
+                group = int(fits[0])
+            else:
+                group = len(members)
+                members.append([])
+                if group == capacity:
+                    capacity *= 2
+                    basis_x = np.vstack([basis_x, np.zeros_like(basis_x)])
+                    basis_z = np.vstack([basis_z, np.zeros_like(basis_z)])
+            members[group].append(int(term))
+            basis_x[group] |= x
+            basis_z[group] |= z
+        return [np.sort(np.array(group, dtype=np.int64)) for group in members]
+
+    def group_commuting(self) -> List[np.ndarray]:
+        """
+        Partition the terms into fully commuting groups (greedy graph coloring).
+
+        Every term is checked against all terms placed so far, so this costs
+        O(num_terms^2) word operations; prefer ``group_qubit_wise_commuting``
+        for very large tables.
+
+        Returns:
+            List of term-index arrays, one per group
+        """
+        assigned = np.full(len(self), -1, dtype=np.int64)
+        order = np.argsort(-self.weights(), kind='stable')
+        num_groups = 0
+        for position, term in enumerate(order):
+            placed = order[:position]
+            anticommuting = placed[_parity((self.x[placed] & self.z[term]) ^ (self.z[placed] & self.x[term]))]
+            blocked = np.zeros(num_groups + 1, dtype=bool)
+            blocked[assigned[anticommuting]] = True
+            group = int(np.argmin(blocked))
+            assigned[term] = group
+            num_groups = max(num_groups, group + 1)
+        return [np.flatnonzero(assigned == group) for group in range(num_groups)]
+
+    def _phase_factors(self) -> np.ndarray:
+        """(-i)^q of every term."""
+        return (-1j) ** self.phase
+
+    @staticmethod
+    def _real_if_hermitian(values: np.ndarray, phase: np.ndarray) -> np.ndarray:
+        return values.real if not (phase % 2).any() else values
+
+    def expectation_values(self, state: Any) -> np.ndarray:
+        """
+        Expectation value <psi|P|psi> of every term (coefficients not applied).
+
+        Terms sharing an X part are evaluated together: with v[b] = conj(psi[b ^ x]) psi[b]
+        the expectation of every Z part is a Walsh-Hadamard coefficient of v.
+
+        Args:
+            state: Statevector (``qiskit.quantum_info.Statevector`` or array of length 2^n)
+
+        Returns:
+            Array of shape (num_terms,), real when every term is Hermitian
+        """
+        psi = np.asarray(getattr(state, 'data', state), dtype=complex)
+        if len(psi) != 2 ** self.num_qubits:
+            raise ValueError(f"Statevector must have {2 ** self.num_qubits} amplitudes")
+        if self.num_qubits > 64:
+            raise ValueError("Statevectors are limited to 64 qubits")
+        basis = np.arange(len(psi), dtype=np.uint64)
+        x_ints, z_ints = self.x[:, 0], self.z[:, 0]
+        values = np.empty(len(self), dtype=complex)
+        unique_x, inverse = np.unique(x_ints, return_inverse=True)
+        for index, x in enumerate(unique_x):
+            terms = np.flatnonzero(inverse == index)
+            overlap = np.conj(psi[basis ^ x]) * psi
+            if len(terms) > self.num_qubits:
+                values[terms] = _walsh_hadamard(overlap)[z_ints[terms].astype(np.int64)]
+            else:
+                for term in terms:
+                    signs = 1 - 2 * (np.bitwise_count(basis & z_ints[term]) & 1).astype(np.int64)
+                    values[term] = overlap @ signs
+        # Y = i X Z on every qubit where both bits are set
+        num_y = np.bitwise_count(self.x & self.z).sum(axis=1, dtype=np.int64)
+        values *= self._phase_factors() * 1j ** num_y
+        return self._real_if_hermitian(values, self.phase)
+
+    def expectation_values_from_samples(
+        self,
+        samples: Union[Dict[str, int], SparseCounts, ShotArray],
+        terms: Optional[Sequence[int]] = None,
+        chunk_size: int = 4096
+    ) -> np.ndarray:
+        """
+        Expectation value of terms estimated from measured bitstrings.
+
+        Every term's qubits must have been measured in that term's own basis:
+        the computational basis for diagonal terms, or after the basis rotation
+        of a qubit-wise commuting group. Clbit ``q`` holds qubit ``q``.
+
+        Args:
+            samples: Counts dictionary, sparse counts or shot array
+            terms: Indices of the terms to estimate (if None, all of them)
+            chunk_size: Number of terms evaluated per vectorized pass
+
+        Returns:
+            Array of shape (len(terms),), real when every term is Hermitian
+        """
+        counts = as_sparse_counts(samples)
+        terms = np.arange(len(self)) if terms is None else np.asarray(terms, dtype=np.int64)
+        words = num_words(self.num_qubits)
+        outcomes = np.zeros((len(counts), words), dtype=np.uint64)
+        width = min(words, counts.outcomes.shape[1])
+        outcomes[:, :width] = counts.outcomes[:, :width]
+        probabilities = counts.probabilities()
+
+        values = np.empty(len(terms), dtype=complex)
+        for start in range(0, len(terms), chunk_size):
+            chunk = terms[start:start + chunk_size]
+            odd = _parity(outcomes[None, :, :] & self.support[chunk][:, None, :])
+            values[start:start + len(chunk)] = (1 - 2 * odd.astype(np.int64)) @ probabilities
+        phase = self.phase[terms]
+        values *= (-1j) ** phase
+        return self._real_if_hermitian(values, phase)
+
+    def expectation_value(self, state: Any) -> complex:
+        """Expectation value of the weighted sum of all terms in a statevector."""
+        return complex(self.coeffs @ self.expectation_values(state))
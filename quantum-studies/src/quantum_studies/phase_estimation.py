@@ -0,0 +1,120 @@
+"""Phase Estimation - Closed-form QPE outcome probabilities and parameter-swept QPE circuits.
+
+For an eigenphase θ and t precision qubits (N = 2^t), textbook QPE measures
+outcome j with probability
+
+    P(j | θ) = | sin(N π δ) / (N sin(π δ)) |^2,   δ = θ - j / N,
+
+so a whole (θ × outcome) table is one broadcast NumPy expression. On the circuit
+side, θ is a ``Parameter``: the circuit is built (and transpiled) once and a
+whole array of θ values is submitted as a single Sampler PUB.
+"""
+
+from math import pi
+from typing import Any, Optional, Sequence, Tuple
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import QFTGate
+from quantum_studies.shot_data import ShotArray
+
+
+def outcome_probabilities(
+    thetas: Sequence[float],
+    num_precision_qubits: int,
+    outcomes: Optional[Sequence[int]] = None
+) -> np.ndarray:
+    """
+    Compute QPE outcome probabilities for many phases at once.
+
+    Args:
+        thetas: Eigenphases θ (in turns, i.e. the eigenvalue is e^{2πiθ})
+        num_precision_qubits: Number of precision qubits t
+        outcomes: Outcome integers to include (if None, all 2^t outcomes)
+
+    Returns:
+        Array of shape (len(thetas), len(outcomes)); with all outcomes, every row sums to 1
+    """
+    size = 2 ** num_precision_qubits
+    thetas = np.asarray(thetas, dtype=float)
+    outcomes = np.arange(size) if outcomes is None else np.asarray(outcomes)
+    delta = thetas[:, None] - outcomes[None, :] / size
+    # P is 1-periodic in δ; folding into [-1/2, 1/2) keeps sin(πδ) away from its other zeros
+    delta -= np.round(delta)
+    denominator = size * np.sin(pi * delta)
+    exact = np.abs(denominator) < 1e-12
+    amplitude = np.sin(size * pi * delta) / np.where(exact, 1.0, denominator)
+    return np.where(exact, 1.0, amplitude ** 2)
+
+
+def phase_estimation_circuit(num_precision_qubits: int, theta: Optional[float] = None) -> QuantumCircuit:
+    """
+    Create a QPE circuit for the phase gate P(2πθ) acting on its eigenstate |1>.
+
+    Args:
+        num_precision_qubits: Number of precision qubits t
+        theta: Eigenphase in turns (if None, the circuit keeps a free ``theta`` parameter)
+
+    Returns:
+        Circuit with t + 1 qubits measuring the precision register into register 'c'
+    """
+    phase = Parameter('theta') if theta is None else theta
+    qc = QuantumCircuit(num_precision_qubits + 1, num_precision_qubits)
+
+    qc.x(num_precision_qubits)
+    qc.h(range(num_precision_qubits))
+    for qubit in range(num_precision_qubits):
+        qc.cp(2 * pi * phase * (2 ** qubit), qubit, num_precision_qubits)
+
+    qc.append(QFTGate(num_precision_qubits).inverse(), range(num_precision_qubits))
+    qc.measure(range(num_precision_qubits), range(num_precision_qubits))
+    return qc
+
+
+def sweep_pub(circuit: QuantumCircuit, thetas: Sequence[float], shots: Optional[int] = None) -> Tuple:
+    """
+    Build one Sampler PUB that runs a parameterized QPE circuit for every θ.
+
+    Args:
+        circuit: Circuit from ``phase_estimation_circuit`` without a fixed θ (possibly transpiled)
+        thetas: Eigenphases to sweep
+        shots: Shots per θ (if None, the sampler default)
+
+    Returns:
+        PUB tuple ``(circuit, values)`` or ``(circuit, values, shots)``
+    """
+    values = np.asarray(thetas, dtype=float).reshape(-1, 1)
+    return (circuit, values) if shots is None else (circuit, values, shots)
+
+
+def sweep_counts(pub_result: Any, num_precision_qubits: int, register: str = 'c') -> np.ndarray:
+    """
+    Tabulate the outcomes of a θ-sweep PUB.
+
+    Args:
+        pub_result: Sampler result of a PUB from ``sweep_pub``
+        num_precision_qubits: Number of precision qubits t
+        register: Classical register holding the precision bits
+
+    Returns:
+        Integer array of shape (len(thetas), 2^t) with the count of every outcome per θ
+    """
+    bit_array = getattr(pub_result.data, register)
+    size = 2 ** num_precision_qubits
+    num_thetas = int(np.prod(bit_array.shape))
+    outcomes = ShotArray.from_bit_array(bit_array).words[:, 0].astype(np.int64)
+    rows = np.repeat(np.arange(num_thetas), bit_array.num_shots)
+    return np.bincount(rows * size + outcomes, minlength=num_thetas * size).reshape(num_thetas, size)
+
+
+def estimates(table: np.ndarray) -> np.ndarray:
+    """
+    Most likely phase estimate j / 2^t for every row of a probability or counts table.
+
+    Args:
+        table: Array of shape (len(thetas), 2^t)
+
+    Returns:
+        Array of estimated phases in [0, 1)
+    """
+    return np.argmax(table, axis=-1) / table.shape[-1]
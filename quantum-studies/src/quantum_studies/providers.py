@@ -0,0 +1,183 @@
+"""Runtime Providers - Pluggable sources of backends and samplers for IBMQuantumRunner.
+
+``IBMRuntimeProvider`` talks to IBM Quantum through ``QiskitRuntimeService``.
+``LocalRuntimeProvider`` serves the fake backends shipped with qiskit-ibm-runtime,
+simulates them with Aer and adds an artificial queue latency, so the runner can
+be exercised and benchmarked without network access.
+"""
+
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Sequence
+
+
+class RuntimeProvider(ABC):
+    """Interface the runner uses to list backends and create samplers."""
+
+    @abstractmethod
+    def backends(self, simulator: bool = False, operational: bool = True, min_num_qubits: int = 1) -> List:
+        """
+        List available backends.
+
+        Args:
+            simulator: Whether to include simulators
+            operational: Only list operational backends
+            min_num_qubits: Minimum number of qubits required
+
+        Returns:
+            List of backends
+        """
+
+    @abstractmethod
+    def backend(self, name: str) -> Any:
+        """
+        Get a backend by name.
+
+        Args:
+            name: Name of the backend
+
+        Returns:
+            The backend object
+        """
+
+    @abstractmethod
+    def sampler(self, backend: Any) -> Any:
+        """
+        Create a sampler primitive bound to a backend.
+
+        Args:
+            backend: The backend object
+
+        Returns:
+            Object with a SamplerV2-compatible ``run(pubs, shots=...)`` method
+        """
+
+
+class IBMRuntimeProvider(RuntimeProvider):
+    """Provider backed by IBM Quantum's QiskitRuntimeService."""
+
+    def __init__(self, channel: str = "ibm_quantum_platform"):
+        """
+        Initialize the IBM runtime provider.
+
+        Args:
+            channel: IBM Quantum channel ('ibm_quantum_platform' or 'ibm_cloud')
+        """
+        from qiskit_ibm_runtime import QiskitRuntimeService
+
+        self.channel = channel
+        self.service = QiskitRuntimeService(channel=channel)
+
+    def backends(self, simulator: bool = False, operational: bool = True, min_num_qubits: int = 1) -> List:
+        return self.service.backends(
+            simulator=simulator,
+            operational=operational,
+            min_num_qubits=min_num_qubits
+        )
+
+    def backend(self, name: str) -> Any:
+        return self.service.backend(name)
+
+    def sampler(self, backend: Any) -> Any:
+        from qiskit_ibm_runtime import SamplerV2
+
+        return SamplerV2(backend)
+
+
+class LocalJob:
+    """A locally simulated job that only reports completion after a simulated queue wait."""
+
+    def __init__(self, job: Any, ready_at: float):
+        """
+        Initialize the local job.
+
+        Args:
+            job: The underlying (already running) primitive job
+            ready_at: ``time.monotonic()`` value before which the job looks queued
+        """
+        self._job = job
+        self._ready_at = ready_at
+        self._job_id = str(uuid.uuid4())
+
+    def job_id(self) -> str:
+        return self._job_id
+
+    def status(self) -> str:
+        if time.monotonic() < self._ready_at:
+            return "QUEUED"
+        return "DONE" if self._job.done() else "RUNNING"
+
+    def done(self) -> bool:
+        return time.monotonic() >= self._ready_at and self._job.done()
+
+    def in_final_state(self) -> bool:
+        return time.monotonic() >= self._ready_at and self._job.in_final_state()
+
+    def result(self) -> Any:
+        delay = self._ready_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        return self._job.result()
+
+
+class LocalSampler:
+    """SamplerV2 stand-in that simulates a fake backend locally and delays completion."""
+
+    def __init__(self, provider: "LocalRuntimeProvider", backend: Any):
+        """
+        Initialize the local sampler.
+
+        Args:
+            provider: The provider owning the simulated queues
+            backend: The fake backend to simulate
+        """
+        self.provider = provider
+        self.backend = backend
+
+    def run(self, pubs: Sequence[Any], shots: Optional[int] = None) -> LocalJob:
+        from qiskit_ibm_runtime import SamplerV2
+
+        job = SamplerV2(self.backend).run(pubs, shots=shots)
+        return LocalJob(job, self.provider._enqueue(self.backend.name))
+
+
+class LocalRuntimeProvider(RuntimeProvider):
+    """Offline provider serving qiskit-ibm-runtime fake backends with simulated queue latency."""
+
+    def __init__(self, backends: Optional[Sequence[Any]] = None, queue_latency: float = 0.0):
+        """
+        Initialize the local runtime provider.
+
+        Args:
+            backends: Fake backend instances to serve (if None, a few small fake devices)
+            queue_latency: Simulated seconds every job waits in its backend's queue.
+                Jobs on the same backend queue up one after another.
+        """
+        if backends is None:
+            from qiskit_ibm_runtime.fake_provider import FakeLimaV2, FakeManilaV2, FakeSantiagoV2
+
+            backends = [FakeSantiagoV2(), FakeManilaV2(), FakeLimaV2()]
+        self._backends = {backend.name: backend for backend in backends}
+        self.queue_latency = queue_latency
+        self._queue_free_at = {name: 0.0 for name in self._backends}
+        self._lock = threading.Lock()
+
+    def backends(self, simulator: bool = False, operational: bool = True, min_num_qubits: int = 1) -> List:
+        return [backend for backend in self._backends.values() if backend.num_qubits >= min_num_qubits]
+
+    def backend(self, name: str) -> Any:
+        if name not in self._backends:
+            raise ValueError(f"Unknown local backend '{name}'. Available: {', '.join(self._backends)}")
+        return self._backends[name]
+
+    def sampler(self, backend: Any) -> LocalSampler:
+        return LocalSampler(self, backend)
+
+    def _enqueue(self, backend_name: str) -> float:
+        """Reserve the next slot of a backend's simulated queue and return when it completes."""
+        with self._lock:
+            ready_at = max(time.monotonic(), self._queue_free_at[backend_name]) + self.queue_latency
+            self._queue_free_at[backend_name] = ready_at
+        return ready_at
@@ -23,4 +23,19 @@ print("X-Gate Fidelity differing to X-Gate by Global Phase:", fidelity)
 # Create a noisy channel 
 noisy_channel = Operator(XGate().to_matrix() * 0.9 + numpy.eye(2) * 0.1)
 fidelity_noisy = average_gate_fidelity(channel=noisy_channel, target=x_gate)
-print("Fidelity of Noisy Channel compared to Ideal X-Gate:", fidelity_noisy)
\ No newline at end of file
+print("Fidelity of Noisy Channel compared to Ideal X-Gate:", fidelity_noisy)
+
+# Batched comparison: many channels against the target gate in one vectorized pass
+from quantum_studies.gate_fidelity import choi_from_unitaries, gate_fidelities
+
+x_matrix = XGate().to_matrix()
+phases = numpy.linspace(0, 2 * numpy.pi, 8)
+phased = gate_fidelities(numpy.exp(1j * phases)[:, None, None] * x_matrix, x_matrix)
+print("Average gate fidelities of globally phased X gates:", numpy.round(phased['average_gate_fidelity'], 4))
+
+# Choi matrices of X gates that are skipped with probability p
+skip = numpy.linspace(0, 0.2, 5)
+choi_x, choi_id = choi_from_unitaries(numpy.stack([x_matrix, numpy.eye(2)]))
+noisy = gate_fidelities((1 - skip)[:, None, None] * choi_x + skip[:, None, None] * choi_id, x_matrix, rep='choi')
+print("Average gate fidelities of noisy X channels:", numpy.round(noisy['average_gate_fidelity'], 4))
+print("Diamond-norm bounds of noisy X channels:", numpy.round(noisy['diamond_norm_bound'], 4))
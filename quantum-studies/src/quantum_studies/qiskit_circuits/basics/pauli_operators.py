@@ -40,3 +40,19 @@ print("Are symplectic and label matrices equal?", np.allclose(p2_matrix, label_o
 # Let's use a sparse matrix representation
 p2_sparse = p2.to_matrix(sparse=True)  # Convert to sparse matrix representation
 print("Sparse matrix representation of the Pauli operator:\n", p2_sparse)
+
+# For large Hamiltonians, keep the Paulis bit-packed and never build a matrix
+from qiskit.quantum_info import Statevector
+from quantum_studies.pauli_table import PauliTable
+
+table = PauliTable.from_labels(["ZZI", "IZZ", "XXI", "IXX", "YIY"], coeffs=[1.0, 1.0, 0.5, 0.5, 0.25])
+print("Packed labels:", table.to_labels())
+print("Qubit-wise commuting groups:", [table[group].to_labels() for group in table.group_qubit_wise_commuting()])
+print("ZZI·XXI =", table[0].dot(table[2]).to_labels()[0])
+ghz_circuit = QuantumCircuit(3)
+ghz_circuit.h(0)
+ghz_circuit.cx(0, 1)
+ghz_circuit.cx(1, 2)
+ghz = Statevector(ghz_circuit)
+print("Per-term <GHZ|P|GHZ>:", table.expectation_values(ghz))
+print("Energy:", table.expectation_value(ghz).real)
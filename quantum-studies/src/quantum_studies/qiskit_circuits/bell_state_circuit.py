@@ -1,6 +1,5 @@
 from qiskit import QuantumCircuit
-from qiskit.providers.aer import AerSimulator
-from qiskit import transpile
+from quantum_studies.stabilizer import run_circuit
 
 # Create a quantum circuit with 2 qubits and 2 classical bits
 qc = QuantumCircuit(2, 2)
@@ -18,11 +17,6 @@ qc.measure(1, 1)
 # Visualize the circuit
 print(qc.draw())
 
-simulator = AerSimulator()
-compiled_circuit = transpile(qc, simulator)
-
-job = simulator.run(compiled_circuit, shots=1024)
-result = job.result()
-
-counts = result.get_counts()
+# Bell circuits are Clifford, so this runs on the stabilizer simulator
+counts = run_circuit(qc, shots=1024).get_counts()
 print("Measurement results:", counts)
\ No newline at end of file
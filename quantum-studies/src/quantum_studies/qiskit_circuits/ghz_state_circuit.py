@@ -1,5 +1,5 @@
-from qiskit import QuantumCircuit, execute
-from qiskit.providers.aer import Aer
+from qiskit import QuantumCircuit
+from quantum_studies.stabilizer import run_circuit
 
 
 # Create a 3-qubit, 3-classical bit circuit
@@ -26,8 +26,18 @@ qc.measure(2, 2)
 # Visualize the circuit
 print(qc.draw())
 
-# Simulate the circuit
-qasm_simulator = Aer.get_backend('qasm_simulator')
-result = execute(qc, shots=1024, backend=qasm_simulator).result()
-counts = result.get_counts()
+# Simulate the circuit (GHZ circuits are Clifford, so this uses the stabilizer simulator)
+counts = run_circuit(qc, shots=1024).get_counts()
 print("Measurement results:", counts)
+
+# The stabilizer simulator needs no 2^n statevector, so large GHZ states are cheap
+num_qubits = 1000
+large_ghz = QuantumCircuit(num_qubits, num_qubits)
+large_ghz.h(0)
+for qubit in range(1, num_qubits):
+    large_ghz.cx(qubit - 1, qubit)
+large_ghz.measure(range(num_qubits), range(num_qubits))
+
+large_counts = run_circuit(large_ghz, shots=1024).get_counts()
+fidelity = (large_counts.get('0' * num_qubits, 0) + large_counts.get('1' * num_qubits, 0)) / 1024
+print(f"{num_qubits}-qubit GHZ population in |0...0> and |1...1>:", fidelity)
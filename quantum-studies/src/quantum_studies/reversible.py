@@ -0,0 +1,183 @@
+"""Reversible Simulator - Evaluate X/CX/CCX/MCX/SWAP circuits on computational-basis states.
+
+Circuits made only of classical reversible gates map basis states to basis states,
+so there is no need for a 2^n statevector. States are stored like ``ShotArray``
+rows (qubit ``i`` is bit ``i % 64`` of word ``i // 64``) and every gate is applied
+to a whole batch of states with a few NumPy bit operations.
+
+For exhaustive checks over millions of inputs, ``run_planes`` uses the transposed
+(bit-sliced) layout instead: one row of words per qubit, each bit a separate
+basis state, so one word operation advances 64 states at once.
+"""
+
+from typing import Iterable, List, Sequence, Tuple
+import numpy as np
+from qiskit import QuantumCircuit
+from quantum_studies.shot_data import WORD_BITS, num_words
+
+# Measuring a basis state does not change it, so measurements are skipped as well
+IGNORED_OPERATIONS = {'barrier', 'id', 'delay', 'measure'}
+CONTROLLED_X = {'cx', 'ccx', 'mcx', 'mcx_gray', 'mcx_recursive', 'mcx_vchain', 'c3x', 'c4x'}
+
+
+class NonReversibleCircuitError(ValueError):
+    """Raised when a circuit contains operations that are not classical reversible gates."""
+
+
+def _flatten(circuit: QuantumCircuit, qubit_map: Sequence[int]) -> Iterable[Tuple[str, List[int], int]]:
+    """Yield (kind, qubits, ctrl_state) for every gate, expanding custom gates into their definitions."""
+    for instruction in circuit.data:
+        operation = instruction.operation
+        qubits = [qubit_map[circuit.find_bit(qubit).index] for qubit in instruction.qubits]
+        name = operation.name
+        if name in IGNORED_OPERATIONS:
+            continue
+        if name == 'x':
+            yield 'x', qubits, 0
+        elif name in CONTROLLED_X:
+            num_controls = getattr(operation, 'num_ctrl_qubits', len(qubits) - 1)
+            # MCX variants may carry ancillas after the target; they are untouched
+            control_qubits = qubits[:num_controls]
+            target = qubits[num_controls]
+            yield 'cx', control_qubits + [target], getattr(operation, 'ctrl_state', (1 << num_controls) - 1)
+        elif name == 'swap':
+            yield 'swap', qubits, 0
+        elif operation.definition is not None and not instruction.clbits:
+            yield from _flatten(operation.definition, qubits)
+        else:
+            raise NonReversibleCircuitError(f"Operation '{name}' is not a classical reversible gate")
+
+
+def is_reversible_classical(circuit: QuantumCircuit) -> bool:
+    """Whether a circuit only contains X, multi-controlled X and SWAP gates (after expansion)."""
+    try:
+        for _ in _flatten(circuit, range(circuit.num_qubits)):
+            pass
+    except NonReversibleCircuitError:
+        return False
+    return True
+
+
+def is_affine(circuit: QuantumCircuit) -> bool:
+    """Whether a circuit only contains X, single-control CX and SWAP gates, i.e. computes x -> A·x ⊕ b."""
+    try:
+        return all(kind != 'cx' or len(qubits) == 2 for kind, qubits, _ in _flatten(circuit, range(circuit.num_qubits)))
+    except NonReversibleCircuitError:
+        return False
+
+
+def ints_to_states(values: Iterable[int], num_qubits: int) -> np.ndarray:
+    """
+    Pack Python integers (of any width) into state rows.
+
+    Args:
+        values: Basis-state integers, bit ``i`` being qubit ``i``
+        num_qubits: Number of qubits of the circuit
+
+    Returns:
+        Array of shape (len(values), num_words(num_qubits)) with dtype uint64
+    """
+    values = list(values)
+    words = num_words(num_qubits)
+    states = np.zeros((len(values), words), dtype=np.uint64)
+    mask = (1 << WORD_BITS) - 1
+    for word in range(words):
+        states[:, word] = [(value >> (word * WORD_BITS)) & mask for value in values]
+    return states
+
+
+def states_to_ints(states: np.ndarray) -> List[int]:
+    """Unpack state rows into Python integers."""
+    values = [0] * states.shape[0]
+    for word in range(states.shape[1] - 1, -1, -1):
+        column = states[:, word].tolist()
+        values = [(value << WORD_BITS) | part for value, part in zip(values, column)]
+    return values
+
+
+class ReversibleSimulator:
+    """A reversible circuit compiled once into word/bit masks and applied to batches of basis states."""
+
+    def __init__(self, circuit: QuantumCircuit):
+        """
+        Compile a circuit for classical simulation.
+
+        Args:
+            circuit: Circuit made of X, multi-controlled X and SWAP gates (custom gates
+                built from those are expanded)
+
+        Raises:
+            NonReversibleCircuitError: If the circuit contains any other operation
+        """
+        self.num_qubits = circuit.num_qubits
+        self.num_words = num_words(circuit.num_qubits)
+        self._program = [
+            (kind, [divmod(qubit, WORD_BITS) for qubit in qubits], ctrl_state)
+            for kind, qubits, ctrl_state in _flatten(circuit, range(circuit.num_qubits))
+        ]
+
+    def __len__(self) -> int:
+        return len(self._program)
+
+    def run(self, states: np.ndarray) -> np.ndarray:
+        """
+        Apply the circuit to a batch of basis states.
+
+        Args:
+            states: Array of shape (batch, num_words) with dtype uint64 (see ``ints_to_states``)
+
+        Returns:
+            New array with the output basis states
+        """
+        states = np.array(states, dtype=np.uint64, copy=True).reshape(-1, self.num_words)
+        one = np.uint64(1)
+        for kind, locations, ctrl_state in self._program:
+            if kind == 'x':
+                word, offset = locations[0]
+                states[:, word] ^= one << np.uint64(offset)
+            elif kind == 'cx':
+                *controls, (word, offset) = locations
+                active = np.ones(states.shape[0], dtype=np.uint64)
+                for index, (control_word, control_offset) in enumerate(controls):
+                    bit = (states[:, control_word] >> np.uint64(control_offset)) & one
+                    if not (ctrl_state >> index) & 1:
+                        bit ^= one
+                    active &= bit
+                states[:, word] ^= active << np.uint64(offset)
+            else:
+                (word_a, offset_a), (word_b, offset_b) = locations
+                diff = ((states[:, word_a] >> np.uint64(offset_a)) ^ (states[:, word_b] >> np.uint64(offset_b))) & one
+                states[:, word_a] ^= diff << np.uint64(offset_a)
+                states[:, word_b] ^= diff << np.uint64(offset_b)
+        return states
+
+    def run_planes(self, planes: np.ndarray) -> np.ndarray:
+        """
+        Apply the circuit to basis states in bit-sliced layout.
+
+        Args:
+            planes: Array of shape (num_qubits, lanes) with dtype uint64; bit ``k`` of
+                ``planes[q, w]`` is qubit ``q`` of basis state ``64 * w + k``
+
+        Returns:
+            New array with the output planes
+        """
+        planes = np.array(planes, dtype=np.uint64, copy=True)
+        ones = np.uint64(0xFFFFFFFFFFFFFFFF)
+        for kind, locations, ctrl_state in self._program:
+            qubits = [word * WORD_BITS + offset for word, offset in locations]
+            if kind == 'x':
+                planes[qubits[0]] ^= ones
+            elif kind == 'cx':
+                *controls, target = qubits
+                active = planes[controls[0]] if ctrl_state & 1 else ~planes[controls[0]]
+                for index, control in enumerate(controls[1:], start=1):
+                    active = active & (planes[control] if (ctrl_state >> index) & 1 else ~planes[control])
+                planes[target] ^= active
+            else:
+                planes[qubits] = planes[qubits[::-1]]
+        return planes
+
+    def run_ints(self, values: Iterable[int]) -> List[int]:
+        """Apply the circuit to basis states given as Python integers."""
+        return states_to_ints(self.run(ints_to_states(values, self.num_qubits)))
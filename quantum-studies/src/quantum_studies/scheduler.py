@@ -0,0 +1,179 @@
+"""Queue-Aware Scheduler - Pick the backends expected to finish a workload first."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from qiskit import QuantumCircuit
+
+
+@dataclass
+class BackendCandidate:
+    """A backend able to run a workload, with its expected wait."""
+
+    name: str
+    num_qubits: int
+    pending_jobs: int
+    basis_gates: Optional[List[str]]
+    queue_seconds: float
+    needs_routing: bool = False
+
+
+def interaction_degree(circuit: QuantumCircuit) -> int:
+    """
+    Largest number of distinct partners any qubit interacts with through multi-qubit gates.
+
+    Args:
+        circuit: The circuit to inspect
+
+    Returns:
+        Maximum degree of the circuit's qubit interaction graph
+    """
+    partners: Dict[int, set] = {}
+    for instruction in circuit.data:
+        if instruction.operation.name == 'barrier' or len(instruction.qubits) < 2:
+            continue
+        indices = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
+        for index in indices:
+            partners.setdefault(index, set()).update(i for i in indices if i != index)
+    return max((len(p) for p in partners.values()), default=0)
+
+
+def coupling_degree(coupling_map: Optional[Iterable[Sequence[int]]]) -> int:
+    """
+    Largest number of neighbours any physical qubit has in a coupling map.
+
+    Args:
+        coupling_map: List of [control, target] edges (None means all-to-all)
+
+    Returns:
+        Maximum qubit degree, or a very large number for all-to-all connectivity
+    """
+    if coupling_map is None:
+        return 1 << 30
+    neighbours: Dict[int, set] = {}
+    for a, b in coupling_map:
+        neighbours.setdefault(a, set()).add(b)
+        neighbours.setdefault(b, set()).add(a)
+    return max((len(n) for n in neighbours.values()), default=0)
+
+
+class QueueAwareScheduler:
+    """Rank backends by expected completion time and split batches across them."""
+
+    def __init__(
+        self,
+        metadata: Any,
+        seconds_per_queued_job: float = 120.0,
+        seconds_per_circuit: float = 2.0
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            metadata: A BackendMetadataCache used for listings, configuration and status
+            seconds_per_queued_job: Estimated time each job already in a queue takes
+            seconds_per_circuit: Estimated execution time of one of our circuits
+        """
+        self.metadata = metadata
+        self.seconds_per_queued_job = seconds_per_queued_job
+        self.seconds_per_circuit = seconds_per_circuit
+
+    def candidates(
+        self,
+        num_qubits: int,
+        min_degree: int = 0,
+        required_gates: Optional[Iterable[str]] = None
+    ) -> List[BackendCandidate]:
+        """
+        List operational backends able to run a workload, shortest expected wait first.
+
+        Routing inserts SWAPs, so any backend with enough qubits can run the circuits;
+        a coupling map sparser than ``min_degree`` only costs extra gates. Such backends
+        are kept and ranked after equally loaded ones that need no routing.
+
+        Args:
+            num_qubits: Number of qubits the circuits use
+            min_degree: Connectivity a qubit would need to avoid routing (see ``interaction_degree``)
+            required_gates: Gates that must be native to the backend
+
+        Returns:
+            Sorted list of backend candidates
+        """
+        backends = self.metadata.backends(min_qubits=num_qubits, operational_only=True)
+        statuses = self.metadata.statuses(backends)
+        required = set(required_gates or ())
+
+        candidates = []
+        for backend in backends:
+            config = self.metadata.configuration(backend)
+            status = statuses[backend.name]
+            if status['operational'] is False:
+                continue
+            if required and not required.issubset(config['basis_gates'] or ()):
+                continue
+            pending_jobs = status['pending_jobs'] or 0
+            candidates.append(BackendCandidate(
+                name=backend.name,
+                num_qubits=config['num_qubits'],
+                pending_jobs=pending_jobs,
+                basis_gates=config['basis_gates'],
+                queue_seconds=pending_jobs * self.seconds_per_queued_job,
+                needs_routing=coupling_degree(config['coupling_map']) < min_degree
+            ))
+
+        # Shortest queue first; on ties prefer no routing, then smaller devices to leave large ones free
+        candidates.sort(key=lambda c: (c.queue_seconds, c.needs_routing, c.num_qubits))
+        return candidates
+
+    def candidates_for(
+        self,
+        circuits: Sequence[QuantumCircuit],
+        required_gates: Optional[Iterable[str]] = None
+    ) -> List[BackendCandidate]:
+        """
+        List backends able to run every circuit of a batch, shortest expected wait first.
+
+        Args:
+            circuits: The circuits to run
+            required_gates: Gates that must be native to the backend
+
+        Returns:
+            Sorted list of backend candidates
+        """
+        return self.candidates(
+            num_qubits=max(circuit.num_qubits for circuit in circuits),
+            min_degree=max(interaction_degree(circuit) for circuit in circuits),
+            required_gates=required_gates
+        )
+
+    def split(
+        self,
+        num_circuits: int,
+        candidates: Sequence[BackendCandidate],
+        max_backends: int = 1
+    ) -> List[str]:
+        """
+        Assign each circuit of a batch to a backend, minimizing the latest completion time.
+
+        Circuits are placed one at a time on the backend whose queue wait plus already
+        assigned work finishes first, considering only the ``max_backends`` backends
+        with the shortest queues.
+
+        Args:
+            num_circuits: Number of circuits in the batch
+            candidates: Backend candidates, shortest expected wait first
+            max_backends: Maximum number of backends to spread the batch over
+
+        Returns:
+            Backend name for every circuit, in batch order
+        """
+        if not candidates:
+            raise RuntimeError("No backend satisfies the circuit requirements")
+
+        chosen = candidates[:max(1, max_backends)]
+        finish = [candidate.queue_seconds for candidate in chosen]
+        assignment = []
+        for _ in range(num_circuits):
+            index = min(range(len(chosen)), key=lambda i: finish[i] + self.seconds_per_circuit)
+            finish[index] += self.seconds_per_circuit
+            assignment.append(chosen[index].name)
+        return assignment
@@ -0,0 +1,355 @@
+"""Shot Data - Bit-packed storage for per-shot outcomes and sparse counts.
+
+Outcomes are stored as rows of uint64 words, one word per 64 classical bits.
+Classical bit ``i`` lives in word ``i // 64`` at bit position ``i % 64``, so a
+register of up to 64 bits is simply its integer value. Bitstrings follow the
+Qiskit convention: the leftmost character is the highest classical bit.
+"""
+
+from typing import Any, Dict, Optional, Sequence, Union
+import numpy as np
+
+WORD_BITS = 64
+
+
+def num_words(num_bits: int) -> int:
+    """Number of uint64 words needed to hold ``num_bits`` bits."""
+    return max(1, -(-num_bits // WORD_BITS))
+
+
+def pack_bits(bits: np.ndarray) -> np.ndarray:
+    """
+    Pack a boolean matrix into uint64 words.
+
+    Args:
+        bits: Array of shape (rows, num_bits) where column ``i`` is classical bit ``i``
+
+    Returns:
+        Array of shape (rows, num_words(num_bits)) with dtype uint64
+    """
+    bits = np.asarray(bits, dtype=bool)
+    rows, width = bits.shape
+    packed = np.packbits(bits, axis=-1, bitorder='little')
+    padded = np.zeros((rows, num_words(width) * 8), dtype=np.uint8)
+    padded[:, :packed.shape[1]] = packed
+    return padded.view('<u8').astype(np.uint64, copy=False)
+
+
+def unique_rows(words: np.ndarray, return_inverse: bool = False, return_counts: bool = False):
+    """
+    ``np.unique`` over packed rows, using the fast 1-D path for registers of up to 64 bits.
+
+    Args:
+        words: Array of shape (rows, num_words) with dtype uint64
+        return_inverse: Also return the index of every input row in the unique rows
+        return_counts: Also return how often every unique row occurs
+
+    Returns:
+        Unique rows of shape (k, num_words), followed by the requested extras
+    """
+    if words.shape[1] == 1:
+        result = np.unique(words[:, 0], return_inverse=return_inverse, return_counts=return_counts)
+        if not (return_inverse or return_counts):
+            return result[:, None]
+        return (result[0][:, None],) + tuple(np.ravel(extra) for extra in result[1:])
+    result = np.unique(words, axis=0, return_inverse=return_inverse, return_counts=return_counts)
+    if not (return_inverse or return_counts):
+        return result
+    return (result[0],) + tuple(np.ravel(extra) for extra in result[1:])
+
+
+def unpack_bits(words: np.ndarray, num_bits: int) -> np.ndarray:
+    """
+    Unpack uint64 words into a boolean matrix.
+
+    Args:
+        words: Array of shape (rows, num_words) with dtype uint64
+        num_bits: Number of meaningful bits per row
+
+    Returns:
+        Array of shape (rows, num_bits) where column ``i`` is classical bit ``i``
+    """
+    words = np.ascontiguousarray(words, dtype='<u8')
+    as_bytes = words.view(np.uint8).reshape(words.shape[0], -1)
+    return np.unpackbits(as_bytes, axis=-1, bitorder='little')[:, :num_bits].astype(bool)
+
+
+def extract_bits(words: np.ndarray, indices: Sequence[int]) -> np.ndarray:
+    """
+    Read selected bits of every row without unpacking the whole register.
+
+    Args:
+        words: Array of shape (rows, num_words) with dtype uint64
+        indices: Classical bit indices to read
+
+    Returns:
+        Boolean array of shape (rows, len(indices))
+    """
+    out = np.empty((words.shape[0], len(indices)), dtype=bool)
+    for column, index in enumerate(indices):
+        word, offset = divmod(index, WORD_BITS)
+        out[:, column] = (words[:, word] >> np.uint64(offset)) & np.uint64(1)
+    return out
+
+
+def pack_bitstrings(bitstrings: Sequence[str], num_bits: Optional[int] = None) -> np.ndarray:
+    """
+    Pack Qiskit-style bitstrings (spaces between registers allowed) into uint64 words.
+
+    Args:
+        bitstrings: Bitstrings, leftmost character being the highest classical bit
+        num_bits: Register width (if None, inferred from the first bitstring)
+
+    Returns:
+        Array of shape (len(bitstrings), num_words(num_bits)) with dtype uint64
+    """
+    if len(bitstrings) and ' ' in bitstrings[0]:
+        bitstrings = [bitstring.replace(' ', '') for bitstring in bitstrings]
+    if num_bits is None:
+        num_bits = len(bitstrings[0]) if len(bitstrings) else 0
+    if num_bits == 0:
+        return np.zeros((len(bitstrings), 1), dtype=np.uint64)
+    chars = np.array(bitstrings, dtype=f'S{num_bits}').view(np.uint8).reshape(len(bitstrings), num_bits)
+    return pack_bits(chars[:, ::-1] == ord('1'))
+
+
+def format_bitstrings(words: np.ndarray, num_bits: int) -> np.ndarray:
+    """
+    Format packed rows as Qiskit-style bitstrings.
+
+    Args:
+        words: Array of shape (rows, num_words) with dtype uint64
+        num_bits: Number of meaningful bits per row
+
+    Returns:
+        Array of Python strings, one per row
+    """
+    if num_bits == 0:
+        return np.array([''] * words.shape[0], dtype=object)
+    bits = unpack_bits(words, num_bits)[:, ::-1]
+    chars = np.where(bits, ord('1'), ord('0')).astype(np.uint8)
+    return np.ascontiguousarray(chars).view(f'S{num_bits}').ravel().astype(str)
+
+
+class SparseCounts:
+    """Counts over distinct outcomes, stored as unique packed rows plus their frequencies."""
+
+    def __init__(self, outcomes: np.ndarray, counts: np.ndarray, num_bits: int):
+        """
+        Initialize sparse counts.
+
+        Args:
+            outcomes: Array of shape (k, num_words) with dtype uint64, one row per outcome
+            counts: Array of shape (k,) with the number of shots of each outcome
+            num_bits: Register width
+        """
+        self.outcomes = np.asarray(outcomes, dtype=np.uint64)
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.num_bits = num_bits
+
+    @classmethod
+    def from_dict(cls, counts: Dict[str, int], num_bits: Optional[int] = None) -> "SparseCounts":
+        """
+        Build sparse counts from a Qiskit counts dictionary.
+
+        Args:
+            counts: Dictionary mapping bitstrings to shot counts
+            num_bits: Register width (if None, inferred from the keys)
+
+        Returns:
+            Sparse counts
+        """
+        keys = [key.replace(' ', '') for key in counts]
+        if num_bits is None:
+            num_bits = max((len(key) for key in keys), default=0)
+        outcomes = pack_bitstrings([key.zfill(num_bits) for key in keys], num_bits)
+        return cls._merged(outcomes, np.fromiter(counts.values(), dtype=np.int64, count=len(keys)), num_bits)
+
+    @classmethod
+    def _merged(cls, outcomes: np.ndarray, counts: np.ndarray, num_bits: int) -> "SparseCounts":
+        """Build sparse counts, summing the counts of duplicate outcome rows."""
+        if len(outcomes) == 0:
+            return cls(np.zeros((0, num_words(num_bits)), dtype=np.uint64), np.zeros(0, dtype=np.int64), num_bits)
+        unique, inverse = unique_rows(outcomes, return_inverse=True)
+        merged = np.bincount(inverse, weights=counts, minlength=len(unique)).astype(np.int64)
+        return cls(unique, merged, num_bits)
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert to a Qiskit counts dictionary."""
+        keys = format_bitstrings(self.outcomes, self.num_bits)
+        return dict(zip(keys.tolist(), self.counts.tolist()))
+
+    @property
+    def shots(self) -> int:
+        """Total number of shots."""
+        return int(self.counts.sum())
+
+    def probabilities(self) -> np.ndarray:
+        """Relative frequency of every stored outcome."""
+        total = self.shots
+        return self.counts / total if total else np.zeros(len(self.counts))
+
+    def bits(self, indices: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Boolean matrix of the stored outcomes.
+
+        Args:
+            indices: Classical bits to read (if None, all of them)
+
+        Returns:
+            Boolean array of shape (k, len(indices))
+        """
+        if indices is None:
+            return unpack_bits(self.outcomes, self.num_bits)
+        return extract_bits(self.outcomes, indices)
+
+    def marginal(self, indices: Sequence[int]) -> "SparseCounts":
+        """
+        Marginalize onto a subset of classical bits.
+
+        Args:
+            indices: Classical bits to keep; bit ``j`` of the result is bit ``indices[j]``
+
+        Returns:
+            Sparse counts over the kept bits
+        """
+        return self._merged(pack_bits(self.bits(indices)), self.counts, len(indices))
+
+    def filter(self, mask: np.ndarray) -> "SparseCounts":
+        """
+        Keep only the outcomes selected by a boolean mask.
+
+        Args:
+            mask: Boolean array of shape (k,)
+
+        Returns:
+            Filtered sparse counts
+        """
+        mask = np.asarray(mask, dtype=bool)
+        return SparseCounts(self.outcomes[mask], self.counts[mask], self.num_bits)
+
+    def select(self, conditions: Dict[int, int]) -> "SparseCounts":
+        """
+        Keep only the outcomes whose given bits have the given values (post-selection).
+
+        Args:
+            conditions: Dictionary mapping classical bit index to required value (0 or 1)
+
+        Returns:
+            Filtered sparse counts
+        """
+        indices = list(conditions)
+        wanted = np.array([bool(conditions[index]) for index in indices])
+        return self.filter(np.all(self.bits(indices) == wanted, axis=1))
+
+    def to_ints(self) -> np.ndarray:
+        """Outcomes as integers; only available for registers of at most 64 bits."""
+        if self.num_bits > WORD_BITS:
+            raise ValueError(f"Cannot represent {self.num_bits}-bit outcomes as uint64")
+        return self.outcomes[:, 0].copy()
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __repr__(self) -> str:
+        return f"SparseCounts(outcomes={len(self)}, shots={self.shots}, num_bits={self.num_bits})"
+
+
+class ShotArray:
+    """Per-shot outcomes stored as a bit-packed (num_shots, num_words) uint64 array."""
+
+    def __init__(self, words: np.ndarray, num_bits: int):
+        """
+        Initialize a shot array.
+
+        Args:
+            words: Array of shape (num_shots, num_words(num_bits)) with dtype uint64
+            num_bits: Register width
+        """
+        self.words = np.asarray(words, dtype=np.uint64)
+        self.num_bits = num_bits
+
+    @classmethod
+    def from_bool(cls, bits: np.ndarray) -> "ShotArray":
+        """Build from a boolean (num_shots, num_bits) matrix, column ``i`` being classical bit ``i``."""
+        bits = np.asarray(bits, dtype=bool)
+        return cls(pack_bits(bits), bits.shape[1])
+
+    @classmethod
+    def from_memory(cls, memory: Sequence[str]) -> "ShotArray":
+        """Build from Qiskit shot memory (a list of bitstrings)."""
+        words = pack_bitstrings(memory)
+        num_bits = len(memory[0].replace(' ', '')) if len(memory) else 0
+        return cls(words, num_bits)
+
+    @classmethod
+    def from_bit_array(cls, bit_array: Any) -> "ShotArray":
+        """
+        Build from a Qiskit ``BitArray`` (e.g. ``pub_result.data.meas``).
+
+        Leading parameter-sweep dimensions are flattened into the shot axis.
+        """
+        num_bits = bit_array.num_bits
+        raw = np.asarray(bit_array.array, dtype=np.uint8)
+        raw = raw.reshape(-1, raw.shape[-1])
+        # BitArray bytes are big-endian: the last bit of the last byte is clbit 0
+        bits = np.unpackbits(raw, axis=-1)[:, raw.shape[-1] * 8 - num_bits:][:, ::-1]
+        return cls(pack_bits(bits), num_bits)
+
+    @property
+    def num_shots(self) -> int:
+        return self.words.shape[0]
+
+    def to_bool(self) -> np.ndarray:
+        """Boolean (num_shots, num_bits) matrix, column ``i`` being classical bit ``i``."""
+        return unpack_bits(self.words, self.num_bits)
+
+    def to_memory(self) -> list:
+        """Convert to Qiskit shot memory (a list of bitstrings)."""
+        return format_bitstrings(self.words, self.num_bits).tolist()
+
+    def bits(self, indices: Sequence[int]) -> np.ndarray:
+        """Boolean (num_shots, len(indices)) matrix of selected classical bits."""
+        return extract_bits(self.words, indices)
+
+    def marginal(self, indices: Sequence[int]) -> "ShotArray":
+        """
+        Keep a subset of classical bits for every shot.
+
+        Args:
+            indices: Classical bits to keep; bit ``j`` of the result is bit ``indices[j]``
+
+        Returns:
+            Shot array over the kept bits
+        """
+        return ShotArray(pack_bits(self.bits(indices)), len(indices))
+
+    def filter(self, mask: np.ndarray) -> "ShotArray":
+        """Keep only the shots selected by a boolean mask of shape (num_shots,)."""
+        return ShotArray(self.words[np.asarray(mask, dtype=bool)], self.num_bits)
+
+    def counts(self) -> SparseCounts:
+        """Aggregate the shots into sparse counts."""
+        if self.num_shots == 0:
+            return SparseCounts._merged(self.words, np.zeros(0, dtype=np.int64), self.num_bits)
+        unique, counts = unique_rows(self.words, return_counts=True)
+        return SparseCounts(unique, counts, self.num_bits)
+
+    def get_counts(self) -> Dict[str, int]:
+        """Counts as a Qiskit counts dictionary."""
+        return self.counts().to_dict()
+
+    def __len__(self) -> int:
+        return self.num_shots
+
+    def __repr__(self) -> str:
+        return f"ShotArray(num_shots={self.num_shots}, num_bits={self.num_bits})"
+
+
+def as_sparse_counts(data: Union[Dict[str, int], SparseCounts, ShotArray]) -> SparseCounts:
+    """Coerce a counts dictionary, sparse counts or shot array into sparse counts."""
+    if isinstance(data, SparseCounts):
+        return data
+    if isinstance(data, ShotArray):
+        return data.counts()
+    return SparseCounts.from_dict(data)
@@ -0,0 +1,383 @@
+"""Simon's Algorithm - Classical post-processing over GF(2).
+
+Measured strings ``y`` satisfy ``y·s = 0 (mod 2)`` for the secret ``s``. Instead of
+testing all 2^n candidate secrets, equations are kept as packed integers in
+reduced row-echelon form and the secret is read off the nullspace, which costs
+O(n^2) word operations per equation. ``GF2System`` accepts equations one at a
+time, so sampling can stop as soon as rank n-1 is reached.
+
+Oracles built from X/CX/CCX gates are classical reversible functions, so
+``SimonOracleFunction`` evaluates them on packed basis states instead of a
+2^(2n) statevector, which makes instances with 30+ input qubits checkable.
+"""
+
+from typing import Callable, Iterable, List, Optional, Sequence
+import numpy as np
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from quantum_studies.reversible import ReversibleSimulator, is_affine
+from quantum_studies.shot_data import ShotArray, extract_bits, pack_bits
+
+
+def bitstring_to_int(bitstring: str) -> int:
+    """Pack a bitstring into an integer (leftmost character is the most significant bit)."""
+    return int(bitstring.replace(' ', ''), 2) if bitstring else 0
+
+
+def int_to_bitstring(value: int, num_bits: int) -> str:
+    """Format an integer as a bitstring of ``num_bits`` characters."""
+    return format(value, f'0{num_bits}b')
+
+
+def gf2_dot(a: int, b: int) -> int:
+    """Binary dot product of two packed bit rows."""
+    return (a & b).bit_count() & 1
+
+
+class GF2System:
+    """An online system of homogeneous linear equations y·s = 0 over GF(2)."""
+
+    def __init__(self, num_bits: int):
+        """
+        Initialize an empty system.
+
+        Args:
+            num_bits: Number of unknown bits (the secret length n)
+        """
+        self.num_bits = num_bits
+        # Reduced row-echelon form: pivot bit -> row whose highest set bit is the pivot,
+        # with the pivot cleared from every other row
+        self._rows: dict = {}
+
+    @property
+    def rank(self) -> int:
+        """Number of linearly independent equations collected so far."""
+        return len(self._rows)
+
+    def is_determined(self) -> bool:
+        """Whether the equations pin a non-zero secret down to a single candidate (rank n-1)."""
+        return self.rank >= self.num_bits - 1
+
+    def add(self, equation: "int | str") -> bool:
+        """
+        Add an equation y·s = 0.
+
+        Args:
+            equation: The measured string y, as a bitstring or packed integer
+
+        Returns:
+            True if the equation increased the rank, False if it was redundant
+        """
+        row = bitstring_to_int(equation) if isinstance(equation, str) else int(equation)
+        for pivot, pivot_row in self._rows.items():
+            if row >> pivot & 1:
+                row ^= pivot_row
+        if row == 0:
+            return False
+
+        pivot = row.bit_length() - 1
+        for other_pivot, other_row in self._rows.items():
+            if other_row >> pivot & 1:
+                self._rows[other_pivot] = other_row ^ row
+        self._rows[pivot] = row
+        return True
+
+    def extend(self, equations: Iterable["int | str"]) -> int:
+        """
+        Add many equations.
+
+        Returns:
+            Number of equations that increased the rank
+        """
+        return sum(self.add(equation) for equation in equations)
+
+    def nullspace(self) -> List[int]:
+        """
+        Basis of the solutions s of every collected equation.
+
+        Returns:
+            Packed integers spanning the nullspace (one per free bit)
+        """
+        basis = []
+        for free in range(self.num_bits):
+            if free in self._rows:
+                continue
+            solution = 1 << free
+            for pivot, row in self._rows.items():
+                if row >> free & 1:
+                    solution |= 1 << pivot
+            basis.append(solution)
+        return basis
+
+    def solutions(self, max_solutions: Optional[int] = None) -> List[int]:
+        """
+        Every non-zero solution, i.e. all non-trivial combinations of the nullspace basis.
+
+        Args:
+            max_solutions: Stop after this many solutions (the count doubles with every
+                missing equation)
+
+        Returns:
+            Packed integers of the candidate secrets
+        """
+        basis = self.nullspace()
+        found = []
+        for mask in range(1, 1 << len(basis)):
+            if max_solutions is not None and len(found) >= max_solutions:
+                break
+            solution = 0
+            for index, vector in enumerate(basis):
+                if mask >> index & 1:
+                    solution ^= vector
+            found.append(solution)
+        return sorted(found)
+
+    def secret(self) -> Optional[str]:
+        """The unique non-zero secret, or None while the system is underdetermined."""
+        basis = self.nullspace()
+        if len(basis) != 1:
+            return None
+        return int_to_bitstring(basis[0], self.num_bits)
+
+
+def solve_linear_system_gf2(equations: List[str]) -> List[str]:
+    """
+    Solve the system of linear equations y·s = 0 over GF(2).
+
+    Drop-in replacement for the brute-force solver of the Simon notebook.
+
+    Args:
+        equations: Measured bitstrings y, all of the same length
+
+    Returns:
+        All non-zero candidate secrets as bitstrings
+    """
+    if not equations:
+        return []
+
+    n = len(equations[0])
+    system = GF2System(n)
+    system.extend(equations)
+    return [int_to_bitstring(solution, n) for solution in system.solutions()]
+
+
+def gf2_nullspace(rows: np.ndarray) -> np.ndarray:
+    """
+    Nullspace of a dense GF(2) matrix via vectorized Gaussian elimination.
+
+    Useful when many equations arrive at once: each pivot step XORs the pivot row
+    into all other rows with a single NumPy operation.
+
+    Args:
+        rows: Boolean array of shape (num_equations, n); column ``j`` is bit ``j`` of y
+            counted from the least significant end
+
+    Returns:
+        Boolean array of shape (n - rank, n) whose rows span the nullspace
+    """
+    matrix = np.array(rows, dtype=bool, copy=True)
+    num_rows, n = matrix.shape
+    pivot_columns = []
+    rank = 0
+    for column in range(n):
+        if rank == num_rows:
+            break
+        candidates = np.flatnonzero(matrix[rank:, column])
+        if candidates.size == 0:
+            continue
+        pivot = rank + candidates[0]
+        if pivot != rank:
+            matrix[[rank, pivot]] = matrix[[pivot, rank]]
+        others = matrix[:, column].copy()
+        others[rank] = False
+        matrix[others] ^= matrix[rank]
+        pivot_columns.append(column)
+        rank += 1
+
+    free_columns = [column for column in range(n) if column not in set(pivot_columns)]
+    basis = np.zeros((len(free_columns), n), dtype=bool)
+    for index, free in enumerate(free_columns):
+        basis[index, free] = True
+        for row, pivot in enumerate(pivot_columns):
+            basis[index, pivot] = matrix[row, free]
+    return basis
+
+
+def sample_until_determined(
+    sample: Callable[[int], Sequence[str]],
+    num_bits: int,
+    batch_shots: Optional[int] = None,
+    max_shots: int = 100_000
+) -> GF2System:
+    """
+    Draw measurement outcomes in small batches until the secret is determined.
+
+    Args:
+        sample: Function taking a shot count and returning that many measured bitstrings
+            (e.g. ``lambda k: sampler.run([circuit], shots=k).result()[0].data.c.get_bitstrings()``)
+        num_bits: Secret length n
+        batch_shots: Shots per batch (defaults to n, the expected number of equations needed)
+        max_shots: Stop and return the partial system after this many shots
+
+    Returns:
+        The collected system; check ``is_determined()`` before reading ``secret()``
+    """
+    system = GF2System(num_bits)
+    batch_shots = batch_shots or max(num_bits, 1)
+    used = 0
+    while not system.is_determined() and used < max_shots:
+        shots = min(batch_shots, max_shots - used)
+        for outcome in sample(shots):
+            system.add(outcome)
+            if system.is_determined():
+                break
+        used += shots
+    return system
+
+
+def create_simon_oracle(secret_string: str, seed: Optional[int] = None) -> QuantumCircuit:
+    """
+    Create a Simon oracle for any n-bit secret as a compact CNOT network.
+
+    The oracle computes f(x) = x ⊕ (x_j · s), where j is the lowest set bit of s, so
+    f(x) = f(x ⊕ s) and f is two-to-one (one-to-one when s = 0). It uses
+    n + weight(s) CNOTs. With a seed, the output register is additionally scrambled by
+    a random invertible CNOT/X network, which keeps the promise but hides the structure.
+
+    Args:
+        secret_string: Secret s, leftmost character being the highest input qubit
+        seed: Seed for the optional output scrambling
+
+    Returns:
+        Oracle circuit on n input qubits followed by n output qubits
+    """
+    n = len(secret_string)
+    secret = bitstring_to_int(secret_string)
+    input_qubits = QuantumRegister(n, 'input')
+    output_qubits = QuantumRegister(n, 'output')
+    oracle = QuantumCircuit(input_qubits, output_qubits, name=f'Oracle_s={secret_string}')
+
+    for i in range(n):
+        oracle.cx(input_qubits[i], output_qubits[i])
+
+    if secret:
+        j = (secret & -secret).bit_length() - 1
+        for i in range(n):
+            if secret >> i & 1:
+                oracle.cx(input_qubits[j], output_qubits[i])
+
+    if seed is not None:
+        rng = np.random.default_rng(seed)
+        for _ in range(2 * n):
+            control, target = rng.choice(n, size=2, replace=False)
+            oracle.cx(output_qubits[int(control)], output_qubits[int(target)])
+        for i in np.flatnonzero(rng.random(n) < 0.5):
+            oracle.x(output_qubits[int(i)])
+
+    return oracle
+
+
+def simon_algorithm(oracle: QuantumCircuit, n: int) -> QuantumCircuit:
+    """
+    Create Simon's algorithm quantum circuit (H - oracle - H, measuring the input register).
+
+    The oracle is composed inline so the circuit can be transpiled or inspected gate by gate.
+    """
+    input_qubits = QuantumRegister(n, 'input')
+    output_qubits = QuantumRegister(oracle.num_qubits - n, 'output')
+    classical_bits = ClassicalRegister(n, 'classical')
+
+    qc = QuantumCircuit(input_qubits, output_qubits, classical_bits)
+    qc.h(input_qubits)
+    qc.compose(oracle, qubits=list(input_qubits) + list(output_qubits), inplace=True)
+    qc.h(input_qubits)
+    qc.measure(input_qubits, classical_bits)
+    return qc
+
+
+class SimonOracleFunction:
+    """The classical function f of a reversible Simon oracle, evaluated without a statevector."""
+
+    def __init__(self, oracle: QuantumCircuit, n: int):
+        """
+        Compile an oracle for classical evaluation.
+
+        Args:
+            oracle: Reversible oracle on n input qubits followed by its output qubits
+            n: Number of input qubits
+        """
+        self.n = n
+        self.num_outputs = oracle.num_qubits - n
+        self.oracle = oracle
+        self.simulator = ReversibleSimulator(oracle)
+
+    def evaluate(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Evaluate f on a batch of inputs.
+
+        Args:
+            inputs: Boolean array of shape (batch, n), column ``i`` being input bit ``i``
+
+        Returns:
+            Boolean array of shape (batch, num_outputs)
+        """
+        inputs = np.asarray(inputs, dtype=bool)
+        states = np.zeros((inputs.shape[0], self.oracle.num_qubits), dtype=bool)
+        states[:, :self.n] = inputs
+        outputs = self.simulator.run(pack_bits(states))
+        return extract_bits(outputs, range(self.n, self.oracle.num_qubits))
+
+    def verify(self, secret_string: str, num_samples: int = 1024, seed: Optional[int] = None) -> bool:
+        """
+        Spot-check Simon's promise on random inputs.
+
+        Checks f(x) = f(x ⊕ s) for every sample and, for a non-zero secret, that f
+        separates x from x ⊕ t for random t ∉ {0, s}.
+
+        Args:
+            secret_string: Claimed secret s
+            num_samples: Number of random inputs
+            seed: Seed of the random number generator
+
+        Returns:
+            True when every check passes
+        """
+        rng = np.random.default_rng(seed)
+        secret = np.array([bit == '1' for bit in reversed(secret_string)])
+        x = rng.random((num_samples, self.n)) < 0.5
+        fx = self.evaluate(x)
+        if not np.array_equal(fx, self.evaluate(x ^ secret)):
+            return False
+
+        t = rng.random((num_samples, self.n)) < 0.5
+        distinct = t.any(axis=1) & ~(t == secret).all(axis=1)
+        collisions = (fx == self.evaluate(x ^ t)).all(axis=1) & distinct
+        return not collisions.any()
+
+    def sample_outcomes(self, shots: int, seed: Optional[int] = None) -> ShotArray:
+        """
+        Sample the input-register measurements of Simon's circuit exactly, for affine oracles.
+
+        For f(x) = A·x ⊕ b the measured strings are uniformly distributed over the row
+        space of A, so they are drawn as y = Aᵀ·z for uniform random z, with A read off
+        by evaluating f on the basis vectors.
+
+        Args:
+            shots: Number of measurements to draw
+            seed: Seed of the random number generator
+
+        Returns:
+            Shot array of n-bit outcomes (classical bit ``i`` measures input qubit ``i``)
+
+        Raises:
+            ValueError: If the oracle contains Toffoli-class gates (f is not affine)
+        """
+        if not is_affine(self.oracle):
+            raise ValueError("Exact sampling needs an affine oracle (X, CX and SWAP gates only)")
+        basis = np.vstack([np.zeros(self.n, dtype=bool), np.eye(self.n, dtype=bool)])
+        images = self.evaluate(basis)
+        columns = (images[1:] ^ images[0]).astype(np.int64)
+
+        rng = np.random.default_rng(seed)
+        z = (rng.random((shots, self.num_outputs)) < 0.5).astype(np.int64)
+        return ShotArray.from_bool((z @ columns.T) & 1)
+
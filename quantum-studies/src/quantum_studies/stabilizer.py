@@ -0,0 +1,401 @@
+"""Stabilizer Simulator - Tableau simulation of Clifford circuits with automatic statevector fallback.
+
+Clifford circuits (H, S, CX and everything built from them, Paulis, measurement,
+reset, and Pauli gates conditioned on classical bits) are simulated without a
+2^n statevector:
+
+* ``StabilizerTableau`` is an Aaronson-Gottesman tableau stored as bit-packed
+  uint64 rows, so memory is O(n^2) bits and gates are O(n) word operations.
+* ``StabilizerSimulator`` runs the tableau once to obtain a reference sample
+  and then propagates Pauli frames for all shots at once (one bit per shot),
+  which makes thousands of shots of a 1000-qubit GHZ circuit cheap.
+
+``run_circuit`` routes Clifford circuits here and everything else to Aer's
+statevector simulator.
+"""
+
+from math import pi
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+from qiskit import QuantumCircuit
+from quantum_studies.pauli_table import pauli_product_phase
+from quantum_studies.shot_data import WORD_BITS, ShotArray, num_words, pack_bits
+
+IGNORED_OPERATIONS = {'barrier', 'id', 'delay'}
+PAULI_GATES = {'x', 'y', 'z'}
+# Gates rewritten in terms of h, s, cx and Paulis
+CLIFFORD_DECOMPOSITIONS = {
+    'sdg': lambda q: [('s', q), ('z', q)],
+    'sx': lambda q: [('h', q), ('s', q), ('h', q)],
+    'sxdg': lambda q: [('h', q), ('s', q), ('z', q), ('h', q)],
+    'cz': lambda a, b: [('h', b), ('cx', a, b), ('h', b)],
+    'cy': lambda a, b: [('s', b), ('z', b), ('cx', a, b), ('s', b)],
+    'swap': lambda a, b: [('cx', a, b), ('cx', b, a), ('cx', a, b)],
+}
+PHASE_ROTATIONS = {'rz', 'p', 'u1'}
+
+
+class NonCliffordCircuitError(ValueError):
+    """Raised when a circuit cannot be simulated by the stabilizer engine."""
+
+
+def _quarter_turns(angle: Any) -> int:
+    """Number of S gates equal (up to global phase) to a Z rotation, or raise if it is not a multiple of pi/2."""
+    try:
+        turns = float(angle) / (pi / 2)
+    except TypeError:
+        raise NonCliffordCircuitError("Unbound parameters are not Clifford") from None
+    if abs(turns - round(turns)) > 1e-9:
+        raise NonCliffordCircuitError(f"Rotation by {float(angle)} is not a Clifford gate")
+    return int(round(turns)) % 4
+
+
+def _condition(circuit: QuantumCircuit, condition: Any, clbit_map: Sequence[int]) -> Tuple[List[int], List[int]]:
+    """Translate an if_test condition into (classical bits, required values)."""
+    if not isinstance(condition, tuple):
+        raise NonCliffordCircuitError("Only (bit, value) and (register, value) conditions are supported")
+    target, value = condition
+    if hasattr(target, '__len__'):
+        bits = [clbit_map[circuit.find_bit(bit).index] for bit in target]
+        return bits, [(int(value) >> index) & 1 for index in range(len(bits))]
+    return [clbit_map[circuit.find_bit(target).index]], [int(bool(value))]
+
+
+def _flatten(circuit: QuantumCircuit, qubit_map: Sequence[int], clbit_map: Sequence[int]) -> Iterable[Tuple]:
+    """Yield primitive operations ('h', 's', 'cx', Paulis, 'measure', 'reset', 'if') for a circuit."""
+    for instruction in circuit.data:
+        operation = instruction.operation
+        name = operation.name
+        qubits = [qubit_map[circuit.find_bit(qubit).index] for qubit in instruction.qubits]
+        clbits = [clbit_map[circuit.find_bit(clbit).index] for clbit in instruction.clbits]
+        if name in IGNORED_OPERATIONS:
+            continue
+        if name in ('h', 's', 'cx') or name in PAULI_GATES:
+            yield (name, *qubits)
+        elif name in CLIFFORD_DECOMPOSITIONS:
+            yield from CLIFFORD_DECOMPOSITIONS[name](*qubits)
+        elif name in PHASE_ROTATIONS:
+            turns = _quarter_turns(operation.params[0])
+            yield from [('s', qubits[0])] * (turns % 2) + [('z', qubits[0])] * (turns // 2)
+        elif name == 'measure':
+            yield 'measure', qubits[0], clbits[0]
+        elif name == 'reset':
+            yield 'reset', qubits[0]
+        elif name == 'if_else':
+            bits, values = _condition(circuit, operation.condition, clbit_map)
+            true_body, false_body = operation.params
+            branches = []
+            for body in (true_body, false_body):
+                paulis = [] if body is None else list(_flatten(body, qubits, clbits))
+                if any(op[0] not in PAULI_GATES for op in paulis):
+                    raise NonCliffordCircuitError("Classically conditioned blocks may only contain Pauli gates")
+                branches.append(paulis)
+            yield 'if', bits, values, branches[0], branches[1]
+        elif operation.definition is not None and not instruction.clbits:
+            yield from _flatten(operation.definition, qubits, clbit_map)
+        else:
+            raise NonCliffordCircuitError(f"Operation '{name}' is not supported by the stabilizer simulator")
+
+
+def is_clifford(circuit: QuantumCircuit) -> bool:
+    """Whether a circuit can be run by the stabilizer simulator."""
+    try:
+        for _ in _flatten(circuit, range(circuit.num_qubits), range(circuit.num_clbits)):
+            pass
+    except NonCliffordCircuitError:
+        return False
+    return True
+
+
+class StabilizerTableau:
+    """Aaronson-Gottesman stabilizer tableau with rows packed into uint64 words."""
+
+    def __init__(self, num_qubits: int):
+        """
+        Create the tableau of |0...0>.
+
+        Args:
+            num_qubits: Number of qubits
+        """
+        self.num_qubits = num_qubits
+        words = num_words(num_qubits)
+        # Rows 0..n-1 are destabilizers (X_i), rows n..2n-1 stabilizers (Z_i)
+        self.x = np.zeros((2 * num_qubits, words), dtype=np.uint64)
+        self.z = np.zeros((2 * num_qubits, words), dtype=np.uint64)
+        self.r = np.zeros(2 * num_qubits, dtype=bool)
+        for qubit in range(num_qubits):
+            word, mask = self._mask(qubit)
+            self.x[qubit, word] = mask
+            self.z[num_qubits + qubit, word] = mask
+
+    @staticmethod
+    def _mask(qubit: int) -> Tuple[int, np.uint64]:
+        word, offset = divmod(qubit, WORD_BITS)
+        return word, np.uint64(1) << np.uint64(offset)
+
+    def _column(self, table: np.ndarray, qubit: int) -> np.ndarray:
+        word, mask = self._mask(qubit)
+        return (table[:, word] & mask) != 0
+
+    def h(self, qubit: int) -> None:
+        word, mask = self._mask(qubit)
+        x, z = self.x[:, word], self.z[:, word]
+        self.r ^= (x & z & mask) != 0
+        swap = (x ^ z) & mask
+        self.x[:, word] ^= swap
+        self.z[:, word] ^= swap
+
+    def s(self, qubit: int) -> None:
+        word, mask = self._mask(qubit)
+        x = self.x[:, word] & mask
+        self.r ^= (x & self.z[:, word]) != 0
+        self.z[:, word] ^= x
+
+    def x_gate(self, qubit: int) -> None:
+        self.r ^= self._column(self.z, qubit)
+
+    def z_gate(self, qubit: int) -> None:
+        self.r ^= self._column(self.x, qubit)
+
+    def y_gate(self, qubit: int) -> None:
+        self.r ^= self._column(self.x, qubit) ^ self._column(self.z, qubit)
+
+    def cx(self, control: int, target: int) -> None:
+        xc, zc = self._column(self.x, control), self._column(self.z, control)
+        xt, zt = self._column(self.x, target), self._column(self.z, target)
+        self.r ^= xc & zt & ~(xt ^ zc)
+        word_c, mask_c = self._mask(control)
+        word_t, mask_t = self._mask(target)
+        self.x[xc, word_t] ^= mask_t
+        self.z[zt, word_c] ^= mask_c
+
+    def _rowsum(self, targets: np.ndarray, source: int) -> None:
+        """Multiply every row in ``targets`` by row ``source`` (in place, with phases)."""
+        if not len(targets):
+            return
+        phase = pauli_product_phase(self.x[source], self.z[source], self.x[targets], self.z[targets])
+        phase += 2 * (self.r[targets].astype(np.int64) + int(self.r[source]))
+        self.r[targets] = (phase % 4) == 2
+        self.x[targets] ^= self.x[source]
+        self.z[targets] ^= self.z[source]
+
+    def _product(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray, bool]:
+        """Product of commuting rows, reduced pairwise so each level is a single vectorized step."""
+        x, z, r = self.x[rows], self.z[rows], self.r[rows].astype(np.int64)
+        while len(r) > 1:
+            half = len(r) // 2
+            left, right = slice(0, 2 * half, 2), slice(1, 2 * half, 2)
+            phase = pauli_product_phase(x[right], z[right], x[left], z[left]) + 2 * (r[left] + r[right])
+            reduced_x, reduced_z, reduced_r = x[left] ^ x[right], z[left] ^ z[right], (phase % 4) // 2
+            if len(r) % 2:
+                reduced_x = np.vstack([reduced_x, x[-1:]])
+                reduced_z = np.vstack([reduced_z, z[-1:]])
+                reduced_r = np.append(reduced_r, r[-1])
+            x, z, r = reduced_x, reduced_z, reduced_r
+        if not len(r):
+            return np.zeros(self.x.shape[1], dtype=np.uint64), np.zeros(self.x.shape[1], dtype=np.uint64), False
+        return x[0], z[0], bool(r[0])
+
+    def measure(self, qubit: int, outcome: int = 0) -> Tuple[int, bool]:
+        """
+        Measure a qubit in the Z basis.
+
+        Args:
+            qubit: Qubit to measure
+            outcome: Result to collapse to if the outcome is random
+
+        Returns:
+            Tuple of (measured bit, whether the outcome was random)
+        """
+        n = self.num_qubits
+        x_column = self._column(self.x, qubit)
+        anticommuting = np.flatnonzero(x_column[n:])
+        if len(anticommuting):
+            pivot = n + anticommuting[0]
+            others = np.flatnonzero(x_column)
+            self._rowsum(others[others != pivot], pivot)
+            self.x[pivot - n], self.z[pivot - n], self.r[pivot - n] = self.x[pivot], self.z[pivot], self.r[pivot]
+            word, mask = self._mask(qubit)
+            self.x[pivot] = 0
+            self.z[pivot] = 0
+            self.z[pivot, word] = mask
+            self.r[pivot] = bool(outcome)
+            return int(bool(outcome)), True
+        _, _, sign = self._product(n + np.flatnonzero(x_column[:n]))
+        return int(sign), False
+
+    def reset(self, qubit: int) -> None:
+        """Reset a qubit to |0>."""
+        if self.measure(qubit)[0]:
+            self.x_gate(qubit)
+
+    def expectation_value(self, label: str) -> int:
+        """
+        Expectation value of a Pauli string, which for a stabilizer state is +1, -1 or 0.
+
+        Args:
+            label: Pauli label in Qiskit order (the rightmost character acts on qubit 0)
+
+        Returns:
+            The expectation value
+        """
+        n = self.num_qubits
+        if len(label) != n:
+            raise ValueError(f"Pauli label must have {n} characters")
+        letters = np.array(list(label[::-1]))
+        bits = np.zeros((2, n), dtype=bool)
+        bits[0] = (letters == 'X') | (letters == 'Y')
+        bits[1] = (letters == 'Z') | (letters == 'Y')
+        x_pauli, z_pauli = pack_bits(bits)
+        anticommutes = (np.bitwise_count((self.x & z_pauli) ^ (self.z & x_pauli)).sum(axis=1) % 2).astype(bool)
+        if anticommutes[n:].any():
+            return 0
+        x, z, sign = self._product(n + np.flatnonzero(anticommutes[:n]))
+        if not (np.array_equal(x, x_pauli) and np.array_equal(z, z_pauli)):
+            raise ValueError("Inconsistent tableau")
+        return -1 if sign else 1
+
+
+class StabilizerSimulator:
+    """A Clifford circuit compiled once and sampled with a reference tableau run plus Pauli frames."""
+
+    def __init__(self, circuit: QuantumCircuit):
+        """
+        Compile a circuit for stabilizer simulation.
+
+        Args:
+            circuit: Clifford circuit (see ``is_clifford``)
+
+        Raises:
+            NonCliffordCircuitError: If the circuit contains unsupported operations
+        """
+        self.num_qubits = circuit.num_qubits
+        self.num_clbits = circuit.num_clbits
+        self._program = list(_flatten(circuit, range(circuit.num_qubits), range(circuit.num_clbits)))
+
+    def run(self, shots: int = 1024, seed: Optional[int] = None) -> ShotArray:
+        """
+        Sample the classical bits of the circuit.
+
+        Args:
+            shots: Number of shots
+            seed: Seed of the random number generator
+
+        Returns:
+            Bit-packed shots over the circuit's classical bits
+        """
+        rng = np.random.default_rng(seed)
+        lanes = num_words(shots)
+        tableau = StabilizerTableau(self.num_qubits)
+        reference = np.zeros(self.num_clbits, dtype=bool)
+        # Pauli frames: bit k of frame_x[q] / frame_z[q] is the X/Z error of shot k on qubit q
+        frame_x = np.zeros((self.num_qubits, lanes), dtype=np.uint64)
+        frame_z = self._random_words(rng, (self.num_qubits, lanes))
+        record = np.zeros((self.num_clbits, lanes), dtype=np.uint64)
+        ones = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+        for operation in self._program:
+            kind = operation[0]
+            if kind == 'h':
+                qubit = operation[1]
+                tableau.h(qubit)
+                frame_x[qubit], frame_z[qubit] = frame_z[qubit].copy(), frame_x[qubit].copy()
+            elif kind == 's':
+                qubit = operation[1]
+                tableau.s(qubit)
+                frame_z[qubit] ^= frame_x[qubit]
+            elif kind == 'cx':
+                control, target = operation[1:]
+                tableau.cx(control, target)
+                frame_x[target] ^= frame_x[control]
+                frame_z[control] ^= frame_z[target]
+            elif kind in PAULI_GATES:
+                self._apply_pauli(tableau, kind, operation[1])
+            elif kind == 'measure':
+                qubit, clbit = operation[1:]
+                reference[clbit] = tableau.measure(qubit)[0]
+                record[clbit] = frame_x[qubit] ^ (ones if reference[clbit] else np.uint64(0))
+                frame_z[qubit] = self._random_words(rng, lanes)
+            elif kind == 'reset':
+                qubit = operation[1]
+                tableau.reset(qubit)
+                frame_x[qubit] = 0
+                frame_z[qubit] = self._random_words(rng, lanes)
+            else:
+                _, bits, values, true_branch, false_branch = operation
+                taken = all(reference[bit] == value for bit, value in zip(bits, values))
+                for pauli, qubit in (true_branch if taken else false_branch):
+                    self._apply_pauli(tableau, pauli, qubit)
+                # Shots that took the other branch differ from the reference by both branches' Paulis
+                differs = np.zeros(lanes, dtype=np.uint64)
+                for bit, value in zip(bits, values):
+                    differs |= record[bit] ^ (ones if value else np.uint64(0))
+                if not taken:
+                    differs = ~differs
+                for pauli, qubit in true_branch + false_branch:
+                    if pauli in ('x', 'y'):
+                        frame_x[qubit] ^= differs
+                    if pauli in ('z', 'y'):
+                        frame_z[qubit] ^= differs
+
+        bits = np.unpackbits(record.view(np.uint8), axis=1, bitorder='little')[:, :shots].T
+        return ShotArray(pack_bits(bits), self.num_clbits)
+
+    @staticmethod
+    def _apply_pauli(tableau: StabilizerTableau, pauli: str, qubit: int) -> None:
+        {'x': tableau.x_gate, 'y': tableau.y_gate, 'z': tableau.z_gate}[pauli](qubit)
+
+    @staticmethod
+    def _random_words(rng: np.random.Generator, shape: Any) -> np.ndarray:
+        return rng.integers(0, np.iinfo(np.uint64).max, size=shape, dtype=np.uint64, endpoint=True)
+
+    def final_tableau(self) -> StabilizerTableau:
+        """Run the circuit once (random outcomes collapse to 0) and return the resulting tableau."""
+        tableau = StabilizerTableau(self.num_qubits)
+        reference = np.zeros(self.num_clbits, dtype=bool)
+        for operation in self._program:
+            kind = operation[0]
+            if kind == 'h':
+                tableau.h(operation[1])
+            elif kind == 's':
+                tableau.s(operation[1])
+            elif kind == 'cx':
+                tableau.cx(*operation[1:])
+            elif kind in PAULI_GATES:
+                self._apply_pauli(tableau, kind, operation[1])
+            elif kind == 'measure':
+                reference[operation[2]] = tableau.measure(operation[1])[0]
+            elif kind == 'reset':
+                tableau.reset(operation[1])
+            else:
+                _, bits, values, true_branch, false_branch = operation
+                taken = all(reference[bit] == value for bit, value in zip(bits, values))
+                for pauli, qubit in (true_branch if taken else false_branch):
+                    self._apply_pauli(tableau, pauli, qubit)
+        return tableau
+
+
+def run_circuit(circuit: QuantumCircuit, shots: int = 1024, seed: Optional[int] = None, method: str = 'automatic') -> ShotArray:
+    """
+    Sample a circuit, using the stabilizer simulator whenever the circuit is Clifford.
+
+    Args:
+        circuit: Circuit with measurements
+        shots: Number of shots
+        seed: Seed of the random number generator
+        method: 'automatic', 'stabilizer' or 'statevector'
+
+    Returns:
+        Bit-packed shots over the circuit's classical bits
+    """
+    if method not in ('automatic', 'stabilizer', 'statevector'):
+        raise ValueError(f"Unknown simulation method '{method}'")
+    if method == 'stabilizer' or (method == 'automatic' and is_clifford(circuit)):
+        return StabilizerSimulator(circuit).run(shots, seed)
+
+    from qiskit import transpile
+    from qiskit_aer import AerSimulator
+
+    simulator = AerSimulator(method='statevector', seed_simulator=seed)
+    result = simulator.run(transpile(circuit, simulator), shots=shots, memory=True).result()
+    return ShotArray.from_memory(result.get_memory())
@@ -27,4 +27,15 @@ print(f"Expectation value of Z⊗I: {expectation_value}")
 # 	•	These outcomes are perfectly correlated with the second qubit’s state
 # The expectation value of 0.0 reveals that the Bell state exhibits perfect quantum superposition - there’s no classical bias toward either spin direction.
 # If you measured both qubits with the ZZ observable (measuring both in the z-basis), you’d get an expectation value of +1, indicating perfect correlation - 
-# whenever you measure the first qubit as |0⟩, you’re guaranteed to measure the second as |0⟩, and same for |1⟩.
\ No newline at end of file
+# whenever you measure the first qubit as |0⟩, you’re guaranteed to measure the second as |0⟩, and same for |1⟩.
+
+# Measuring many observables: group commuting Pauli terms so each group needs one circuit.
+# ZZ, ZI and IZ share the computational basis; XX and YY commute with ZZ but not qubit-wise.
+from quantum_studies.measurement_planner import MeasurementPlan, estimate_observable
+
+observables = SparsePauliOp.from_list([("ZZ", 1.0), ("ZI", 1.0), ("IZ", 1.0), ("XX", 1.0), ("YY", 1.0)])
+for qubit_wise in (True, False):
+    plan = MeasurementPlan(observables, qubit_wise=qubit_wise)
+    estimate = estimate_observable(circuit, observables, shots=4096, qubit_wise=qubit_wise)
+    print(f"qubit_wise={qubit_wise}: {plan.num_circuits} circuits for {len(plan.table)} terms, "
+          f"per-term values {estimate['term_values'].round(3)}")
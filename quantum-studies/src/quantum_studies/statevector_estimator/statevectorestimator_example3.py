@@ -31,3 +31,17 @@ print(" Standard deviations: ", result[0].data.stds)
 
 # The expectation value here is -0.707 = 1/np.sqrt(2),
 # indicating that the qubit is now in a state where it has a higher probability of being measured as |1⟩ than |0⟩.
+
+# Instead of mutating the circuit and creating a new estimator for every angle,
+# sweep the angle as a parameter: all angles and observables go in a single PUB
+from qiskit.circuit import Parameter
+from quantum_studies.estimator_sweep import EstimatorSweep
+
+theta = Parameter("theta")
+sweep_circuit = QuantumCircuit(1)
+sweep_circuit.ry(theta, 0)
+
+sweep = EstimatorSweep().run(sweep_circuit, {"theta": np.linspace(0, np.pi, 9)}, ["Z", "X"])
+print("Sweep dimensions:", sweep.dims, sweep.shape)
+print("Expectation value of Z at theta=pi/2:", sweep.sel(theta=np.pi / 2, observable="Z").evs)
+print("Expectation value of Z at theta=3*pi/4:", sweep.sel(theta=3 * np.pi / 4, observable="Z").evs)
@@ -0,0 +1,175 @@
+"""Syndrome Decoder - Lookup-table decoding of bit-packed shot memory for small stabilizer codes.
+
+Everything a decoder needs per syndrome is precomputed once into arrays indexed
+by the syndrome integer: the correction and whether it flips each logical
+operator. Decoding a shot batch is then a handful of NumPy passes over the
+packed ``ShotArray`` words: gather the syndrome bits, look up the flip and
+XOR it into the logical readout parity, so millions of shots decode in
+well under a second.
+"""
+
+from typing import Dict, Optional, Sequence, Tuple, Union
+import numpy as np
+from quantum_studies.error_correction import StabilizerCode, pauli_label
+from quantum_studies.shot_data import WORD_BITS, ShotArray
+
+ShotsLike = Union[ShotArray, Sequence[str]]
+
+
+def _as_shot_array(shots: ShotsLike) -> ShotArray:
+    """Accept a ShotArray or Qiskit shot memory (a list of bitstrings)."""
+    return shots if isinstance(shots, ShotArray) else ShotArray.from_memory(list(shots))
+
+
+class SyndromeDecoder:
+    """Minimum-weight lookup-table decoder for a stabilizer code."""
+
+    def __init__(self, code: StabilizerCode, max_weight: int = 1):
+        """
+        Precompute the lookup arrays.
+
+        Args:
+            code: The stabilizer code
+            max_weight: Largest error weight used to fill the table
+        """
+        self.code = code
+        self.correction_x, self.correction_z, self.known = code.lookup_table(max_weight)
+        # Column 0: the correction flips logical Z readouts; column 1: logical X readouts
+        self.logical_flips = code.logical_flips(self.correction_x, self.correction_z)
+
+    @classmethod
+    def from_check_matrix(cls, checks: np.ndarray, logical_x: str, logical_z: str, max_weight: int = 1) -> "SyndromeDecoder":
+        """
+        Build a decoder for a code given by its binary check matrix.
+
+        Args:
+            checks: Array of shape (num_checks, 2 * num_qubits) laid out as [X part | Z part]
+            logical_x: Label of the logical X operator
+            logical_z: Label of the logical Z operator
+            max_weight: Largest error weight used to fill the table
+
+        Returns:
+            The decoder
+        """
+        return cls(StabilizerCode.from_check_matrix(checks, logical_x, logical_z), max_weight)
+
+    def syndrome_indices(self, shots: ShotsLike, syndrome_bits: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Syndrome of every shot as an integer (check i is bit i).
+
+        Args:
+            shots: Shot data
+            syndrome_bits: Classical bit of every check (defaults to bits 0 ... m - 1)
+
+        Returns:
+            Integer array of shape (shots,)
+        """
+        words = _as_shot_array(shots).words
+        if syndrome_bits is None:
+            syndrome_bits = range(self.code.num_checks)
+        syndromes = np.zeros(words.shape[0], dtype=np.int64)
+        for check, bit in enumerate(syndrome_bits):
+            word, offset = divmod(bit, WORD_BITS)
+            syndromes |= ((words[:, word] >> np.uint64(offset)) & np.uint64(1)).astype(np.int64) << check
+        return syndromes
+
+    def decode(self, shots: ShotsLike, syndrome_bits: Optional[Sequence[int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Corrections for every shot.
+
+        Args:
+            shots: Shot data
+            syndrome_bits: Classical bit of every check (defaults to bits 0 ... m - 1)
+
+        Returns:
+            Tuple of (x, z) boolean arrays of shape (shots, num_qubits)
+        """
+        syndromes = self.syndrome_indices(shots, syndrome_bits)
+        return self.correction_x[syndromes], self.correction_z[syndromes]
+
+    def readout_basis(self, logical: str = 'Z') -> str:
+        """
+        Basis in which reading out every data qubit measures a logical operator.
+
+        Args:
+            logical: 'Z' or 'X', the logical operator the prepared state is an eigenstate of
+
+        Returns:
+            'Z' or 'X'
+        """
+        x, z = self._logical(logical)
+        if not x.any():
+            return 'Z'
+        if not z.any():
+            return 'X'
+        raise ValueError(f"Logical {logical} ({pauli_label(x, z)}) mixes X and Z and cannot be read out transversally")
+
+    def _logical(self, logical: str) -> Tuple[np.ndarray, np.ndarray]:
+        if logical not in ('Z', 'X'):
+            raise ValueError(f"Unknown logical operator '{logical}'. Use 'Z' or 'X'")
+        return self.code.logical_z if logical == 'Z' else self.code.logical_x
+
+    def _readout_logical(self, logical: str, basis: str) -> Tuple[int, np.ndarray]:
+        """Flip column and support of a logical operator read out in ``basis``."""
+        x, z = self._logical(logical)
+        if basis != self.readout_basis(logical):
+            raise ValueError(
+                f"Logical {logical} ({pauli_label(x, z)}) cannot be read out in the {basis} basis; "
+                f"measure the data qubits in the {self.readout_basis(logical)} basis"
+            )
+        return (0 if logical == 'Z' else 1), (x if basis == 'X' else z)
+
+    def logical_failures(
+        self,
+        shots: ShotsLike,
+        syndrome_bits: Optional[Sequence[int]] = None,
+        data_bits: Optional[Sequence[int]] = None,
+        basis: Optional[str] = None,
+        expected: int = 0,
+        logical: str = 'Z'
+    ) -> Dict[str, float]:
+        """
+        Decode a memory experiment and count logical failures.
+
+        Every shot holds the syndrome bits and a transversal readout of the data
+        qubits in ``basis``; the logical outcome is the readout parity over the
+        prepared logical operator's support, flipped when the decoded correction
+        anticommutes with that operator.
+
+        Args:
+            shots: Shot data
+            syndrome_bits: Classical bit of every check (defaults to bits 0 ... m - 1)
+            data_bits: Classical bit of every data qubit (defaults to bits m ... m + n - 1)
+            basis: Readout basis of the data qubits, 'X' or 'Z' (if None, ``readout_basis(logical)``);
+                it must measure the prepared logical operator
+            expected: Logical outcome of an error-free shot
+            logical: Logical operator the prepared state is an eigenstate of: 'Z' for
+                |0>_L or |1>_L, 'X' for |+>_L or |->_L
+
+        Returns:
+            Dictionary with the number of shots, logical failures, shots with an
+            undecodable syndrome and the logical error rate
+        """
+        shots = _as_shot_array(shots)
+        m, n = self.code.num_checks, self.code.num_qubits
+        if data_bits is None:
+            data_bits = range(m, m + n)
+        if basis is None:
+            basis = self.readout_basis(logical)
+        column, support = self._readout_logical(logical, basis)
+
+        mask = np.zeros(shots.words.shape[1], dtype=np.uint64)
+        for qubit in np.flatnonzero(support):
+            word, offset = divmod(data_bits[qubit], WORD_BITS)
+            mask[word] |= np.uint64(1) << np.uint64(offset)
+        parity = (np.bitwise_count(shots.words & mask).sum(axis=1) & 1).astype(bool)
+
+        syndromes = self.syndrome_indices(shots, syndrome_bits)
+        outcome = parity ^ self.logical_flips[syndromes, column]
+        failures = int(np.count_nonzero(outcome != bool(expected)))
+        return {
+            'shots': shots.num_shots,
+            'logical_failures': failures,
+            'undecodable': int(np.count_nonzero(~self.known[syndromes])),
+            'logical_error_rate': failures / shots.num_shots if shots.num_shots else 0.0
+        }
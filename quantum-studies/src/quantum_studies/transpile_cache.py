@@ -0,0 +1,364 @@
+"""Transpilation Cache - Reuse transpiled circuits across runs on the same backend calibration."""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from qiskit import QuantumCircuit, transpile, qpy
+from qiskit.circuit import ControlFlowOp
+from qiskit.circuit.library import UnitaryGate, get_standard_gate_name_mapping
+
+# Operations identified by name and parameters alone
+_STANDARD_OPERATIONS = get_standard_gate_name_mapping()
+
+
+def circuit_fingerprint(circuit: QuantumCircuit) -> str:
+    """
+    Compute a structural hash of a circuit.
+
+    Two circuits get the same fingerprint when they have the same registers, global
+    phase and instruction sequence (operation names, parameters, qubits and clbits).
+    Operations other than standard library gates are also hashed through their
+    definitions, so two custom gates sharing a name (or two ``PauliEvolutionGate``
+    of different operators) get different fingerprints; opaque custom operations
+    are identified by their class, name, parameters and width.
+    Circuit names, labels and metadata are ignored. Unbound parameters are matched
+    by name, so rebuilding a parameterized circuit with fresh ``Parameter`` objects
+    still hits the cache (see ``match_parameters`` for binding the cached result).
+
+    Args:
+        circuit: The circuit to fingerprint
+
+    Returns:
+        Hex digest identifying the circuit structure
+    """
+    digest = hashlib.sha256()
+    _update_digest(digest, circuit, {})
+    return digest.hexdigest()
+
+
+def _is_standard(operation: Any) -> bool:
+    """Whether an operation is fully described by its name and parameters."""
+    if isinstance(operation, (ControlFlowOp, UnitaryGate)):
+        return True
+    standard = _STANDARD_OPERATIONS.get(operation.name)
+    return standard is not None and operation.base_class is standard.base_class
+
+
+def _definition_digest(operation: Any, definitions: Dict[int, Tuple[Any, str]]) -> str:
+    """Digest of a custom operation's definition, computed once per operation object."""
+    # The memo keeps a reference to each operation so its id is not reused meanwhile
+    cached = definitions.get(id(operation))
+    if cached is not None:
+        return cached[1]
+    digest = hashlib.sha256()
+    digest.update(f"{type(operation).__module__}.{type(operation).__qualname__};".encode())
+    digest.update(f"q{operation.num_qubits};c{operation.num_clbits};".encode())
+    definition = operation.definition
+    if definition is None:
+        digest.update(b"opaque")
+    else:
+        _update_digest(digest, definition, definitions)
+    definitions[id(operation)] = (operation, digest.hexdigest())
+    return definitions[id(operation)][1]
+
+
+def _update_digest(digest: Any, circuit: QuantumCircuit, definitions: Dict[int, Tuple[Any, str]]) -> None:
+    """Feed the structure of a circuit (recursing into control-flow blocks and custom gates) into a digest."""
+    digest.update(f"q{circuit.num_qubits};c{circuit.num_clbits};".encode())
+    for register in circuit.qregs + circuit.cregs:
+        digest.update(f"r{register.name}:{register.size};".encode())
+    digest.update(f"g{circuit.global_phase};".encode())
+
+    for instruction in circuit.data:
+        operation = instruction.operation
+        qubits = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
+        clbits = [circuit.find_bit(clbit).index for clbit in instruction.clbits]
+        digest.update(f"|{operation.name}:{qubits}:{clbits}".encode())
+        ctrl_state = getattr(operation, 'ctrl_state', None)
+        if ctrl_state is not None:
+            digest.update(f":ctrl{ctrl_state}".encode())
+        if not _is_standard(operation):
+            digest.update(f":def{_definition_digest(operation, definitions)}".encode())
+        for param in operation.params:
+            if isinstance(param, QuantumCircuit):
+                _update_digest(digest, param, definitions)
+            elif hasattr(param, 'tobytes'):
+                digest.update(f":{param.shape}{param.dtype}".encode())
+                digest.update(param.tobytes())
+            else:
+                digest.update(f":{param}".encode())
+
+
+def match_parameters(transpiled: QuantumCircuit, circuit: QuantumCircuit) -> QuantumCircuit:
+    """
+    Replace the unbound parameters of a transpiled circuit by the same-named ones of its source.
+
+    Cached or QPY-loaded circuits carry the ``Parameter`` objects of whichever circuit
+    was transpiled first; after this they can be bound with the caller's own objects.
+
+    Args:
+        transpiled: Transpiled circuit, modified in place
+        circuit: The circuit it was requested for
+
+    Returns:
+        The transpiled circuit
+    """
+    by_name = {parameter.name: parameter for parameter in circuit.parameters}
+    mapping = {
+        parameter: by_name[parameter.name]
+        for parameter in transpiled.parameters
+        if parameter.name in by_name and by_name[parameter.name] != parameter
+    }
+    if mapping:
+        transpiled.assign_parameters(mapping, inplace=True)
+    return transpiled
+
+
+def backend_version(backend: Any) -> str:
+    """
+    Identify the calibration of a backend.
+
+    Uses the last calibration update date when the backend exposes properties, and
+    falls back to the backend version string otherwise.
+
+    Args:
+        backend: The backend to identify
+
+    Returns:
+        String that changes whenever the backend calibration changes
+    """
+    try:
+        properties = backend.properties()
+    except Exception:
+        properties = None
+    last_update = getattr(properties, 'last_update_date', None)
+    if last_update is not None:
+        return str(last_update)
+    return str(getattr(backend, 'backend_version', ''))
+
+
+class TranspileCache:
+    """A two-tier (memory LRU + optional on-disk QPY) cache of transpiled circuits."""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        cache_dir: Optional[str] = None,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+        version_ttl: float = 300.0
+    ):
+        """
+        Initialize the transpilation cache.
+
+        Args:
+            max_entries: Maximum number of transpiled circuits kept in memory
+            cache_dir: Directory for the on-disk QPY tier (if None, memory only)
+            max_disk_bytes: Size above which the least recently used QPY files are evicted
+            version_ttl: Seconds a backend calibration version is reused before re-fetching it
+        """
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.version_ttl = version_ttl
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, QuantumCircuit]" = OrderedDict()
+        self._versions: Dict[str, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, circuit: QuantumCircuit, backend: Any, optimization_level: int) -> str:
+        """
+        Build the cache key for a circuit on a backend.
+
+        Args:
+            circuit: The circuit to transpile
+            backend: The target backend
+            optimization_level: Transpilation optimization level (0-3)
+
+        Returns:
+            Cache key combining circuit structure, backend calibration and optimization level
+        """
+        parts = [
+            circuit_fingerprint(circuit),
+            backend.name,
+            self._backend_version(backend),
+            str(optimization_level)
+        ]
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[QuantumCircuit]:
+        """
+        Look up a transpiled circuit, promoting disk hits into memory.
+
+        Args:
+            key: Cache key from ``key()``
+
+        Returns:
+            A copy of the cached circuit, or None on a miss
+        """
+        with self._lock:
+            circuit = self._memory.get(key)
+            if circuit is not None:
+                self._memory.move_to_end(key)
+                return circuit.copy()
+
+        circuit = self._load_from_disk(key)
+        if circuit is not None:
+            self._remember(key, circuit)
+            return circuit.copy()
+        return None
+
+    def put(self, key: str, circuit: QuantumCircuit) -> None:
+        """
+        Store a transpiled circuit in every enabled tier.
+
+        Args:
+            key: Cache key from ``key()``
+            circuit: The transpiled circuit
+        """
+        self._remember(key, circuit.copy())
+        self._store_on_disk(key, circuit)
+
+    def transpile(
+        self,
+        circuits: Sequence[QuantumCircuit],
+        backend: Any,
+        optimization_level: int = 1
+    ) -> List[QuantumCircuit]:
+        """
+        Transpile circuits for a backend, only running the transpiler on cache misses.
+
+        Args:
+            circuits: Circuits to transpile
+            backend: The target backend
+            optimization_level: Transpilation optimization level (0-3)
+
+        Returns:
+            Transpiled circuits in the same order as ``circuits``, using the
+            ``Parameter`` objects of each input circuit
+        """
+        keys = [self.key(circuit, backend, optimization_level) for circuit in circuits]
+        results: List[Optional[QuantumCircuit]] = [self.get(key) for key in keys]
+
+        # Transpile each distinct missing circuit once, in a single batched call
+        missing: Dict[str, int] = {}
+        for index, (key, result) in enumerate(zip(keys, results)):
+            if result is None and key not in missing:
+                missing[key] = index
+
+        self.hits += len(circuits) - sum(result is None for result in results)
+        self.misses += len(missing)
+
+        if missing:
+            transpiled = transpile(
+                [circuits[index] for index in missing.values()],
+                backend,
+                optimization_level=optimization_level
+            )
+            if isinstance(transpiled, QuantumCircuit):
+                transpiled = [transpiled]
+            for key, circuit in zip(missing, transpiled):
+                self.put(key, circuit)
+            fresh = dict(zip(missing, transpiled))
+            results = [
+                result if result is not None else fresh[key].copy()
+                for key, result in zip(keys, results)
+            ]
+
+        return [match_parameters(result, circuit) for result, circuit in zip(results, circuits)]
+
+    def clear(self) -> None:
+        """Drop every cached circuit from memory and disk."""
+        with self._lock:
+            self._memory.clear()
+            self._versions.clear()
+        if self.cache_dir:
+            for path, _, _ in self._disk_entries():
+                os.remove(path)
+
+    def _backend_version(self, backend: Any) -> str:
+        """Calibration version of a backend, re-fetched at most once per version_ttl."""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._versions.get(backend.name)
+        if cached is not None and now - cached[0] < self.version_ttl:
+            return cached[1]
+
+        version = backend_version(backend)
+        with self._lock:
+            self._versions[backend.name] = (now, version)
+        return version
+
+    def _remember(self, key: str, circuit: QuantumCircuit) -> None:
+        """Insert a circuit into the memory tier, evicting the least recently used entries."""
+        with self._lock:
+            self._memory[key] = circuit
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.qpy")
+
+    def _load_from_disk(self, key: str) -> Optional[QuantumCircuit]:
+        """Read a circuit from the QPY tier, refreshing its access time."""
+        if not self.cache_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, 'rb') as file:
+                circuit = qpy.load(file)[0]
+            os.utime(path)
+        except (OSError, qpy.QpyError):
+            return None
+        return circuit
+
+    def _store_on_disk(self, key: str, circuit: QuantumCircuit) -> None:
+        """Write a circuit to the QPY tier and evict old files above max_disk_bytes."""
+        if not self.cache_dir:
+            return
+        path = self._disk_path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'wb') as file:
+                qpy.dump(circuit, file)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"Warning: could not write transpile cache entry: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+        self._evict_disk()
+
+    def _disk_entries(self) -> List[Tuple[str, float, int]]:
+        """List (path, mtime, size) of every QPY file in the cache directory."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.qpy'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _evict_disk(self) -> None:
+        """Remove least recently used QPY files until the tier fits in max_disk_bytes."""
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
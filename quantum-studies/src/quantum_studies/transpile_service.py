@@ -0,0 +1,244 @@
+"""Transpile Service - Parallel circuits × targets × optimization-level transpilation over a process pool.
+
+The service keeps one persistent (spawned) ``ProcessPoolExecutor``. Targets (backends or
+``Target`` objects) are pickled once and installed in every worker by the pool
+initializer, so tasks only name their target. Circuits travel as QPY bytes in
+both directions, serialized once per circuit on the way out. Results stream
+back in completion order with the time each transpilation took, and can be
+collected into a matrix for choosing the best backend of a batch.
+"""
+
+import io
+import multiprocessing
+import os
+import pickle
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+from qiskit import QuantumCircuit, qpy, transpile
+from qiskit.transpiler import Target
+from quantum_studies.transpile_cache import TranspileCache, match_parameters
+
+# Targets installed in each worker process by _initialize_worker
+_WORKER_TARGETS: Dict[str, Any] = {}
+
+
+@dataclass
+class TranspileResult:
+    """Outcome of transpiling one circuit for one target at one optimization level."""
+    circuit_index: int
+    target: str
+    optimization_level: int
+    circuit: Optional[QuantumCircuit]
+    seconds: float
+    cached: bool = False
+    error: Optional[str] = None
+    seed: Optional[int] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _to_qpy(circuit: QuantumCircuit) -> bytes:
+    buffer = io.BytesIO()
+    qpy.dump(circuit, buffer)
+    return buffer.getvalue()
+
+
+def _from_qpy(data: bytes) -> QuantumCircuit:
+    return qpy.load(io.BytesIO(data))[0]
+
+
+def _initialize_worker(targets_blob: bytes) -> None:
+    """Pool initializer: unpickle the targets once per worker."""
+    global _WORKER_TARGETS
+    _WORKER_TARGETS = pickle.loads(targets_blob)
+
+
+def _transpile_task(circuit_qpy: bytes, target_name: str, optimization_level: int, seed: Optional[int]) -> Tuple[Optional[bytes], float, Optional[str]]:
+    """Worker side of one task: returns (QPY of the transpiled circuit, seconds, error)."""
+    start = time.perf_counter()
+    try:
+        circuit = _from_qpy(circuit_qpy)
+        target = _WORKER_TARGETS[target_name]
+        if isinstance(target, Target):
+            transpiled = transpile(circuit, target=target, optimization_level=optimization_level, seed_transpiler=seed)
+        else:
+            transpiled = transpile(circuit, backend=target, optimization_level=optimization_level, seed_transpiler=seed)
+        return _to_qpy(transpiled), time.perf_counter() - start, None
+    except Exception as e:
+        return None, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+
+
+class TranspileService:
+    """Transpiles many circuits for many targets in parallel, streaming results as they finish."""
+
+    def __init__(
+        self,
+        targets: Union[Mapping[str, Any], Sequence[Any]],
+        max_workers: Optional[int] = None,
+        seed_transpiler: Optional[int] = None,
+        transpile_cache: Optional[TranspileCache] = None
+    ):
+        """
+        Initialize the service; the worker pool starts on first use.
+
+        Args:
+            targets: Backends (keyed by their name) or a mapping from name to backend or ``Target``
+            max_workers: Number of worker processes (if None, the CPU count)
+            seed_transpiler: Seed passed to every transpilation, for reproducible layouts
+            transpile_cache: Cache consulted before and filled after transpiling
+                (only backend targets are cached)
+        """
+        if not isinstance(targets, Mapping):
+            targets = {backend.name: backend for backend in targets}
+        self.targets = dict(targets)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.seed_transpiler = seed_transpiler
+        self.transpile_cache = transpile_cache
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "TranspileService":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Spawned, not forked: forking after Qiskit's Rust thread pools have
+            # started can leave the workers deadlocked
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_initialize_worker,
+                initargs=(pickle.dumps(self.targets),)
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Shut the worker pool down."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _cache_key(self, circuit: QuantumCircuit, target_name: str, optimization_level: int, seed: Optional[int]) -> Optional[str]:
+        target = self.targets[target_name]
+        if self.transpile_cache is None or isinstance(target, Target) or seed is not None:
+            return None
+        return self.transpile_cache.key(circuit, target, optimization_level)
+
+    def stream(
+        self,
+        circuits: Sequence[QuantumCircuit],
+        targets: Optional[Sequence[str]] = None,
+        optimization_levels: Sequence[int] = (1,),
+        seeds: Optional[Sequence[int]] = None
+    ) -> Iterator[TranspileResult]:
+        """
+        Transpile every circuit × target × optimization level × seed, yielding results as they finish.
+
+        Args:
+            circuits: Circuits to transpile
+            targets: Names of the targets to use (if None, all of them)
+            optimization_levels: Optimization levels to try
+            seeds: Transpiler seeds to try, one task each, e.g. for layout and routing
+                trials (if None, only the service's ``seed_transpiler``)
+
+        Yields:
+            One result per task, in completion order (cache hits first); closing the
+            generator early cancels the tasks that have not started
+        """
+        targets = list(self.targets) if targets is None else list(targets)
+        unknown = [name for name in targets if name not in self.targets]
+        if unknown:
+            raise ValueError(f"Unknown targets: {', '.join(unknown)}. Available: {', '.join(self.targets)}")
+
+        seeds = [self.seed_transpiler] if seeds is None else list(seeds)
+        payloads: Dict[int, bytes] = {}
+        hits: List[TranspileResult] = []
+        futures: Dict[Future, Tuple[int, str, int, Optional[int], Optional[str]]] = {}
+        try:
+            for index, circuit in enumerate(circuits):
+                for name in targets:
+                    for level in optimization_levels:
+                        for seed in seeds:
+                            key = self._cache_key(circuit, name, level, seed)
+                            cached = self.transpile_cache.get(key) if key is not None else None
+                            if cached is not None:
+                                match_parameters(cached, circuit)
+                                hits.append(TranspileResult(index, name, level, cached, 0.0, cached=True))
+                                continue
+                            if index not in payloads:
+                                payloads[index] = _to_qpy(circuit)
+                            future = self._executor().submit(_transpile_task, payloads[index], name, level, seed)
+                            futures[future] = (index, name, level, seed, key)
+
+            yield from hits
+            for future in as_completed(futures):
+                index, name, level, seed, key = futures[future]
+                data, seconds, error = future.result()
+                circuit = _from_qpy(data) if data is not None else None
+                if circuit is not None:
+                    if key is not None:
+                        self.transpile_cache.put(key, circuit)
+                    match_parameters(circuit, circuits[index])
+                yield TranspileResult(index, name, level, circuit, seconds, error=error, seed=seed)
+        finally:
+            # A caller that stops iterating (or an error) must not leave queued tasks
+            # occupying the shared pool; tasks already running finish on their own
+            for future in futures:
+                future.cancel()
+
+    def matrix(
+        self,
+        circuits: Sequence[QuantumCircuit],
+        targets: Optional[Sequence[str]] = None,
+        optimization_levels: Sequence[int] = (1,)
+    ) -> Dict[Tuple[int, str, int], TranspileResult]:
+        """
+        Collect every result of ``stream`` keyed by (circuit index, target name, optimization level).
+
+        Args:
+            circuits: Circuits to transpile
+            targets: Names of the targets to use (if None, all of them)
+            optimization_levels: Optimization levels to try
+
+        Returns:
+            Dictionary of results
+        """
+        results = {}
+        for result in self.stream(circuits, targets, optimization_levels):
+            results[(result.circuit_index, result.target, result.optimization_level)] = result
+        return results
+
+
+def best_targets(results: Mapping[Tuple[int, str, int], TranspileResult], metric: str = 'two_qubit_gates') -> List[str]:
+    """
+    Rank targets by the total cost of their best transpilation of every circuit.
+
+    Args:
+        results: Matrix from ``TranspileService.matrix``
+        metric: 'two_qubit_gates', 'depth' or 'size'
+
+    Returns:
+        Target names, best first; targets that failed any circuit come last
+    """
+    def cost(circuit: QuantumCircuit) -> int:
+        if metric == 'depth':
+            return circuit.depth()
+        if metric == 'size':
+            return circuit.size()
+        return sum(1 for instruction in circuit.data if instruction.operation.num_qubits == 2)
+
+    circuits = {index for index, _, _ in results}
+    totals: Dict[str, float] = {}
+    for target in {name for _, name, _ in results}:
+        total = 0.0
+        for index in circuits:
+            options = [result for (i, name, _), result in results.items() if i == index and name == target and result.ok]
+            total += min(cost(result.circuit) for result in options) if options else float('inf')
+        totals[target] = total
+    return sorted(totals, key=lambda name: (totals[name], name))
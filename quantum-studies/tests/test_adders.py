@@ -0,0 +1,75 @@
+"""Tests of the reversible adders and their exhaustive classical verification."""
+
+from dataclasses import replace
+import numpy as np
+import pytest
+from quantum_studies.adders import Adder, cuccaro_adder, evaluate_adder, ripple_carry_adder, verify_adder
+from quantum_studies.stabilizer import run_circuit
+
+BUILDERS = [ripple_carry_adder, cuccaro_adder]
+
+
+def without_gate(adder: Adder, index: int) -> Adder:
+    circuit = adder.circuit.copy()
+    del circuit.data[index]
+    return replace(adder, circuit=circuit)
+
+
+def wrong_sums(adder: Adder) -> int:
+    n = adder.num_bits
+    a, b = np.divmod(np.arange(1 << (2 * n)), 1 << n)
+    return int((evaluate_adder(adder, a.tolist(), b.tolist()) != a + b).sum())
+
+
+@pytest.mark.parametrize('builder', BUILDERS)
+@pytest.mark.parametrize('num_bits', [1, 2, 3, 4, 6])
+def test_adders_are_correct_on_every_input(builder, num_bits):
+    adder = builder(num_bits)
+    assert verify_adder(adder) == 0
+    assert wrong_sums(adder) == 0
+
+
+@pytest.mark.parametrize('builder', BUILDERS)
+def test_small_chunks_cover_every_input(builder):
+    assert verify_adder(builder(5), chunk_bits=7) == 0
+
+
+@pytest.mark.parametrize('builder', BUILDERS)
+@pytest.mark.parametrize('num_bits', [2, 4])
+def test_broken_adders_fail(builder, num_bits):
+    adder = builder(num_bits)
+    for index, instruction in enumerate(adder.circuit.data):
+        qubits = {adder.circuit.find_bit(qubit).index for qubit in instruction.qubits}
+        if qubits & set(adder.clean):
+            # With a zero carry-in, gates reading the ancilla before it is set do nothing
+            continue
+        broken = without_gate(adder, index)
+        failures = verify_adder(broken)
+        assert failures > 0, f"gate {index} is redundant"
+        # Failures also count corrupted operands and ancillas, so they bound the wrong sums
+        assert failures >= wrong_sums(broken)
+
+
+def test_failure_count_matches_the_reference_when_only_the_carry_is_wrong():
+    adder = ripple_carry_adder(3)
+    # The last Toffoli feeds only the carry-out, which is wrong exactly when b_2 = c_2 = 1 and a_2 = 0
+    broken = without_gate(adder, len(adder.circuit.data) - 1)
+    assert verify_adder(broken) == wrong_sums(broken) > 0
+
+
+def test_dirty_ancilla_is_reported():
+    adder = cuccaro_adder(3)
+    dirty = adder.circuit.copy()
+    dirty.cx(adder.a[0], adder.clean[0])
+    # Sums are still right, but the ancilla is left set whenever a_0 = 1
+    broken = replace(adder, circuit=dirty)
+    assert wrong_sums(broken) == 0
+    assert verify_adder(broken) == 2 ** 5
+
+
+@pytest.mark.parametrize('builder', BUILDERS)
+def test_measured_adder_returns_the_sum(builder):
+    circuit = builder(3, a=5, b=6, measure=True).circuit
+    assert run_circuit(circuit, shots=16, seed=0).get_counts() == {format(11, '04b'): 16}
+    with pytest.raises(ValueError, match="does not fit"):
+        builder(3, a=8)
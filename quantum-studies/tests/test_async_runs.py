@@ -0,0 +1,60 @@
+"""Tests of the blocking wrappers around the asynchronous runners, in and out of an event loop."""
+
+import asyncio
+import pytest
+from qiskit import QuantumCircuit
+from qiskit_ibm_runtime.fake_provider import FakeLimaV2, FakeManilaV2
+from quantum_studies.async_utils import run_sync
+from quantum_studies.ibm_qpus import IBMQuantumRunner
+from quantum_studies.providers import LocalRuntimeProvider
+
+
+async def double(value: int) -> int:
+    await asyncio.sleep(0)
+    return 2 * value
+
+
+def x_circuit() -> QuantumCircuit:
+    circuit = QuantumCircuit(1)
+    circuit.x(0)
+    circuit.measure_all()
+    return circuit
+
+
+def test_run_sync_without_and_inside_a_running_loop():
+    assert run_sync(double(2)) == 4
+
+    async def notebook_cell() -> int:
+        return run_sync(double(3))
+
+    assert asyncio.run(notebook_cell()) == 6
+
+
+def test_run_on_backends_inside_a_running_loop():
+    runner = IBMQuantumRunner(provider=LocalRuntimeProvider([FakeManilaV2(), FakeLimaV2()]))
+
+    async def notebook_cell():
+        return runner.run_on_backends(x_circuit(), ['fake_manila', 'fake_lima'], shots=100)
+
+    results = asyncio.run(notebook_cell())
+    assert list(results) == ['fake_manila', 'fake_lima']
+    for result in results.values():
+        assert runner.get_counts(result[0]).get('1', 0) > 80
+
+
+def test_run_on_backends_rejects_duplicate_names():
+    runner = IBMQuantumRunner(provider=LocalRuntimeProvider([FakeManilaV2(), FakeLimaV2()]))
+    with pytest.raises(ValueError, match="Duplicate backend names: fake_lima"):
+        runner.run_on_backends(x_circuit(), ['fake_lima', 'fake_manila', 'fake_lima'], shots=100)
+
+
+def test_run_circuits_scheduled_inside_a_running_loop():
+    runner = IBMQuantumRunner(provider=LocalRuntimeProvider([FakeManilaV2(), FakeLimaV2()]))
+    pubs = [x_circuit() for _ in range(4)]
+
+    async def notebook_cell():
+        return runner.run_circuits_scheduled(pubs, shots=100, max_backends=2)
+
+    results = asyncio.run(notebook_cell())
+    assert len(results) == 4
+    assert all(runner.get_counts(result).get('1', 0) > 80 for result in results)
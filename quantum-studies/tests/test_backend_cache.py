@@ -0,0 +1,122 @@
+"""Tests of the per-field TTLs of the backend metadata cache, with an injected clock."""
+
+from types import SimpleNamespace
+from typing import List
+import pytest
+from quantum_studies.backend_cache import BackendMetadataCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingBackend:
+    """Backend whose configuration and status calls are counted; the queue grows on every status call."""
+
+    def __init__(self, name: str, num_qubits: int):
+        self.name = name
+        self.num_qubits = num_qubits
+        self.configuration_calls = 0
+        self.status_calls = 0
+
+    def configuration(self):
+        self.configuration_calls += 1
+        return SimpleNamespace(basis_gates=['cx', 'rz', 'sx', 'x'], coupling_map=[[0, 1]], max_shots=4000, max_experiments=300)
+
+    def status(self):
+        self.status_calls += 1
+        return SimpleNamespace(operational=True, status_msg='active', pending_jobs=self.status_calls)
+
+
+class CountingService:
+    def __init__(self, backends: List[CountingBackend]):
+        self._backends = {backend.name: backend for backend in backends}
+        self.listing_calls = 0
+
+    def backends(self, simulator: bool = False, operational: bool = True, min_num_qubits: int = 1) -> List:
+        self.listing_calls += 1
+        return [backend for backend in self._backends.values() if backend.num_qubits >= min_num_qubits]
+
+    def backend(self, name: str) -> CountingBackend:
+        return self._backends[name]
+
+
+@pytest.fixture
+def setup():
+    clock = FakeClock()
+    backends = [CountingBackend('ibm_a', 5), CountingBackend('ibm_b', 127)]
+    service = CountingService(backends)
+    cache = BackendMetadataCache(service, config_ttl=3600.0, status_ttl=30.0, backends_ttl=300.0, clock=clock)
+    return cache, clock, service, backends
+
+
+def test_stale_status_is_refetched_while_configuration_is_not(setup):
+    cache, clock, _, (backend, _) = setup
+    assert cache.configuration(backend)['basis_gates'] == ['cx', 'rz', 'sx', 'x']
+    assert cache.status(backend)['pending_jobs'] == 1
+
+    clock.now += 29.0
+    assert cache.status(backend)['pending_jobs'] == 1
+    assert backend.status_calls == 1
+
+    clock.now += 2.0
+    assert cache.status(backend)['pending_jobs'] == 2
+    cache.configuration(backend)
+    assert backend.status_calls == 2 and backend.configuration_calls == 1
+
+    clock.now += 3600.0
+    cache.configuration(backend)
+    assert backend.configuration_calls == 2
+
+
+def test_statuses_only_refetch_stale_entries(setup):
+    cache, clock, _, backends = setup
+    first, second = backends
+    cache.status(first)
+    clock.now += 20.0
+    cache.status(second)
+    clock.now += 15.0
+    # 35 s since the first fetch, 15 s since the second
+    snapshots = cache.statuses(backends)
+    assert (first.status_calls, second.status_calls) == (2, 1)
+    assert snapshots == {
+        'ibm_a': {'operational': True, 'status_msg': 'active', 'pending_jobs': 2},
+        'ibm_b': {'operational': True, 'status_msg': 'active', 'pending_jobs': 1}
+    }
+
+
+def test_listings_expire_and_prime_backend_handles(setup):
+    cache, clock, service, backends = setup
+    assert [backend.name for backend in cache.backends(min_qubits=10)] == ['ibm_b']
+    cache.backends(min_qubits=10)
+    assert service.listing_calls == 1
+    # Another query is cached separately
+    cache.backends(min_qubits=1)
+    assert service.listing_calls == 2
+    assert cache.backend('ibm_b') is backends[1]
+
+    clock.now += 301.0
+    cache.backends(min_qubits=10)
+    assert service.listing_calls == 3
+
+
+def test_refresh_invalidates_selected_entries(setup):
+    cache, _, _, (first, second) = setup
+    for backend in (first, second):
+        cache.configuration(backend)
+        cache.status(backend)
+
+    cache.refresh('ibm_a', field='status')
+    for backend in (first, second):
+        cache.configuration(backend)
+        cache.status(backend)
+    assert (first.status_calls, second.status_calls) == (2, 1)
+    assert (first.configuration_calls, second.configuration_calls) == (1, 1)
+
+    cache.refresh()
+    cache.configuration(second)
+    assert second.configuration_calls == 2
@@ -0,0 +1,95 @@
+"""Tests of the asynchronous Braket batch runner against a fake device."""
+
+import asyncio
+import itertools
+import pytest
+
+pytest.importorskip('braket')
+
+from quantum_studies.bell_state_alg import QuantumExperiment  # noqa: E402
+
+
+class FakeResult:
+    def __init__(self, counts):
+        self.measurement_counts = counts
+
+
+class FakeTask:
+    """Reaches its final state after a number of state checks."""
+
+    ids = itertools.count()
+
+    def __init__(self, final_state: str, checks: int):
+        self.id = f"task-{next(self.ids)}"
+        self.final_state = final_state
+        self.checks = checks
+        self.cancelled = False
+
+    def state(self) -> str:
+        if self.cancelled:
+            return "CANCELLED"
+        self.checks -= 1
+        return self.final_state if self.checks <= 0 else "QUEUED"
+
+    def result(self) -> FakeResult:
+        return FakeResult({'00': 1})
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class FakeDevice:
+    """Device whose circuits are task specifications: (final state, state checks)."""
+
+    def __init__(self):
+        self.tasks = []
+
+    def run(self, circuit, shots):
+        task = FakeTask(*circuit)
+        self.tasks.append(task)
+        return task
+
+
+@pytest.fixture
+def experiment() -> QuantumExperiment:
+    experiment = QuantumExperiment("simulator", shots=1)
+    experiment.device = FakeDevice()
+    return experiment
+
+
+def iterate(experiment, circuits):
+    async def collect():
+        return [item async for item in experiment.iter_batch(circuits, initial_interval=0.001, max_interval=0.001)]
+    return asyncio.run(collect())
+
+
+def test_batch_returns_counts_in_input_order(experiment):
+    counts = experiment.run_batch([("COMPLETED", 3), ("COMPLETED", 1)])
+    assert counts == [{'00': 1}, {'00': 1}]
+
+
+def test_failed_task_cancels_the_unfinished_ones(experiment):
+    with pytest.raises(RuntimeError, match="ended in state FAILED"):
+        iterate(experiment, [("FAILED", 1), ("COMPLETED", 1000), ("COMPLETED", 1000)])
+    failed, *running = experiment.device.tasks
+    assert not failed.cancelled
+    assert len(running) == 2 and all(task.cancelled for task in running)
+
+
+def test_stopping_early_cancels_the_unfinished_ones(experiment):
+    async def first_only():
+        batch = experiment.iter_batch([("COMPLETED", 1), ("COMPLETED", 1000)], initial_interval=0.001, max_interval=0.001)
+        item = await batch.__anext__()
+        await batch.aclose()
+        return item
+
+    assert asyncio.run(first_only()) == (0, {'00': 1})
+    done, running = experiment.device.tasks
+    assert not done.cancelled and running.cancelled
+
+
+def test_run_batch_inside_a_running_loop(experiment):
+    async def notebook_cell():
+        return experiment.run_batch([("COMPLETED", 1)])
+
+    assert asyncio.run(notebook_cell()) == [{'00': 1}]
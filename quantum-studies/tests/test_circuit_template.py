@@ -0,0 +1,50 @@
+"""Compiled templates must transpile once and bind parameters by name."""
+
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter, ParameterVector
+from qiskit_ibm_runtime.fake_provider import FakeLimaV2
+from quantum_studies.circuit_template import CompiledTemplate
+from quantum_studies.transpile_cache import TranspileCache
+
+
+def rotations() -> QuantumCircuit:
+    angles = ParameterVector('a', 2)
+    circuit = QuantumCircuit(2)
+    circuit.ry(angles[0], 0)
+    circuit.rx(Parameter('b'), 1)
+    circuit.ry(angles[1], 1)
+    circuit.measure_all()
+    return circuit
+
+
+def test_template_is_transpiled_once_per_structure():
+    cache = TranspileCache()
+    first = CompiledTemplate(rotations(), FakeLimaV2(), transpile_cache=cache)
+    second = CompiledTemplate(rotations(), FakeLimaV2(), transpile_cache=cache)
+    assert cache.misses == 1 and cache.hits == 1
+    assert first.parameter_names == second.parameter_names
+
+
+def test_mapping_and_array_values_agree():
+    template = CompiledTemplate(rotations(), FakeLimaV2())
+    names = template.parameter_names
+    grid = np.random.default_rng(0).uniform(0, np.pi, (5, 3, len(names)))
+    angles = ParameterVector('a', 2)
+    mapped = template.values({angles: grid[..., [names.index('a[0]'), names.index('a[1]')]], 'b': grid[..., names.index('b')]})
+    assert mapped.shape == (5, 3, len(template.compiled.parameters))
+    assert np.allclose(mapped, template.values(grid))
+    with pytest.raises(ValueError, match="missing"):
+        template.values({'b': 0.1})
+
+
+def test_run_samples_every_parameter_set_without_a_backend():
+    template = CompiledTemplate(rotations())
+    assert template.parameter_names == ['a[0]', 'a[1]', 'b']
+    # a[0] = pi flips qubit 0; a[1] = pi flips qubit 1 unless b = pi undoes it first
+    values = np.array([[0.0, 0.0, 0.0], [np.pi, np.pi, 0.0], [0.0, np.pi, np.pi]])
+    result = template.run(values, shots=200)
+    assert result.data.meas.shape == (3,)
+    assert [result.data.meas[index].get_counts() for index in range(3)] == [{'00': 200}, {'11': 200}, {'00': 200}]
+    assert len(template.bind(values)) == 3
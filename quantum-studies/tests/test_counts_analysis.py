@@ -0,0 +1,88 @@
+"""Tests of the vectorized counts estimators against per-bitstring dictionary loops."""
+
+import numpy as np
+import pytest
+from quantum_studies.counts_analysis import (
+    CountsBatch, parity, population, population_with_error, z_expectations, z_expectations_with_error
+)
+from quantum_studies.shot_data import ShotArray, SparseCounts
+
+
+def random_histograms(num_histograms: int, num_bits: int, seed: int) -> list:
+    rng = np.random.default_rng(seed)
+    pool = list(dict.fromkeys(''.join(rng.choice(['0', '1'], size=num_bits)) for _ in range(20)))
+    histograms = []
+    for _ in range(num_histograms):
+        keys = rng.choice(len(pool), size=min(int(rng.integers(1, 10)), len(pool)), replace=False)
+        histograms.append({pool[key]: int(rng.integers(1, 500)) for key in keys})
+    return histograms, pool
+
+
+def dict_parity(counts: dict, indices) -> float:
+    shots = sum(counts.values())
+    return sum(value * (-1) ** sum(int(key[::-1][i]) for i in indices) for key, value in counts.items()) / shots
+
+
+def mixed_inputs(histograms: list, num_bits: int) -> list:
+    """Alternate between dictionaries, sparse counts and shot arrays."""
+    inputs = []
+    for index, counts in enumerate(histograms):
+        if index % 3 == 1:
+            inputs.append(SparseCounts.from_dict(counts, num_bits))
+        elif index % 3 == 2:
+            inputs.append(ShotArray.from_memory([key for key, value in counts.items() for _ in range(value)]))
+        else:
+            inputs.append(counts)
+    return inputs
+
+
+@pytest.mark.parametrize('num_bits', [4, 70])
+def test_population_matches_dict(num_bits):
+    histograms, pool = random_histograms(30, num_bits, seed=num_bits)
+    targets = pool[:5]
+    expected = [sum(c.get(t, 0) for t in targets) / sum(c.values()) for c in histograms]
+    np.testing.assert_allclose(population(mixed_inputs(histograms, num_bits), targets), expected)
+
+
+@pytest.mark.parametrize('num_bits', [4, 70])
+def test_parity_and_z_strings_match_dict(num_bits):
+    histograms, _ = random_histograms(30, num_bits, seed=num_bits + 1)
+    batch = CountsBatch.from_counts(mixed_inputs(histograms, num_bits))
+    np.testing.assert_array_equal(batch.shots, [sum(c.values()) for c in histograms])
+
+    np.testing.assert_allclose(parity(batch), [dict_parity(c, range(num_bits)) for c in histograms])
+    subset = [0, num_bits - 1]
+    np.testing.assert_allclose(parity(batch, subset), [dict_parity(c, subset) for c in histograms])
+
+    rng = np.random.default_rng(num_bits)
+    labels = [''.join(rng.choice(['I', 'Z'], size=num_bits)) for _ in range(4)]
+    expected = [
+        [dict_parity(c, [i for i, char in enumerate(reversed(label)) if char == 'Z']) for c in histograms]
+        for label in labels
+    ]
+    np.testing.assert_allclose(z_expectations(batch, labels), expected)
+
+
+def test_short_keys_and_empty_histograms():
+    values = population([{'11': 3, '0': 1}, {}], ['11'])
+    np.testing.assert_allclose(values, [0.75, 0.0])
+    np.testing.assert_allclose(z_expectations([{'01': 2, '10': 2}, {'11': 4}], ['ZI', 'IZ', 'ZZ']), [
+        [0.0, -1.0], [0.0, -1.0], [-1.0, 1.0]
+    ])
+    with pytest.raises(ValueError, match="Only 'Z' and 'I'"):
+        z_expectations([{'0': 1}], ['X'])
+
+
+def test_bootstrap_errors():
+    shots = 4000
+    histograms = [{'00': shots}, {'00': shots // 2, '11': shots // 4, '01': shots // 4}]
+    values, errors = population_with_error(histograms, ['00', '11'], num_resamples=400, seed=1)
+    np.testing.assert_allclose(values, [1.0, 0.75])
+    assert errors[0] == 0.0
+    # Binomial standard error sqrt(p (1 - p) / N)
+    assert errors[1] == pytest.approx(np.sqrt(0.75 * 0.25 / shots), rel=0.15)
+
+    values, errors = z_expectations_with_error(histograms, ['ZZ', 'IZ'], num_resamples=400, seed=1)
+    assert values.shape == errors.shape == (2, 2)
+    np.testing.assert_allclose(values, [[1.0, 0.5], [1.0, 0.0]])
+    assert errors[1, 1] == pytest.approx(1 / np.sqrt(shots), rel=0.15)
@@ -0,0 +1,127 @@
+"""Tests of Shor's 9-qubit encoder, stabilizer-code data and error-injection sweeps."""
+
+import numpy as np
+import pytest
+from qiskit.quantum_info import Pauli, Statevector
+from quantum_studies.error_correction import (
+    NineQubitErrorCorrection, StabilizerCode, error_sweep, pauli_from_label, syndrome_circuits
+)
+from quantum_studies.stabilizer import run_circuit
+
+SHOR_CHECKS = [
+    'Z0 Z1', 'Z1 Z2', 'Z3 Z4', 'Z4 Z5', 'Z6 Z7', 'Z7 Z8',
+    'X0 X1 X2 X3 X4 X5', 'X3 X4 X5 X6 X7 X8'
+]
+
+
+def gf2_rank(rows: np.ndarray) -> int:
+    rows = np.array(rows, dtype=bool)
+    rank = 0
+    for column in range(rows.shape[1]):
+        pivots = np.flatnonzero(rows[rank:, column])
+        if not len(pivots):
+            continue
+        pivot = rank + pivots[0]
+        rows[[rank, pivot]] = rows[[pivot, rank]]
+        others = np.flatnonzero(rows[:, column])
+        rows[others[others != rank]] ^= rows[rank]
+        rank += 1
+        if rank == len(rows):
+            break
+    return rank
+
+
+def symplectic(x: np.ndarray, z: np.ndarray) -> np.ndarray:
+    return np.hstack([np.atleast_2d(x), np.atleast_2d(z)])
+
+
+def in_span(generators: np.ndarray, row: np.ndarray) -> bool:
+    return gf2_rank(np.vstack([generators, row])) == gf2_rank(generators)
+
+
+@pytest.fixture(scope='module')
+def shor_code() -> StabilizerCode:
+    return NineQubitErrorCorrection().stabilizer_code()
+
+
+def test_encoder_prepares_the_standard_shor_states():
+    block_plus = (Statevector.from_label('000') + Statevector.from_label('111')) / np.sqrt(2)
+    block_minus = (Statevector.from_label('000') - Statevector.from_label('111')) / np.sqrt(2)
+    zero = block_plus.tensor(block_plus).tensor(block_plus)
+    one = block_minus.tensor(block_minus).tensor(block_minus)
+    alpha, beta = 0.6, 0.8
+    encoded = Statevector(NineQubitErrorCorrection().create_circuit(alpha, beta))
+    assert encoded.equiv(Statevector(alpha * zero.data + beta * one.data))
+
+
+def test_check_matrix_is_the_shor_stabilizer_group(shor_code):
+    assert (shor_code.num_qubits, shor_code.num_checks) == (9, 8)
+    checks = symplectic(shor_code.check_x, shor_code.check_z)
+    assert gf2_rank(checks) == 8
+    for label in SHOR_CHECKS:
+        assert in_span(checks, symplectic(*pauli_from_label(label, 9))), label
+
+    # Every check, with its sign, stabilizes the encoded state
+    encoded = Statevector(NineQubitErrorCorrection().create_circuit())
+    for x, z, sign in zip(shor_code.check_x, shor_code.check_z, shor_code.check_sign):
+        assert encoded.expectation_value(Pauli((z, x))).real == pytest.approx(-1 if sign else 1)
+
+
+def test_logical_operators(shor_code):
+    checks = symplectic(shor_code.check_x, shor_code.check_z)
+    # Logical Z is X on every qubit and logical X is Z on every qubit, up to stabilizers
+    assert in_span(checks, symplectic(*shor_code.logical_z) ^ symplectic(*pauli_from_label('X' * 9)))
+    assert in_span(checks, symplectic(*shor_code.logical_x) ^ symplectic(*pauli_from_label('Z' * 9)))
+    assert not shor_code.syndromes(*shor_code.logical_x).any()
+    assert not shor_code.syndromes(*shor_code.logical_z).any()
+    assert shor_code.logical_flips(*shor_code.logical_x).tolist() == [[True, False]]
+    assert shor_code.logical_flips(*shor_code.logical_z).tolist() == [[False, True]]
+
+
+def test_label_and_matrix_constructors_agree(shor_code):
+    from_labels = StabilizerCode.from_labels(SHOR_CHECKS, 'Z' * 9, 'X' * 9, num_qubits=9)
+    matrix = symplectic(from_labels.check_x, from_labels.check_z)
+    from_matrix = StabilizerCode.from_check_matrix(matrix, 'Z' * 9, 'X' * 9)
+    np.testing.assert_array_equal(from_matrix.check_z, from_labels.check_z)
+    assert error_sweep(from_labels, 2).failed.sum() == error_sweep(shor_code, 2).failed.sum()
+
+
+def test_every_weight_one_error_is_corrected(shor_code):
+    sweep = error_sweep(shor_code, max_weight=1)
+    assert len(sweep.error_x) == 1 + 27
+    assert sweep.decoded.all()
+    assert not sweep.failed.any()
+    # Z errors within a block are degenerate, so 27 errors share 21 non-trivial syndromes
+    assert len(sweep.table()) == 1 + 21
+    assert all(result == 'ok' for _, _, result in sweep.report())
+
+
+def test_logical_error_rate_of_the_bit_flip_code():
+    code = StabilizerCode.from_labels(['ZZI', 'IZZ'], 'XXX', 'IIZ')
+    sweep = error_sweep(code, max_weight=3, table_weight=1)
+    p = np.array([0.01, 0.1, 0.3])
+    # Under bit flips only, majority vote fails when two or three qubits flip
+    rates = sweep.logical_error_rate(p, pauli_weights=(1.0, 0.0, 0.0))
+    np.testing.assert_allclose(rates, 3 * p ** 2 * (1 - p) + p ** 3)
+    # Under phase flips only, any odd number of Z errors is a logical phase flip
+    rates = sweep.logical_error_rate(p, pauli_weights=(0.0, 0.0, 1.0))
+    np.testing.assert_allclose(rates, 3 * p * (1 - p) ** 2 + p ** 3)
+
+
+def test_shor_logical_error_rate_is_second_order(shor_code):
+    sweep = error_sweep(shor_code, max_weight=2)
+    failures = int(sweep.failed.sum())
+    assert failures == 117
+    p = 1e-3
+    rate = sweep.logical_error_rate([p])[0]
+    # Only weight-2 errors fail: each has probability (p / 3)^2 (1 - p)^7
+    assert rate == pytest.approx(failures * (p / 3) ** 2 * (1 - p) ** 7)
+
+
+def test_syndrome_circuits_measure_the_sweep_syndromes(shor_code):
+    encoder = NineQubitErrorCorrection().create_circuit()
+    sweep = error_sweep(shor_code, max_weight=1)
+    circuits = syndrome_circuits(encoder, shor_code, sweep.error_x, sweep.error_z)
+    for circuit, syndrome in zip(circuits, sweep.syndromes):
+        counts = run_circuit(circuit, shots=16, seed=0).get_counts()
+        assert counts == {format(int(syndrome), '08b'): 16}
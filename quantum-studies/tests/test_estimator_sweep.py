@@ -0,0 +1,72 @@
+"""Tests of broadcast estimator sweeps against per-point StatevectorEstimator runs."""
+
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.primitives import StatevectorEstimator
+from qiskit.quantum_info import SparsePauliOp
+from qiskit_ibm_runtime.fake_provider import FakeLimaV2
+from quantum_studies.estimator_sweep import EstimatorSweep, observable_labels, parameter_grid
+
+OBSERVABLES = ['ZI', 'XX', SparsePauliOp(['ZZ', 'YI'], coeffs=[0.5, -2.0])]
+
+
+def ansatz() -> QuantumCircuit:
+    circuit = QuantumCircuit(2)
+    circuit.ry(Parameter('theta'), 0)
+    circuit.cx(0, 1)
+    circuit.rx(Parameter('alpha'), 1)
+    circuit.rz(Parameter('phi'), 0)
+    circuit.h(0)
+    return circuit
+
+
+def per_point(circuit: QuantumCircuit, grid: dict, observable) -> float:
+    values = [grid[parameter.name] for parameter in circuit.parameters]
+    return float(StatevectorEstimator().run([(circuit, observable, values)]).result()[0].data.evs)
+
+
+def test_grid_follows_circuit_parameter_order():
+    circuit = ansatz()
+    values, dims, coords = parameter_grid(circuit, {'theta': [0.1, 0.2, 0.3], 'phi': 0.5, 'alpha': [1.0, 2.0]})
+    assert dims == ('theta', 'alpha') and values.shape == (3, 2, 3)
+    # circuit.parameters is sorted by name: alpha, phi, theta
+    np.testing.assert_allclose(values[2, 1], [2.0, 0.5, 0.3])
+    with pytest.raises(ValueError, match="missing"):
+        parameter_grid(circuit, {'theta': [0.1]})
+    assert observable_labels(OBSERVABLES) == ['ZI', 'XX', 'obs2']
+
+
+@pytest.mark.parametrize('backend', [None, FakeLimaV2()], ids=['ideal', 'compiled'])
+def test_broadcast_grid_equals_per_point_runs(backend):
+    circuit = ansatz()
+    theta = np.linspace(0, np.pi, 4)
+    alpha = np.linspace(-1, 1, 3)
+    sweep = EstimatorSweep(backend=backend)
+    result = sweep.run(circuit, {'theta': theta, 'alpha': alpha, 'phi': 0.7}, OBSERVABLES)
+
+    assert result.shape == (4, 3, 3)
+    assert result.dims == ('theta', 'alpha', 'observable')
+    for i, t in enumerate(theta):
+        for j, a in enumerate(alpha):
+            for k, observable in enumerate(OBSERVABLES):
+                point = {'theta': t, 'alpha': a, 'phi': 0.7}
+                assert result.evs[i, j, k] == pytest.approx(per_point(circuit, point, observable), abs=1e-9)
+
+    line = result.sel(alpha=alpha[1], observable='XX')
+    assert line.dims == ('theta',)
+    np.testing.assert_allclose(line.evs, result.evs[:, 1, 1])
+    best = result.argmin('ZI')
+    position = np.unravel_index(np.argmin(result.evs[..., 0]), (4, 3))
+    assert best == {'theta': theta[position[0]], 'alpha': alpha[position[1]]}
+
+
+def test_repeated_sweeps_reuse_the_compiled_circuit():
+    sweep = EstimatorSweep(backend=FakeLimaV2())
+    grid = {'theta': [0.0, 1.0], 'alpha': 0.0, 'phi': 0.0}
+    first = sweep.run(ansatz(), grid, {'z': 'ZI'})
+    second = sweep.run(ansatz(), grid, {'z': 'ZI'})
+    assert sweep.transpile_cache.misses == 1 and sweep.transpile_cache.hits == 1
+    np.testing.assert_allclose(first.evs, second.evs)
+    assert list(second.coords['observable']) == ['z']
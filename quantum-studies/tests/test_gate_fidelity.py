@@ -0,0 +1,50 @@
+"""Batched gate fidelities must agree with qiskit.quantum_info one channel at a time."""
+
+import numpy as np
+import pytest
+from qiskit.quantum_info import Choi, Operator, PTM, average_gate_fidelity, process_fidelity, random_unitary
+from quantum_studies import gate_fidelity as gf
+
+
+@pytest.fixture(scope='module')
+def unitaries():
+    target = random_unitary(4, seed=1).data
+    # Small random perturbations of the target, plus a global phase that must not matter
+    channels = np.array([
+        np.exp(0.3j * k) * random_unitary(4, seed=10 + k).power(0.05 * k).data @ target
+        for k in range(6)
+    ])
+    return channels, target
+
+
+def test_unitary_fidelities_match_qiskit(unitaries):
+    channels, target = unitaries
+    results = gf.gate_fidelities(channels, target)
+    for index, channel in enumerate(channels):
+        assert results['process_fidelity'][index] == pytest.approx(process_fidelity(Operator(channel), Operator(target)))
+        assert results['average_gate_fidelity'][index] == pytest.approx(average_gate_fidelity(Operator(channel), Operator(target)))
+
+
+@pytest.mark.parametrize('rep, convert', [('choi', Choi), ('ptm', PTM)])
+def test_superoperator_representations_agree(unitaries, rep, convert):
+    channels, target = unitaries
+    stack = np.array([convert(Operator(channel)).data for channel in channels])
+    assert np.allclose(gf.process_fidelity(stack, target, rep), gf.process_fidelity(channels, target))
+
+
+def test_converters_match_qiskit(unitaries):
+    channels, _ = unitaries
+    assert np.allclose(gf.choi_from_unitaries(channels), [Choi(Operator(u)).data for u in channels])
+    assert np.allclose(gf.ptm_from_unitaries(channels), [PTM(Operator(u)).data for u in channels])
+
+
+def test_diamond_distance_of_unitaries(unitaries):
+    channels, target = unitaries
+    bounds = gf.diamond_norm_bound(channels, target)
+    assert bounds[0] == pytest.approx(0, abs=1e-7)
+    # Z versus identity is perfectly distinguishable
+    assert gf.diamond_norm_bound(np.diag([1, -1]), np.eye(2))[0] == pytest.approx(2)
+    # Rz(phi) versus identity: 2 sin(phi / 2)
+    phi = 0.4
+    assert gf.diamond_norm_bound(np.diag([1, np.exp(1j * phi)]), np.eye(2))[0] == pytest.approx(2 * np.sin(phi / 2))
+    assert ((bounds >= 0) & (bounds <= 2)).all()
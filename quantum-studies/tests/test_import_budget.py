@@ -0,0 +1,29 @@
+"""Import-time budget of the runner: headless submission workers must start lean."""
+
+import pytest
+from quantum_studies.benchmarks import HEAVY_MODULES, benchmark_import
+
+# Seconds ``import quantum_studies.ibm_qpus`` may take on top of ``import qiskit``
+IMPORT_OVERHEAD_BUDGET = 1.0
+
+
+@pytest.fixture(scope='module')
+def baseline() -> dict:
+    return benchmark_import('qiskit')
+
+
+@pytest.fixture(scope='module')
+def runner_import() -> dict:
+    return benchmark_import('quantum_studies.ibm_qpus')
+
+
+def test_runner_import_skips_heavy_modules(runner_import):
+    # benchmark_import prints the names of any heavy module it finds
+    assert runner_import['import_heavy_modules'] == 0, f"one of {', '.join(HEAVY_MODULES)} was imported"
+
+
+def test_runner_import_time_budget(baseline, runner_import):
+    overhead = runner_import['import_seconds'] - baseline['import_seconds']
+    assert overhead < IMPORT_OVERHEAD_BUDGET, (
+        f"import took {runner_import['import_seconds']:.2f}s ({overhead:.2f}s over qiskit)"
+    )
@@ -0,0 +1,56 @@
+"""Noise-aware layout selection scored on fake backend error maps."""
+
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit_ibm_runtime.fake_provider import FakeGuadalupeV2, FakeLimaV2
+from quantum_studies.noise_aware_layout import ErrorMap, select_layouts
+from quantum_studies.transpile_service import TranspileService
+
+
+def ghz(num_qubits: int) -> QuantumCircuit:
+    circuit = QuantumCircuit(num_qubits)
+    circuit.h(0)
+    for qubit in range(1, num_qubits):
+        circuit.cx(qubit - 1, qubit)
+    circuit.measure_all()
+    return circuit
+
+
+@pytest.fixture(scope='module')
+def service():
+    with TranspileService([FakeGuadalupeV2()], max_workers=1) as service:
+        yield service
+
+
+def test_seeds_are_separate_tasks(service):
+    results = list(service.stream([ghz(4)], targets=['fake_guadalupe'], seeds=[1, 2, 3]))
+    assert sorted(result.seed for result in results) == [1, 2, 3]
+
+
+def test_error_map_success_probability():
+    backend = FakeLimaV2()
+    error_map = ErrorMap.from_backend(backend)
+    assert error_map.success_probability(QuantumCircuit(5)) == 1.0
+    measured = QuantumCircuit(5, 1)
+    measured.measure(3, 0)
+    assert error_map.success_probability(measured) == pytest.approx(1 - error_map.readout_errors[3])
+    # Idling between two gates only lowers the estimate
+    busy, idle = QuantumCircuit(5), QuantumCircuit(5)
+    for circuit in (busy, idle):
+        circuit.x(0)
+    idle.delay(20, 0, unit='us')
+    for circuit in (busy, idle):
+        circuit.x(0)
+    assert error_map.success_probability(idle) < error_map.success_probability(busy) < 1
+
+
+def test_select_layouts_ranks_trials_by_success_probability(service):
+    backend = service.targets['fake_guadalupe']
+    selection, = select_layouts([ghz(5)], backend, trials=4, optimization_levels=(1,), service=service)
+    scores = [trial.success_probability for trial in selection.trials]
+    assert len(scores) == 4 and scores == sorted(scores, reverse=True)
+    assert selection.best.success_probability >= selection.min_depth.success_probability
+    assert sorted(trial.seed for trial in selection.trials) == [0, 1, 2, 3]
+    assert len(set(selection.best.layout)) == 5
+    assert np.isclose(selection.best.success_probability, ErrorMap.from_backend(backend).success_probability(selection.circuit))
@@ -0,0 +1,45 @@
+"""Batched noise sweeps must agree with qiskit.quantum_info channel by channel."""
+
+import numpy as np
+import pytest
+from qiskit.quantum_info import DensityMatrix, Kraus, concurrence, purity, state_fidelity
+from quantum_studies import noise_sweep as ns
+
+STRENGTHS = np.linspace(0, 0.9, 4)
+
+
+def reference(state: np.ndarray, name: str, strength: float) -> DensityMatrix:
+    """Apply one channel to every qubit with qiskit.quantum_info."""
+    rho = DensityMatrix(state)
+    channel = Kraus(list(ns.CHANNELS[name](strength)[0]))
+    for qubit in range(rho.num_qubits):
+        rho = rho.evolve(channel, [qubit])
+    return rho
+
+
+@pytest.mark.parametrize('name', list(ns.CHANNELS))
+def test_channels_match_qiskit_on_ghz(name):
+    ghz = ns.ghz_state(3)
+    sweep = ns.noise_sweep(ghz, **{name: STRENGTHS})
+    assert sweep.dims == (name,) and sweep.shape == (len(STRENGTHS),)
+    for strength, state in zip(STRENGTHS, sweep.states):
+        assert np.allclose(state, reference(ghz, name, strength).data, atol=1e-12)
+
+
+def test_bell_metrics_match_qiskit():
+    bell = ns.bell_state('psi-')
+    sweep = ns.noise_sweep(bell, depolarizing=STRENGTHS, amplitude_damping=STRENGTHS, dephasing=0.1)
+    assert sweep.shape == (len(STRENGTHS), len(STRENGTHS))
+    fidelity, purities, concurrences = sweep.fidelity().ravel(), sweep.purity().ravel(), sweep.concurrence().ravel()
+    for index, state in enumerate(sweep.states):
+        rho = DensityMatrix(state)
+        assert fidelity[index] == pytest.approx(state_fidelity(rho, DensityMatrix(bell)), abs=1e-8)
+        assert purities[index] == pytest.approx(purity(rho).real, abs=1e-10)
+        assert concurrences[index] == pytest.approx(concurrence(rho), abs=1e-6)
+
+
+def test_noiseless_sweep_keeps_the_ideal_state():
+    bell = ns.bell_state()
+    sweep = ns.noise_sweep(bell)
+    assert sweep.shape == ()
+    assert np.allclose(sweep.fidelity(), 1) and np.allclose(sweep.concurrence(), 1)
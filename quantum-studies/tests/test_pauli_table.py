@@ -0,0 +1,64 @@
+"""The bit-packed Pauli table must agree with qiskit.quantum_info.PauliList."""
+
+import numpy as np
+import pytest
+from qiskit.quantum_info import PauliList, SparsePauliOp, random_pauli_list, random_statevector
+from quantum_studies.pauli_table import PauliTable
+
+
+@pytest.fixture(scope='module')
+def paulis():
+    return random_pauli_list(6, 50, seed=3, phase=False)
+
+
+def test_label_round_trip(paulis):
+    table = PauliTable.from_labels(paulis.to_labels())
+    assert table.to_labels() == paulis.to_labels()
+    assert np.array_equal(table.weights(), [sum(letter != 'I' for letter in p.to_label()) for p in paulis])
+    operator = SparsePauliOp(paulis, np.arange(len(paulis)))
+    assert PauliTable.from_sparse_pauli_op(operator).to_sparse_pauli_op().equiv(operator)
+
+
+def test_products_and_commutation_match_pauli_list():
+    left = random_pauli_list(70, 30, seed=5)
+    right = random_pauli_list(70, 30, seed=6)
+    products = PauliTable.from_labels(left.to_labels()).dot(PauliTable.from_labels(right.to_labels()))
+    assert products.to_labels() == left.dot(right).to_labels()
+    assert np.array_equal(
+        PauliTable.from_labels(left.to_labels()).commutes(PauliTable.from_labels(right.to_labels())),
+        left.commutes(right)
+    )
+
+
+@pytest.mark.parametrize('qubit_wise', [True, False])
+def test_groups_commute_and_cover_every_term(paulis, qubit_wise):
+    table = PauliTable.from_labels(paulis.to_labels())
+    groups = table.group_qubit_wise_commuting() if qubit_wise else table.group_commuting()
+    assert sorted(np.concatenate(groups)) == list(range(len(paulis)))
+    for group in groups:
+        members = paulis[list(group)]
+        for pauli in members:
+            if qubit_wise:
+                assert all(pauli_commutes_qubit_wise(pauli, other) for other in members)
+            else:
+                assert members.commutes(pauli).all()
+
+
+def pauli_commutes_qubit_wise(first, second) -> bool:
+    return all(a == 'I' or b == 'I' or a == b for a, b in zip(first.to_label(), second.to_label()))
+
+
+def test_statevector_expectations_match_qiskit(paulis):
+    state = random_statevector(2 ** 6, seed=9)
+    table = PauliTable.from_labels(paulis.to_labels())
+    exact = np.array([state.expectation_value(pauli) for pauli in paulis])
+    assert np.allclose(table.expectation_values(state), exact, atol=1e-12)
+
+
+def test_sample_expectations_of_diagonal_terms():
+    state = random_statevector(2 ** 4, seed=2)
+    labels = ['ZZII', 'IZIZ', 'ZZZZ', 'IIII']
+    probabilities = state.probabilities_dict()
+    counts = {bits: int(round(p * 2 ** 24)) for bits, p in probabilities.items()}
+    exact = [state.expectation_value(PauliList([label])[0]).real for label in labels]
+    assert np.allclose(PauliTable.from_labels(labels).expectation_values_from_samples(counts), exact, atol=1e-6)
@@ -0,0 +1,45 @@
+"""The closed-form QPE distribution must match simulated phase-estimation circuits."""
+
+import numpy as np
+from qiskit.primitives import StatevectorSampler
+from qiskit.quantum_info import Statevector
+from quantum_studies.phase_estimation import (
+    estimates,
+    outcome_probabilities,
+    phase_estimation_circuit,
+    sweep_counts,
+    sweep_pub,
+)
+
+THETAS = np.array([0.0, 0.125, 0.2, 1 / 3, 0.5, 0.61, 0.999])
+
+
+def test_closed_form_matches_exact_circuit_distribution():
+    t = 4
+    probabilities = outcome_probabilities(THETAS, t)
+    assert np.allclose(probabilities.sum(axis=1), 1.0)
+    for theta, row in zip(THETAS, probabilities):
+        circuit = phase_estimation_circuit(t, theta)
+        circuit.remove_final_measurements()
+        exact = Statevector(circuit).probabilities(range(t))
+        assert np.allclose(row, exact, atol=1e-10)
+
+
+def test_sweep_pub_counts_match_closed_form():
+    t, shots = 3, 4000
+    circuit = phase_estimation_circuit(t)
+    result = StatevectorSampler(seed=1234).run([sweep_pub(circuit, THETAS, shots)]).result()[0]
+    counts = sweep_counts(result, t)
+
+    assert counts.shape == (len(THETAS), 2 ** t)
+    assert (counts.sum(axis=1) == shots).all()
+    # Every outcome frequency within 5 standard deviations of its closed-form probability
+    probabilities = outcome_probabilities(THETAS, t)
+    sigma = np.sqrt(probabilities * (1 - probabilities) / shots)
+    assert (np.abs(counts / shots - probabilities) <= 5 * sigma + 1e-3).all()
+
+
+def test_estimates_recover_exactly_representable_phases():
+    t = 5
+    thetas = np.arange(2 ** t) / 2 ** t
+    assert np.allclose(estimates(outcome_probabilities(thetas, t)), thetas)
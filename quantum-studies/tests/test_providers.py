@@ -0,0 +1,101 @@
+"""Offline tests of the runtime providers and IBMQuantumRunner against fake backends."""
+
+import time
+import pytest
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import Parameter
+from qiskit_ibm_runtime.fake_provider import FakeLimaV2, FakeManilaV2
+from quantum_studies.ibm_qpus import IBMQuantumRunner
+from quantum_studies.providers import LocalRuntimeProvider
+
+
+def bell_circuit() -> QuantumCircuit:
+    circuit = QuantumCircuit(2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.measure_all()
+    return circuit
+
+
+@pytest.fixture
+def runner() -> IBMQuantumRunner:
+    runner = IBMQuantumRunner(provider=LocalRuntimeProvider([FakeManilaV2(), FakeLimaV2()]))
+    runner.select_backend('fake_manila')
+    return runner
+
+
+def test_local_provider_lists_and_resolves_backends():
+    provider = LocalRuntimeProvider([FakeManilaV2(), FakeLimaV2()])
+    assert sorted(backend.name for backend in provider.backends()) == ['fake_lima', 'fake_manila']
+    assert provider.backends(min_num_qubits=6) == []
+    assert provider.backend('fake_lima').num_qubits == 5
+    with pytest.raises(ValueError, match="Unknown local backend"):
+        provider.backend('ibm_nowhere')
+
+
+def test_local_jobs_queue_one_after_another():
+    provider = LocalRuntimeProvider([FakeLimaV2()], queue_latency=0.2)
+    backend = provider.backend('fake_lima')
+    sampler = provider.sampler(backend)
+    transpiled = transpile(bell_circuit(), backend)
+    start = time.monotonic()
+    first = sampler.run([transpiled], shots=64)
+    second = sampler.run([transpiled], shots=64)
+    assert first.status() == "QUEUED" and not second.done()
+    second.result()
+    assert time.monotonic() - start >= 0.4
+    assert first.done() and first.in_final_state()
+    assert first.job_id() != second.job_id()
+
+
+def test_run_circuits_preserves_pub_order(runner):
+    theta = Parameter('theta')
+    rotation = QuantumCircuit(1)
+    rotation.rx(theta, 0)
+    rotation.measure_all()
+    x = QuantumCircuit(1)
+    x.x(0)
+    x.measure_all()
+
+    results = runner.run_circuits([bell_circuit(), (rotation, [[0.0], [3.14159]]), x], shots=300)
+
+    assert len(results) == 3
+    bell = runner.get_counts(results[0])
+    assert sum(bell.values()) == 300
+    assert bell.get('00', 0) + bell.get('11', 0) > 240
+    assert results[1].data.meas.shape == (2,)
+    assert results[1].data.meas.num_shots == 300
+    assert runner.get_counts(results[2]).get('1', 0) > 240
+
+
+def test_run_circuits_reuses_transpilations(runner):
+    runner.run_circuits([bell_circuit()], shots=32)
+    hits = runner.transpile_cache.hits
+    runner.run_circuits([bell_circuit(), bell_circuit()], shots=32)
+    assert runner.transpile_cache.hits == hits + 2
+
+
+def test_run_circuits_requires_a_backend():
+    runner = IBMQuantumRunner(provider=LocalRuntimeProvider([FakeLimaV2()]))
+    with pytest.raises(RuntimeError, match="No backend selected"):
+        runner.run_circuits([bell_circuit()])
+    assert runner.run_circuits([], backend_name='fake_lima') == []
+
+
+def test_run_circuit_only_plots_on_request(runner, monkeypatch):
+    plotted = []
+    monkeypatch.setattr(runner, 'plot_counts', lambda counts, title=None: plotted.append(counts))
+    runner.run_circuit(bell_circuit(), shots=64)
+    assert plotted == []
+    runner.run_circuit(bell_circuit(), shots=64, plot_results=True)
+    assert sum(plotted[0].values()) == 64
+
+
+def test_run_circuit_plotting_errors_skip_troubleshooting(runner, monkeypatch, capsys):
+    def broken_plot(counts, title=None):
+        raise ImportError("no display")
+
+    monkeypatch.setattr(runner, 'plot_counts', broken_plot)
+    with pytest.raises(ImportError, match="no display"):
+        runner.run_circuit(bell_circuit(), shots=64, plot_results=True)
+    assert "Troubleshooting steps" not in capsys.readouterr().out
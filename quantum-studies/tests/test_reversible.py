@@ -0,0 +1,96 @@
+"""Tests of the reversible-circuit simulators against Statevector."""
+
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit.library import MCXGate
+from qiskit.quantum_info import Statevector
+from quantum_studies.reversible import (
+    NonReversibleCircuitError, ReversibleSimulator, ints_to_states, is_affine, is_reversible_classical,
+    states_to_ints
+)
+from quantum_studies.shot_data import WORD_BITS, num_words
+
+
+def random_reversible(num_qubits: int, num_gates: int, rng: np.random.Generator) -> QuantumCircuit:
+    """X, CX, CCX, open-controlled MCX and SWAP gates, partly wrapped in a custom gate."""
+    circuit = QuantumCircuit(num_qubits)
+    for _ in range(num_gates):
+        kind = rng.integers(5)
+        qubits = [int(q) for q in rng.choice(num_qubits, size=min(4, num_qubits), replace=False)]
+        if kind == 0:
+            circuit.x(qubits[0])
+        elif kind == 1:
+            circuit.cx(qubits[0], qubits[1])
+        elif kind == 2 and num_qubits >= 3:
+            circuit.ccx(*qubits[:3])
+        elif kind == 3 and num_qubits >= 4:
+            circuit.append(MCXGate(3, ctrl_state=int(rng.integers(8))), qubits)
+        else:
+            circuit.swap(qubits[0], qubits[1])
+    block = QuantumCircuit(2, name='block')
+    block.cx(0, 1)
+    block.x(0)
+    circuit.append(block.to_gate(), [0, num_qubits - 1])
+    return circuit
+
+
+def statevector_images(circuit: QuantumCircuit):
+    """Basis state each basis state is mapped to, read from the statevector evolution of all of them."""
+    images = []
+    for value in range(2 ** circuit.num_qubits):
+        probabilities = Statevector.from_int(value, 2 ** circuit.num_qubits).evolve(circuit).probabilities()
+        images.append(int(np.argmax(probabilities)))
+        assert probabilities[images[-1]] == pytest.approx(1.0)
+    return images
+
+
+def to_planes(values, num_qubits: int) -> np.ndarray:
+    bits = np.array([[value >> qubit & 1 for qubit in range(num_qubits)] for value in values], dtype=np.uint8)
+    lanes = num_words(len(values))
+    padded = np.zeros((lanes * WORD_BITS, num_qubits), dtype=np.uint8)
+    padded[:len(values)] = bits
+    packed = np.packbits(padded.T, axis=1, bitorder='little')
+    return np.ascontiguousarray(packed).view(np.uint64).reshape(num_qubits, lanes)
+
+
+def from_planes(planes: np.ndarray, count: int):
+    bits = np.unpackbits(planes.view(np.uint8), axis=1, bitorder='little')[:, :count]
+    return [sum(int(bits[qubit, index]) << qubit for qubit in range(planes.shape[0])) for index in range(count)]
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_row_simulator_matches_statevector(seed):
+    rng = np.random.default_rng(seed)
+    circuit = random_reversible(5, 25, rng)
+    assert is_reversible_classical(circuit)
+    simulator = ReversibleSimulator(circuit)
+    assert simulator.run_ints(range(2 ** 5)) == statevector_images(circuit)
+
+
+@pytest.mark.parametrize('num_qubits', [6, 70, 130])
+def test_bit_sliced_simulator_matches_rows(num_qubits):
+    rng = np.random.default_rng(num_qubits)
+    circuit = random_reversible(num_qubits, 200, rng)
+    simulator = ReversibleSimulator(circuit)
+    values = [int(value) for value in rng.integers(0, 2 ** 62, size=100)]
+    values = [value | (value << 62) | (value << 124) for value in values]
+    values = [value & ((1 << num_qubits) - 1) for value in values]
+    rows = simulator.run_ints(values)
+    assert from_planes(simulator.run_planes(to_planes(values, num_qubits)), len(values)) == rows
+    assert states_to_ints(ints_to_states(values, num_qubits)) == values
+
+
+def test_non_reversible_operations_are_rejected():
+    circuit = QuantumCircuit(2)
+    circuit.cx(0, 1)
+    assert is_affine(circuit)
+    circuit.append(MCXGate(1), [1, 0])
+    assert is_affine(circuit)
+    toffoli = QuantumCircuit(3)
+    toffoli.ccx(0, 1, 2)
+    assert is_reversible_classical(toffoli) and not is_affine(toffoli)
+    circuit.h(0)
+    assert not is_reversible_classical(circuit) and not is_affine(circuit)
+    with pytest.raises(NonReversibleCircuitError, match="not a classical reversible gate"):
+        ReversibleSimulator(circuit)
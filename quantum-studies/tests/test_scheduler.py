@@ -0,0 +1,125 @@
+"""Tests of the queue-aware scheduler on fake backend metadata."""
+
+from typing import Any, Dict, List
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit.library import QFTGate
+from qiskit_ibm_runtime.fake_provider import FakeManilaV2, FakeSherbrooke, FakeTorino
+from quantum_studies.ibm_qpus import IBMQuantumRunner
+from quantum_studies.providers import LocalRuntimeProvider
+from quantum_studies.scheduler import BackendCandidate, QueueAwareScheduler, interaction_degree
+
+
+class FakeMetadata:
+    """Stand-in for BackendMetadataCache with fixed configurations and queue lengths."""
+
+    def __init__(self, backends: List[Any], pending_jobs: Dict[str, int], down: tuple = ()):
+        self._backends = backends
+        self.pending_jobs = pending_jobs
+        self.down = set(down)
+
+    def backends(self, min_qubits: int = 1, operational_only: bool = True) -> List:
+        return [backend for backend in self._backends if backend.num_qubits >= min_qubits]
+
+    def statuses(self, backends: List[Any]) -> Dict[str, Dict[str, Any]]:
+        return {
+            backend.name: {
+                'operational': backend.name not in self.down,
+                'status_msg': 'active',
+                'pending_jobs': self.pending_jobs[backend.name]
+            }
+            for backend in backends
+        }
+
+    def configuration(self, backend: Any) -> Dict[str, Any]:
+        return {
+            'num_qubits': backend.num_qubits,
+            'basis_gates': list(backend.operation_names),
+            'coupling_map': [list(edge) for edge in backend.coupling_map.get_edges()]
+        }
+
+
+def star_circuit(num_qubits: int) -> QuantumCircuit:
+    circuit = QuantumCircuit(num_qubits)
+    circuit.h(0)
+    for target in range(1, num_qubits):
+        circuit.cx(0, target)
+    circuit.measure_all()
+    return circuit
+
+
+def qft_circuit(num_qubits: int) -> QuantumCircuit:
+    circuit = QuantumCircuit(num_qubits)
+    circuit.h(range(num_qubits))
+    circuit.append(QFTGate(num_qubits), range(num_qubits))
+    return circuit.decompose()
+
+
+def test_sparse_coupling_maps_are_not_rejected():
+    metadata = FakeMetadata(
+        [FakeManilaV2(), FakeSherbrooke(), FakeTorino()],
+        {'fake_manila': 0, 'fake_sherbrooke': 0, 'fake_torino': 0}
+    )
+    scheduler = QueueAwareScheduler(metadata)
+
+    star = star_circuit(4)
+    assert interaction_degree(star) == 3
+    candidates = {c.name: c for c in scheduler.candidates_for([star])}
+    assert set(candidates) == {'fake_manila', 'fake_sherbrooke', 'fake_torino'}
+    assert candidates['fake_manila'].needs_routing
+
+    qft = qft_circuit(6)
+    assert interaction_degree(qft) == 5
+    candidates = scheduler.candidates_for([qft])
+    assert {c.name for c in candidates} == {'fake_sherbrooke', 'fake_torino'}
+    assert all(c.needs_routing for c in candidates)
+
+
+def test_routing_only_breaks_ties_in_queue_length():
+    metadata = FakeMetadata([FakeManilaV2(), FakeSherbrooke()], {'fake_manila': 0, 'fake_sherbrooke': 0})
+    scheduler = QueueAwareScheduler(metadata)
+    # Manila is a line (degree 2), Sherbrooke heavy-hex (degree 3): only Sherbrooke fits a 4-qubit star
+    assert [c.name for c in scheduler.candidates(4, min_degree=3)] == ['fake_sherbrooke', 'fake_manila']
+    assert [c.name for c in scheduler.candidates(4, min_degree=2)] == ['fake_manila', 'fake_sherbrooke']
+
+    metadata.pending_jobs['fake_sherbrooke'] = 1
+    assert [c.name for c in scheduler.candidates(4, min_degree=3)] == ['fake_manila', 'fake_sherbrooke']
+
+
+def test_candidates_sorted_by_queue_and_filtered():
+    metadata = FakeMetadata(
+        [FakeManilaV2(), FakeSherbrooke(), FakeTorino()],
+        {'fake_manila': 5, 'fake_sherbrooke': 2, 'fake_torino': 2},
+        down=('fake_sherbrooke',)
+    )
+    scheduler = QueueAwareScheduler(metadata, seconds_per_queued_job=10.0)
+    candidates = scheduler.candidates(2)
+    assert [(c.name, c.queue_seconds) for c in candidates] == [('fake_torino', 20.0), ('fake_manila', 50.0)]
+    assert [c.name for c in scheduler.candidates(2, required_gates=['ecr'])] == []
+    assert [c.name for c in scheduler.candidates(6)] == ['fake_torino']
+
+
+def candidate(name: str, queue_seconds: float) -> BackendCandidate:
+    return BackendCandidate(name, 127, 0, None, queue_seconds)
+
+
+def test_split_minimizes_latest_completion():
+    scheduler = QueueAwareScheduler(FakeMetadata([], {}), seconds_per_circuit=2.0)
+    candidates = [candidate('a', 0.0), candidate('b', 4.0), candidate('c', 100.0)]
+
+    assert scheduler.split(3, candidates) == ['a', 'a', 'a']
+    # 'b' starts 4 s behind, so 'a' takes three circuits before they alternate
+    assert scheduler.split(6, candidates, max_backends=2) == ['a', 'a', 'a', 'b', 'a', 'b']
+    assignment = scheduler.split(60, candidates, max_backends=3)
+    assert assignment.count('c') == 0
+    assert abs(assignment.count('a') - assignment.count('b')) == 2
+    with pytest.raises(RuntimeError, match="No backend"):
+        scheduler.split(1, [])
+
+
+def test_runner_selects_a_backend_for_a_qft_circuit():
+    backends = [FakeSherbrooke(), FakeTorino()]
+    runner = IBMQuantumRunner(provider=LocalRuntimeProvider(backends))
+    runner.scheduler = QueueAwareScheduler(FakeMetadata(backends, {'fake_sherbrooke': 3, 'fake_torino': 1}))
+    assert runner.select_least_busy_backend(qft_circuit(6)) == 'fake_torino'
+    assert runner.backend.name == 'fake_torino'
@@ -0,0 +1,100 @@
+"""Tests of the bit-packed shot arrays and sparse counts against plain bitstring dictionaries."""
+
+from collections import Counter
+import numpy as np
+import pytest
+from qiskit.primitives.containers import BitArray
+from quantum_studies.shot_data import (
+    ShotArray, SparseCounts, as_sparse_counts, format_bitstrings, pack_bits, pack_bitstrings, unpack_bits
+)
+
+
+def random_memory(num_shots: int, num_bits: int, seed: int, distinct: int = 12) -> list:
+    rng = np.random.default_rng(seed)
+    pool = [''.join(rng.choice(['0', '1'], size=num_bits)) for _ in range(distinct)]
+    return [pool[index] for index in rng.integers(distinct, size=num_shots)]
+
+
+def marginal_key(key: str, indices) -> str:
+    """Dict-based marginal: bit j of the result is bit indices[j] of the key."""
+    return ''.join(key[::-1][index] for index in reversed(indices))
+
+
+@pytest.mark.parametrize('num_bits', [1, 7, 63, 64, 65, 130])
+def test_packing_round_trips(num_bits):
+    rng = np.random.default_rng(num_bits)
+    bits = rng.random((50, num_bits)) < 0.5
+    words = pack_bits(bits)
+    assert words.shape == (50, -(-num_bits // 64))
+    np.testing.assert_array_equal(unpack_bits(words, num_bits), bits)
+
+    strings = [''.join('1' if bit else '0' for bit in row[::-1]) for row in bits]
+    np.testing.assert_array_equal(pack_bitstrings(strings), words)
+    assert format_bitstrings(words, num_bits).tolist() == strings
+
+
+@pytest.mark.parametrize('num_bits', [5, 64, 130])
+def test_shot_array_counts_match_counter(num_bits):
+    memory = random_memory(500, num_bits, seed=num_bits)
+    shots = ShotArray.from_memory(memory)
+    assert shots.num_bits == num_bits and len(shots) == 500
+    assert shots.to_memory() == memory
+    assert shots.get_counts() == dict(Counter(memory))
+    np.testing.assert_array_equal(ShotArray.from_bool(shots.to_bool()).words, shots.words)
+
+
+def test_register_separators_and_short_keys():
+    shots = ShotArray.from_memory(['01 110', '11 000'])
+    assert shots.num_bits == 5 and shots.to_memory() == ['01110', '11000']
+    counts = SparseCounts.from_dict({'1': 3, '0101': 2, '00001': 4}, num_bits=5)
+    assert counts.to_dict() == {'00001': 7, '00101': 2}
+    assert counts.shots == 9
+
+
+@pytest.mark.parametrize('num_bits', [6, 130])
+def test_sparse_counts_round_trip_and_marginals(num_bits):
+    counts = dict(Counter(random_memory(2000, num_bits, seed=1)))
+    sparse = SparseCounts.from_dict(counts)
+    assert sparse.to_dict() == counts
+    assert as_sparse_counts(counts).to_dict() == counts
+
+    rng = np.random.default_rng(2)
+    for _ in range(5):
+        indices = [int(index) for index in rng.choice(num_bits, size=4, replace=False)]
+        expected = Counter()
+        for key, value in counts.items():
+            expected[marginal_key(key, indices)] += value
+        assert sparse.marginal(indices).to_dict() == dict(expected)
+
+    memory = random_memory(300, num_bits, seed=3)
+    indices = [0, num_bits - 1, num_bits // 2]
+    assert ShotArray.from_memory(memory).marginal(indices).to_memory() == [marginal_key(key, indices) for key in memory]
+
+
+def test_post_selection_matches_dict_filtering():
+    counts = dict(Counter(random_memory(1000, 70, seed=4)))
+    conditions = {0: 1, 65: 0}
+    expected = {
+        key: value for key, value in counts.items()
+        if all(key[::-1][bit] == str(wanted) for bit, wanted in conditions.items())
+    }
+    assert SparseCounts.from_dict(counts).select(conditions).to_dict() == expected
+
+
+def test_ints_only_for_narrow_registers():
+    narrow = SparseCounts.from_dict({'101': 2, '011': 1})
+    assert sorted(narrow.to_ints().tolist()) == [3, 5]
+    with pytest.raises(ValueError, match="uint64"):
+        SparseCounts.from_dict({'1' * 65: 1}).to_ints()
+
+
+@pytest.mark.parametrize('shape', [(200,), (2, 3, 40)])
+@pytest.mark.parametrize('num_bits', [3, 8, 70, 130])
+def test_from_bit_array_matches_bit_array_counts(shape, num_bits):
+    rng = np.random.default_rng(num_bits)
+    bits = rng.random(shape + (num_bits,)) < 0.3
+    bit_array = BitArray.from_bool_array(bits, order='little')
+    shots = ShotArray.from_bit_array(bit_array)
+    assert shots.num_bits == num_bits and len(shots) == int(np.prod(shape))
+    assert shots.get_counts() == bit_array.get_counts()
+    np.testing.assert_array_equal(shots.to_bool(), bits.reshape(-1, num_bits))
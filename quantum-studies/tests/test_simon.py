@@ -0,0 +1,184 @@
+"""Tests of the GF(2) post-processing of Simon's algorithm."""
+
+from itertools import product
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Statevector
+from quantum_studies.simon import (
+    GF2System, SimonOracleFunction, create_simon_oracle, gf2_dot, gf2_nullspace, int_to_bitstring,
+    sample_until_determined, simon_algorithm, solve_linear_system_gf2
+)
+from quantum_studies.stabilizer import run_circuit
+
+
+def brute_force_solutions(equations, n: int):
+    return [s for s in range(1, 1 << n) if all(gf2_dot(y, s) == 0 for y in equations)]
+
+
+def pack_row(row: np.ndarray) -> int:
+    return sum(1 << bit for bit in np.flatnonzero(row))
+
+
+def orthogonal_samples(secret: int, n: int, count: int, rng: np.random.Generator):
+    """Uniform strings y with y·s = 0, like the outcomes of Simon's circuit."""
+    samples = []
+    while len(samples) < count:
+        y = int(rng.integers(1 << n))
+        if gf2_dot(y, secret) == 0:
+            samples.append(y)
+    return samples
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_solutions_match_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 9))
+    equations = [int(y) for y in rng.integers(0, 1 << n, size=int(rng.integers(0, n + 2)))]
+    system = GF2System(n)
+    system.extend(equations)
+
+    expected = brute_force_solutions(equations, n)
+    assert system.solutions() == expected
+    # 2^(n - rank) solutions including zero
+    assert len(expected) + 1 == 1 << (n - system.rank)
+    assert len(system.nullspace()) == n - system.rank
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_rows_stay_in_reduced_row_echelon_form(seed):
+    rng = np.random.default_rng(seed)
+    n = 12
+    system = GF2System(n)
+    for y in rng.integers(0, 1 << n, size=8):
+        system.add(int(y))
+        for pivot, row in system._rows.items():
+            assert row.bit_length() - 1 == pivot
+            assert all(other >> pivot & 1 == 0 for p, other in system._rows.items() if p != pivot)
+
+
+def test_redundant_equations_do_not_raise_the_rank():
+    system = GF2System(4)
+    assert system.add('0110') and system.add(0b0011)
+    assert not system.add('0101')  # sum of the first two
+    assert not system.add('0000')
+    assert not system.add('0110')
+    assert system.extend(['1000', '0101', '1110']) == 1
+    assert system.rank == 3 and system.is_determined()
+
+
+def test_dense_nullspace_matches_the_online_system():
+    rng = np.random.default_rng(7)
+    n = 10
+    rows = rng.random((6, n)) < 0.5
+    basis = gf2_nullspace(rows)
+    assert not ((rows.astype(int) @ basis.T.astype(int)) % 2).any()
+
+    system = GF2System(n)
+    system.extend(pack_row(row) for row in rows)
+    assert len(basis) == n - system.rank
+    # Both bases span the same space
+    spanned = GF2System(n)
+    assert spanned.extend(pack_row(row) for row in basis) == len(basis)
+    assert spanned.extend(system.nullspace()) == 0
+
+
+@pytest.mark.parametrize('n', [1, 2, 5, 16, 40])
+def test_secret_is_recovered(n):
+    rng = np.random.default_rng(n)
+    secret = int(rng.integers(1, 1 << n))
+    system = sample_until_determined(
+        lambda shots: [int_to_bitstring(y, n) for y in orthogonal_samples(secret, n, shots, rng)], n
+    )
+    assert system.is_determined()
+    assert system.secret() == int_to_bitstring(secret, n)
+
+
+def test_rank_deficient_samples_leave_every_consistent_candidate():
+    n, secret = 6, 0b101100
+    rng = np.random.default_rng(3)
+    system = GF2System(n)
+    for y in orthogonal_samples(secret, n, 50, rng):
+        if system.rank == n - 3:
+            break
+        system.add(y)
+    assert not system.is_determined()
+    assert system.secret() is None
+    candidates = system.solutions()
+    assert secret in candidates and len(candidates) == 7
+    assert system.solutions(max_solutions=3) == sorted(system.solutions(max_solutions=3))
+    assert len(system.solutions(max_solutions=3)) == 3
+    assert sorted(solve_linear_system_gf2([int_to_bitstring(y, n) for y in system._rows.values()])) == [
+        int_to_bitstring(s, n) for s in candidates
+    ]
+
+
+def test_all_zero_secret_leaves_no_non_zero_candidate():
+    n = 5
+    # With s = 0 every string is orthogonal, so the outcomes eventually reach full rank
+    equations = [int_to_bitstring(y, n) for y in orthogonal_samples(0, n, 40, np.random.default_rng(0))]
+    system = GF2System(n)
+    system.extend(equations)
+    assert system.rank == n
+    assert system.nullspace() == [] and system.solutions() == []
+    assert system.secret() is None
+    assert solve_linear_system_gf2(equations) == []
+    assert solve_linear_system_gf2([]) == []
+
+
+def test_solver_matches_the_notebook_brute_force():
+    equations = ['011', '110']
+    expected = [
+        ''.join(bits) for bits in product('01', repeat=3)
+        if '1' in bits and all(sum(int(a) * int(b) for a, b in zip(y, bits)) % 2 == 0 for y in equations)
+    ]
+    assert solve_linear_system_gf2(equations) == expected == ['111']
+
+
+def all_inputs(n: int) -> np.ndarray:
+    return (np.arange(2 ** n)[:, None] >> np.arange(n)) & 1 == 1
+
+
+@pytest.mark.parametrize('secret', ['0000', '0001', '1000', '1011', '1111'])
+@pytest.mark.parametrize('seed', [None, 5])
+def test_oracle_keeps_simons_promise(secret, seed):
+    n = len(secret)
+    function = SimonOracleFunction(create_simon_oracle(secret, seed=seed), n)
+    x = all_inputs(n)
+    s = np.array([bit == '1' for bit in reversed(secret)])
+    fx = function.evaluate(x)
+    np.testing.assert_array_equal(fx, function.evaluate(x ^ s))
+    # Two-to-one for a non-zero secret, one-to-one otherwise
+    distinct = len({row.tobytes() for row in fx})
+    assert distinct == (2 ** n if '1' not in secret else 2 ** (n - 1))
+    assert function.verify(secret, seed=0)
+    if '1' in secret:
+        assert not function.verify('0110' if secret != '0110' else '0011', seed=0)
+
+
+def test_oracle_function_matches_statevector():
+    secret, n = '101', 3
+    oracle = create_simon_oracle(secret, seed=2)
+    outputs = SimonOracleFunction(oracle, n).evaluate(all_inputs(n))
+    for x, fx in enumerate(outputs):
+        image = int(np.argmax(Statevector.from_int(x, 2 ** (2 * n)).evolve(oracle).probabilities()))
+        assert image & (2 ** n - 1) == x
+        assert image >> n == sum(int(bit) << index for index, bit in enumerate(fx))
+
+
+def test_simon_circuit_outcomes_recover_the_secret():
+    secret, n = '11010', 5
+    circuit = simon_algorithm(create_simon_oracle(secret, seed=1), n)
+    outcomes = run_circuit(circuit, shots=200, seed=4).get_counts()
+    assert all(gf2_dot(int(y, 2), int(secret, 2)) == 0 for y in outcomes)
+    assert solve_linear_system_gf2(list(outcomes)) == [secret]
+
+    sampled = SimonOracleFunction(create_simon_oracle(secret, seed=1), n).sample_outcomes(200, seed=4)
+    assert all(gf2_dot(int(y, 2), int(secret, 2)) == 0 for y in sampled.get_counts())
+
+
+def test_exact_sampling_needs_an_affine_oracle():
+    oracle = QuantumCircuit(4)
+    oracle.ccx(0, 1, 2)
+    with pytest.raises(ValueError, match="affine"):
+        SimonOracleFunction(oracle, 2).sample_outcomes(10)
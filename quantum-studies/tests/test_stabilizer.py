@@ -0,0 +1,146 @@
+"""Tests of the stabilizer simulator against Statevector and Aer."""
+
+import numpy as np
+import pytest
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister, transpile
+from qiskit.circuit import Parameter
+from qiskit.quantum_info import Pauli, Statevector
+from qiskit_aer import AerSimulator
+from quantum_studies.stabilizer import (
+    NonCliffordCircuitError, StabilizerSimulator, is_clifford, run_circuit
+)
+
+SINGLE_QUBIT_GATES = ['h', 's', 'sdg', 'sx', 'sxdg', 'x', 'y', 'z', 'id']
+TWO_QUBIT_GATES = ['cx', 'cz', 'cy', 'swap']
+
+
+def random_clifford(num_qubits: int, depth: int, rng: np.random.Generator) -> QuantumCircuit:
+    circuit = QuantumCircuit(num_qubits)
+    for _ in range(depth):
+        for qubit in range(num_qubits):
+            choice = rng.integers(len(SINGLE_QUBIT_GATES) + 1)
+            if choice == len(SINGLE_QUBIT_GATES):
+                circuit.rz(int(rng.integers(-4, 5)) * np.pi / 2, qubit)
+            else:
+                getattr(circuit, SINGLE_QUBIT_GATES[choice])(qubit)
+        a, b = rng.choice(num_qubits, size=2, replace=False)
+        getattr(circuit, TWO_QUBIT_GATES[rng.integers(len(TWO_QUBIT_GATES))])(int(a), int(b))
+    return circuit
+
+
+def random_dynamic_clifford(rng: np.random.Generator) -> QuantumCircuit:
+    """Three qubits with mid-circuit measurement, reset and bit- and register-conditioned Paulis."""
+    qubits, first, second = QuantumRegister(3), ClassicalRegister(2, 'm'), ClassicalRegister(3, 'out')
+    circuit = QuantumCircuit(qubits, first, second)
+    circuit.compose(random_clifford(3, 3, rng), inplace=True)
+    circuit.measure(0, first[0])
+    circuit.measure(1, first[1])
+    with circuit.if_test((first[0], 1)):
+        circuit.x(2)
+    circuit.reset(1)
+    circuit.compose(random_clifford(3, 2, rng), inplace=True)
+    with circuit.if_test((first, int(rng.integers(4)))) as otherwise:
+        circuit.z(0)
+        circuit.x(1)
+    with otherwise:
+        circuit.y(2)
+    circuit.compose(random_clifford(3, 2, rng), inplace=True)
+    circuit.measure(qubits, second)
+    return circuit
+
+
+def total_variation(first: dict, second: dict) -> float:
+    shots = sum(first.values()), sum(second.values())
+    keys = set(first) | set(second)
+    return 0.5 * sum(abs(first.get(k, 0) / shots[0] - second.get(k, 0) / shots[1]) for k in keys)
+
+
+def aer_counts(circuit: QuantumCircuit, shots: int, seed: int) -> dict:
+    simulator = AerSimulator(method='statevector', seed_simulator=seed)
+    counts = simulator.run(transpile(circuit, simulator), shots=shots).result().get_counts()
+    # Aer separates registers with spaces; the ShotArray keys are one bitstring
+    return {key.replace(' ', ''): value for key, value in counts.items()}
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_expectation_values_match_statevector(seed):
+    rng = np.random.default_rng(seed)
+    circuit = random_clifford(4, 8, rng)
+    tableau = StabilizerSimulator(circuit).final_tableau()
+    state = Statevector(circuit)
+    for _ in range(20):
+        label = ''.join(rng.choice(list('IXYZ'), size=4))
+        expected = state.expectation_value(Pauli(label)).real
+        assert tableau.expectation_value(label) == pytest.approx(expected, abs=1e-9), label
+
+
+def test_expectation_values_across_word_boundaries():
+    num_qubits = 70
+    circuit = QuantumCircuit(num_qubits)
+    circuit.h(0)
+    for qubit in range(1, num_qubits):
+        circuit.cx(qubit - 1, qubit)
+    circuit.s(65)
+    tableau = StabilizerSimulator(circuit).final_tableau()
+
+    def label(letters: dict) -> str:
+        return ''.join(letters.get(qubit, 'I') for qubit in reversed(range(num_qubits)))
+
+    assert tableau.expectation_value(label({0: 'Z', 69: 'Z'})) == 1
+    assert tableau.expectation_value(label({q: 'X' for q in range(num_qubits) if q != 65} | {65: 'Y'})) == 1
+    assert tableau.expectation_value(label({q: 'X' for q in range(num_qubits)})) == 0
+    assert tableau.expectation_value(label({63: 'Z'})) == 0
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_dynamic_circuit_distributions_match_aer(seed):
+    circuit = random_dynamic_clifford(np.random.default_rng(seed))
+    assert is_clifford(circuit)
+    shots = 8000
+    counts = run_circuit(circuit, shots=shots, seed=seed).get_counts()
+    assert sum(counts.values()) == shots
+    assert total_variation(counts, aer_counts(circuit, shots, seed)) < 0.05
+
+
+def test_large_ghz_samples_are_correlated():
+    num_qubits = 200
+    circuit = QuantumCircuit(num_qubits, num_qubits)
+    circuit.h(0)
+    for qubit in range(1, num_qubits):
+        circuit.cx(qubit - 1, qubit)
+    circuit.measure(range(num_qubits), range(num_qubits))
+    bits = run_circuit(circuit, shots=1000, seed=1).to_bool()
+    assert (bits == bits[:, :1]).all()
+    assert 400 < bits[:, 0].sum() < 600
+
+
+def test_non_clifford_circuits_fall_back_to_statevector():
+    circuit = QuantumCircuit(2, 2)
+    circuit.h(0)
+    circuit.t(0)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.rz(0.3, 1)
+    circuit.measure([0, 1], [0, 1])
+    assert not is_clifford(circuit)
+    with pytest.raises(NonCliffordCircuitError):
+        run_circuit(circuit, method='stabilizer')
+    with pytest.raises(ValueError, match="Unknown simulation method"):
+        run_circuit(circuit, method='tableau')
+
+    shots = 8000
+    counts = run_circuit(circuit, shots=shots, seed=3).get_counts()
+    probabilities = Statevector(circuit.remove_final_measurements(inplace=False)).probabilities_dict()
+    assert set(counts) <= {'00', '11'}
+    assert counts.get('11', 0) / shots == pytest.approx(probabilities['11'], abs=0.02)
+
+
+def test_unbound_and_non_clifford_rotations_are_rejected():
+    unbound = QuantumCircuit(1)
+    unbound.rz(Parameter('theta'), 0)
+    quarter = QuantumCircuit(1)
+    quarter.rz(np.pi / 4, 0)
+    assert not is_clifford(unbound)
+    assert not is_clifford(quarter)
+    with pytest.raises(NonCliffordCircuitError, match="Unbound"):
+        StabilizerSimulator(unbound)
@@ -0,0 +1,50 @@
+"""Decoding simulated memory experiments must agree with the analytic error sweep."""
+
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from quantum_studies.error_correction import NineQubitErrorCorrection, enumerate_errors, error_sweep, syndrome_circuits
+from quantum_studies.stabilizer import run_circuit
+from quantum_studies.syndrome_decoder import SyndromeDecoder
+
+
+@pytest.fixture(scope='module')
+def code():
+    return NineQubitErrorCorrection().stabilizer_code()
+
+
+def simulated_failures(decoder, encoder, error_x, error_z, logical):
+    circuits = syndrome_circuits(encoder, decoder.code, error_x, error_z, readout_basis=decoder.readout_basis(logical))
+    return np.array([
+        decoder.logical_failures(run_circuit(circuit, shots=16, seed=index), logical=logical)['logical_failures']
+        for index, circuit in enumerate(circuits)
+    ])
+
+
+def test_readout_basis_follows_the_prepared_logical(code):
+    decoder = SyndromeDecoder(code)
+    # Shor code: logical Z is X0 X1 X2, logical X is Z0 Z3 Z6
+    assert decoder.readout_basis('Z') == 'X'
+    assert decoder.readout_basis('X') == 'Z'
+    with pytest.raises(ValueError, match="cannot be read out in the Z basis"):
+        decoder.logical_failures(['0' * 16], basis='Z')
+
+
+@pytest.mark.parametrize('logical, column', [('Z', 0), ('X', 1)])
+def test_memory_experiment_matches_error_sweep(code, logical, column):
+    encoder = NineQubitErrorCorrection().create_circuit()
+    if logical == 'X':
+        # |+>_L: rotate the unencoded qubit before encoding
+        prepared = QuantumCircuit(encoder.num_qubits)
+        prepared.h(0)
+        encoder = prepared.compose(encoder)
+    decoder = SyndromeDecoder(code, max_weight=1)
+    error_x, error_z = enumerate_errors(code.num_qubits, 2)
+
+    failures = simulated_failures(decoder, encoder, error_x, error_z, logical)
+    expected = error_sweep(code, 2, table_weight=1).logical_flips[:, column]
+
+    single = error_x.sum(axis=1) + error_z.sum(axis=1) - (error_x & error_z).sum(axis=1) <= 1
+    assert not failures[single].any()
+    assert np.array_equal(failures > 0, expected)
+    assert set(failures) <= {0, 16}
@@ -0,0 +1,97 @@
+"""Tests of circuit fingerprints and the transpilation cache."""
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import PauliEvolutionGate, UnitaryGate
+from qiskit.quantum_info import Operator, SparsePauliOp
+from qiskit_ibm_runtime.fake_provider import FakeLimaV2
+from quantum_studies.transpile_cache import TranspileCache, circuit_fingerprint
+
+
+def oracle(flip: int, as_gate: bool) -> QuantumCircuit:
+    body = QuantumCircuit(2, name='oracle')
+    body.x(flip)
+    circuit = QuantumCircuit(2)
+    circuit.append(body.to_gate() if as_gate else body.to_instruction(), [0, 1])
+    return circuit
+
+
+def evolution(label: str) -> QuantumCircuit:
+    circuit = QuantumCircuit(2)
+    circuit.append(PauliEvolutionGate(SparsePauliOp(label), 0.3), [0, 1])
+    return circuit
+
+
+def test_same_named_custom_gates_get_different_fingerprints():
+    assert circuit_fingerprint(oracle(0, True)) != circuit_fingerprint(oracle(1, True))
+    assert circuit_fingerprint(oracle(0, False)) != circuit_fingerprint(oracle(1, False))
+    assert circuit_fingerprint(oracle(0, True)) == circuit_fingerprint(oracle(0, True))
+
+
+def test_pauli_evolutions_of_different_operators_get_different_fingerprints():
+    assert circuit_fingerprint(evolution('XX')) != circuit_fingerprint(evolution('ZZ'))
+    assert circuit_fingerprint(evolution('XX')) == circuit_fingerprint(evolution('XX'))
+
+
+def test_rebuilt_parameterized_circuits_share_a_fingerprint():
+    def build() -> QuantumCircuit:
+        circuit = QuantumCircuit(1)
+        circuit.rx(Parameter('theta'), 0)
+        return circuit
+
+    assert circuit_fingerprint(build()) == circuit_fingerprint(build())
+
+
+def test_unitary_gates_are_hashed_by_matrix():
+    first, second = QuantumCircuit(1), QuantumCircuit(1)
+    first.append(UnitaryGate(Operator.from_label('X')), [0])
+    second.append(UnitaryGate(Operator.from_label('Z')), [0])
+    assert circuit_fingerprint(first) != circuit_fingerprint(second)
+
+
+def test_cache_does_not_return_another_circuits_transpilation():
+    backend = FakeLimaV2()
+    cache = TranspileCache()
+    for build in (lambda: evolution('XX'), lambda: evolution('ZZ'), lambda: oracle(0, True), lambda: oracle(1, True)):
+        cache.transpile([build()], backend)
+    assert cache.misses == 4 and cache.hits == 0
+
+    xx, zz = cache.transpile([evolution('XX'), evolution('ZZ')], backend)
+    assert cache.hits == 2
+    # Transpiled circuits span the 5 device qubits; ancillas sit above the two virtual qubits
+    ancillas = Operator.from_label('III')
+    assert Operator.from_circuit(xx).equiv(ancillas.tensor(Operator(evolution('XX'))))
+    assert Operator.from_circuit(zz).equiv(ancillas.tensor(Operator(evolution('ZZ'))))
+
+
+def test_disk_tier_round_trip(tmp_path):
+    backend = FakeLimaV2()
+    circuit = oracle(1, True)
+    circuit.measure_all()
+    TranspileCache(cache_dir=str(tmp_path)).transpile([circuit], backend)
+    fresh = TranspileCache(cache_dir=str(tmp_path))
+    fresh.transpile([circuit], backend)
+    assert fresh.hits == 1 and fresh.misses == 0
+
+
+def test_cache_hits_bind_with_the_callers_parameters(tmp_path):
+    def build() -> QuantumCircuit:
+        circuit = QuantumCircuit(2)
+        circuit.rx(Parameter('t'), 0)
+        circuit.cx(0, 1)
+        circuit.measure_all()
+        return circuit
+
+    backend = FakeLimaV2()
+    cache = TranspileCache(cache_dir=str(tmp_path))
+    first = cache.transpile([build()], backend)[0]
+    # Same-batch duplicates, memory hits and disk hits all come back with the caller's objects
+    rebuilt = [build(), build()]
+    for circuit, out in zip(rebuilt, cache.transpile(rebuilt, backend)):
+        assert out.parameters[0] == circuit.parameters[0]
+        out.assign_parameters({circuit.parameters[0]: 0.3})
+    circuit = build()
+    out = TranspileCache(cache_dir=str(tmp_path)).transpile([circuit], backend)[0]
+    bound = out.assign_parameters({circuit.parameters[0]: 0.3})
+    assert len(bound.parameters) == 0
+    assert first.parameters[0] != circuit.parameters[0]
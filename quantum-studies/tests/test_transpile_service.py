@@ -0,0 +1,76 @@
+"""The parallel transpilation service, on fake backends."""
+
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit.library import quantum_volume
+from qiskit_ibm_runtime.fake_provider import FakeGuadalupeV2, FakeLimaV2, FakeManilaV2
+from quantum_studies.transpile_cache import TranspileCache
+from quantum_studies.transpile_service import TranspileService, best_targets
+
+
+def ghz(num_qubits: int) -> QuantumCircuit:
+    circuit = QuantumCircuit(num_qubits)
+    circuit.h(0)
+    for qubit in range(1, num_qubits):
+        circuit.cx(qubit - 1, qubit)
+    circuit.measure_all()
+    return circuit
+
+
+@pytest.fixture(scope='module')
+def service():
+    # One spawned worker keeps the test cheap; the pool is shared by every test here
+    with TranspileService([FakeManilaV2(), FakeLimaV2(), FakeGuadalupeV2()], max_workers=1) as service:
+        yield service
+
+
+@pytest.fixture
+def cached_service(service):
+    service.transpile_cache = TranspileCache()
+    try:
+        yield service
+    finally:
+        service.transpile_cache = None
+
+
+def test_matrix_covers_every_task_and_fills_the_cache(cached_service):
+    service = cached_service
+    circuits = [ghz(3), quantum_volume(4, seed=1).decompose()]
+    matrix = service.matrix(circuits, optimization_levels=(1, 3))
+    assert len(matrix) == 2 * 3 * 2
+    assert all(result.ok and not result.cached and result.seconds > 0 for result in matrix.values())
+    assert matrix[(0, 'fake_lima', 1)].circuit.num_qubits == 5
+
+    again = service.matrix(circuits, optimization_levels=(1, 3))
+    assert all(result.cached for result in again.values())
+    assert set(best_targets(matrix)) == {'fake_manila', 'fake_lima', 'fake_guadalupe'}
+
+
+def test_failures_are_reported_per_task(service):
+    results = list(service.stream([ghz(8)], targets=['fake_lima', 'fake_guadalupe']))
+    by_target = {result.target: result for result in results}
+    assert not by_target['fake_lima'].ok and 'CircuitTooWide' in by_target['fake_lima'].error
+    assert by_target['fake_guadalupe'].ok
+    assert best_targets({(0, r.target, 1): r for r in results})[-1] == 'fake_lima'
+
+
+def test_abandoned_streams_cancel_queued_tasks(service, monkeypatch):
+    submitted = []
+    executor = service._executor
+
+    class RecordingExecutor:
+        def submit(self, *args):
+            future = executor().submit(*args)
+            submitted.append(future)
+            return future
+
+    monkeypatch.setattr(service, '_executor', RecordingExecutor)
+    stream = service.stream([quantum_volume(5, seed=2).decompose()], ['fake_guadalupe'], (3,), seeds=range(12))
+    first = next(stream)
+    stream.close()
+    assert first.ok and len(submitted) == 12
+    # At most the running task and the one queued behind it in the worker's call queue survive
+    assert sum(future.cancelled() for future in submitted) >= len(submitted) - 3
+
+    monkeypatch.undo()
+    assert all(result.ok for result in service.stream([ghz(3)], ['fake_lima']))